@@ -0,0 +1,15 @@
+-- Índices para el listado público de torneos (GET /tournaments)
+-- Paginación keyset sobre (created_at, id) y filtros por status / is_active / start_at.
+
+CREATE INDEX IF NOT EXISTS idx_tournaments_created_id
+    ON tournaments (created_at DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_tournaments_status_created_id
+    ON tournaments (status, created_at DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_tournaments_active_created_id
+    ON tournaments (created_at DESC, id DESC)
+    WHERE is_active = true;
+
+CREATE INDEX IF NOT EXISTS idx_tournaments_start_at
+    ON tournaments (start_at);
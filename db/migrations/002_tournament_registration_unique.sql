@@ -0,0 +1,13 @@
+-- Registro de equipos en torneos (POST /tournaments/{id}/register)
+-- El INSERT ... ON CONFLICT del registro se apoya en estas restricciones en lugar del pre-check.
+-- Nota: fallará si ya existen duplicados; hay que limpiarlos antes de aplicar.
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_tournaments_participants_tournament_team
+    ON tournaments_participants (tournament_id, team_id);
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_tournaments_participants_members_participant_user
+    ON tournaments_participants_members (participant_id, user_id);
+
+-- Lookups de pertenencia usados por el registro
+CREATE INDEX IF NOT EXISTS idx_team_members_team_user
+    ON team_members (team_id, user_id);
@@ -0,0 +1,14 @@
+-- Búsqueda de jugadores del coach (GET /coach/{coach_id}/users?q=...)
+-- ILIKE '%texto%' sobre nickname y email, resuelto con índices trigram.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_player_profiles_nickname_trgm
+    ON player_profiles USING gin (nickname gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_users_email_trgm
+    ON users USING gin (email gin_trgm_ops);
+
+-- Agregado de cuentas de juego por usuario
+CREATE INDEX IF NOT EXISTS idx_user_game_accounts_user
+    ON user_game_accounts (user_id);
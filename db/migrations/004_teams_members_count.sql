@@ -0,0 +1,29 @@
+-- players_count precalculado en teams.
+-- Lo mantiene un trigger sobre team_members, así cubre todas las rutas de escritura
+-- (admin add/remove member, coach add player, upserts de teams_repo).
+
+ALTER TABLE teams ADD COLUMN IF NOT EXISTS members_count integer NOT NULL DEFAULT 0;
+
+UPDATE teams t
+SET members_count = c.cnt
+FROM (SELECT team_id, COUNT(*) AS cnt FROM team_members GROUP BY team_id) c
+WHERE c.team_id = t.id;
+
+CREATE OR REPLACE FUNCTION team_members_count_trg() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE teams SET members_count = members_count + 1 WHERE id = NEW.team_id;
+    ELSIF TG_OP = 'DELETE' THEN
+        UPDATE teams SET members_count = members_count - 1 WHERE id = OLD.team_id;
+    ELSIF TG_OP = 'UPDATE' AND NEW.team_id IS DISTINCT FROM OLD.team_id THEN
+        UPDATE teams SET members_count = members_count - 1 WHERE id = OLD.team_id;
+        UPDATE teams SET members_count = members_count + 1 WHERE id = NEW.team_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_team_members_count ON team_members;
+CREATE TRIGGER trg_team_members_count
+    AFTER INSERT OR DELETE OR UPDATE OF team_id ON team_members
+    FOR EACH ROW EXECUTE FUNCTION team_members_count_trg();
@@ -0,0 +1,14 @@
+-- Índices para la rotación atómica de refresh tokens y el sweeper de fondo.
+
+-- logout-all: UPDATE ... WHERE user_id = $1 AND revoked = false
+CREATE INDEX IF NOT EXISTS idx_refresh_tokens_user_active
+    ON refresh_tokens (user_id)
+    WHERE revoked = false;
+
+-- Sweeper: DELETE por lotes de caducados (expires_at < now()) y revocados
+CREATE INDEX IF NOT EXISTS idx_refresh_tokens_expires_at
+    ON refresh_tokens (expires_at);
+
+CREATE INDEX IF NOT EXISTS idx_refresh_tokens_revoked
+    ON refresh_tokens (revoked_at)
+    WHERE revoked = true;
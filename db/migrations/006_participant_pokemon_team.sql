@@ -0,0 +1,9 @@
+-- Roster Pokémon con el que compite cada participante; lo valida el motor de legalidad
+-- (POST /admin/tournaments/{id}/legality).
+
+ALTER TABLE tournaments_participants
+    ADD COLUMN IF NOT EXISTS pokemon_team_id uuid REFERENCES pokemon_teams(id) ON DELETE SET NULL;
+
+-- Revalidación de un torneo: todos los miembros de los rosters registrados en un solo join
+CREATE INDEX IF NOT EXISTS idx_pokemon_team_members_team_position
+    ON pokemon_team_members (pokemon_team_id, position);
@@ -0,0 +1,35 @@
+-- Rondas y emparejamientos (sistema suizo) sobre tournaments_participants.
+-- player2_id NULL = bye (se guarda ya resuelto: result = 'bye').
+
+CREATE TABLE IF NOT EXISTS tournament_rounds (
+    id            uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+    tournament_id uuid NOT NULL REFERENCES tournaments(id) ON DELETE CASCADE,
+    round_number  integer NOT NULL,
+    status        text NOT NULL DEFAULT 'in_progress',   -- in_progress | completed
+    created_at    timestamptz NOT NULL DEFAULT now(),
+    completed_at  timestamptz,
+    UNIQUE (tournament_id, round_number)
+);
+
+CREATE TABLE IF NOT EXISTS tournament_matches (
+    id            uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+    tournament_id uuid NOT NULL REFERENCES tournaments(id) ON DELETE CASCADE,
+    round_id      uuid NOT NULL REFERENCES tournament_rounds(id) ON DELETE CASCADE,
+    table_number  integer NOT NULL,
+    player1_id    uuid NOT NULL REFERENCES tournaments_participants(id) ON DELETE CASCADE,
+    player2_id    uuid REFERENCES tournaments_participants(id) ON DELETE CASCADE,
+    result        text,                                  -- p1 | p2 | draw | bye; NULL = pendiente
+    p1_wins       integer NOT NULL DEFAULT 0,
+    p2_wins       integer NOT NULL DEFAULT 0,
+    draws         integer NOT NULL DEFAULT 0,
+    reported_at   timestamptz,
+    created_at    timestamptz NOT NULL DEFAULT now(),
+    UNIQUE (round_id, table_number)
+);
+
+CREATE INDEX IF NOT EXISTS idx_tournament_matches_tournament ON tournament_matches (tournament_id);
+
+-- "¿Quedan partidas pendientes en la ronda?" al reportar resultados
+CREATE INDEX IF NOT EXISTS idx_tournament_matches_pending
+    ON tournament_matches (round_id)
+    WHERE result IS NULL;
@@ -0,0 +1,18 @@
+-- Cuadros de eliminación (simple / doble) guardados como arrays compactos: una fila por torneo.
+-- Índices de partida y formato de los arrays: ver application/services/bracket.py.
+-- entrants[k + 1] = participante con seed k; slot_a/slot_b/winner guardan k, -1 (TBD) o -2 (BYE).
+
+CREATE TABLE IF NOT EXISTS tournament_brackets (
+    tournament_id uuid PRIMARY KEY REFERENCES tournaments(id) ON DELETE CASCADE,
+    kind          text NOT NULL CHECK (kind IN ('single_elimination', 'double_elimination')),
+    size          integer NOT NULL,
+    entrants      uuid[] NOT NULL,
+    slot_a        integer[] NOT NULL,
+    slot_b        integer[] NOT NULL,
+    winner        integer[] NOT NULL,
+    score_a       integer[] NOT NULL,
+    score_b       integer[] NOT NULL,
+    version       integer NOT NULL DEFAULT 1,
+    created_at    timestamptz NOT NULL DEFAULT now(),
+    updated_at    timestamptz NOT NULL DEFAULT now()
+);
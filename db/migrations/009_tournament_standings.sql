@@ -0,0 +1,29 @@
+-- Agregados por participante para la clasificación incremental (ver application/services/standings.py).
+-- opp_points = Buchholz; opp_mwp_sum / opp_count = OMW%.
+
+CREATE TABLE IF NOT EXISTS tournament_standings (
+    tournament_id  uuid NOT NULL REFERENCES tournaments(id) ON DELETE CASCADE,
+    participant_id uuid NOT NULL REFERENCES tournaments_participants(id) ON DELETE CASCADE,
+    points         integer NOT NULL DEFAULT 0,
+    matches_played integer NOT NULL DEFAULT 0,
+    match_wins     integer NOT NULL DEFAULT 0,
+    match_losses   integer NOT NULL DEFAULT 0,
+    match_draws    integer NOT NULL DEFAULT 0,
+    byes           integer NOT NULL DEFAULT 0,
+    game_wins      integer NOT NULL DEFAULT 0,
+    game_losses    integer NOT NULL DEFAULT 0,
+    game_draws     integer NOT NULL DEFAULT 0,
+    opp_points     integer NOT NULL DEFAULT 0,
+    opp_mwp_sum    double precision NOT NULL DEFAULT 0,
+    opp_count      integer NOT NULL DEFAULT 0,
+    opponents      uuid[] NOT NULL DEFAULT '{}',
+    PRIMARY KEY (tournament_id, participant_id)
+);
+
+-- Versión de la clasificación (ETag del snapshot). La fila también serializa las actualizaciones
+-- de un mismo torneo.
+CREATE TABLE IF NOT EXISTS tournament_standings_versions (
+    tournament_id uuid PRIMARY KEY REFERENCES tournaments(id) ON DELETE CASCADE,
+    version       bigint NOT NULL DEFAULT 0,
+    updated_at    timestamptz NOT NULL DEFAULT now()
+);
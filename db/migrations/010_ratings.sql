@@ -0,0 +1,30 @@
+-- Ratings (Glicko-2 / Elo) de equipos y usuarios. Se recalculan en bloque (replay) por fórmula;
+-- ver application/services/rating_engine.py.
+
+CREATE TABLE IF NOT EXISTS ratings (
+    formula      text NOT NULL,
+    subject_type text NOT NULL CHECK (subject_type IN ('team', 'user')),
+    subject_id   uuid NOT NULL,
+    rating       double precision NOT NULL,
+    rd           double precision NOT NULL,
+    volatility   double precision NOT NULL,
+    matches      integer NOT NULL DEFAULT 0,
+    updated_at   timestamptz NOT NULL DEFAULT now(),
+    PRIMARY KEY (formula, subject_type, subject_id)
+);
+
+CREATE TABLE IF NOT EXISTS rating_history (
+    formula      text NOT NULL,
+    subject_type text NOT NULL,
+    subject_id   uuid NOT NULL,
+    period_start timestamptz NOT NULL,
+    rating       double precision NOT NULL,
+    rd           double precision NOT NULL,
+    volatility   double precision NOT NULL,
+    PRIMARY KEY (formula, subject_type, subject_id, period_start)
+);
+
+-- Resultados en orden temporal para el replay
+CREATE INDEX IF NOT EXISTS idx_tournament_matches_reported
+    ON tournament_matches (reported_at)
+    WHERE result IN ('p1', 'p2', 'draw');
@@ -0,0 +1,15 @@
+-- Cola de revisión de inscripciones (GET /admin/registrations/queue)
+-- Keyset sobre (applied_at, id), más antiguas primero. Los índices parciales de 'pending' son
+-- pequeños (solo lo que queda por revisar) y cubren el caso habitual de la cola.
+
+CREATE INDEX IF NOT EXISTS idx_tp_pending_tournament_applied
+    ON tournaments_participants (tournament_id, applied_at, id)
+    WHERE status = 'pending';
+
+CREATE INDEX IF NOT EXISTS idx_tp_pending_applied
+    ON tournaments_participants (applied_at, id)
+    WHERE status = 'pending';
+
+-- Resto de estados (histórico de aprobadas / rechazadas por torneo)
+CREATE INDEX IF NOT EXISTS idx_tp_tournament_status_applied
+    ON tournaments_participants (tournament_id, status, applied_at, id);
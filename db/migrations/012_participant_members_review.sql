@@ -0,0 +1,6 @@
+-- La revisión de una inscripción se propaga a sus miembros (tournaments_participants_members)
+-- en la misma sentencia; guardamos también quién y cuándo.
+-- El UPDATE por participant_id usa uq_tournaments_participants_members_participant_user (002).
+
+ALTER TABLE tournaments_participants_members ADD COLUMN IF NOT EXISTS reviewed_at timestamptz;
+ALTER TABLE tournaments_participants_members ADD COLUMN IF NOT EXISTS reviewed_by uuid;
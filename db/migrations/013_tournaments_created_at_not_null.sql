@@ -0,0 +1,7 @@
+-- El cursor del listado público se construye con created_at: no puede ser NULL.
+
+UPDATE tournaments SET created_at = now() WHERE created_at IS NULL;
+
+ALTER TABLE tournaments
+    ALTER COLUMN created_at SET DEFAULT now(),
+    ALTER COLUMN created_at SET NOT NULL;
@@ -0,0 +1,21 @@
+-- Un solo estado de inscripción por participante: tournaments_participants.status
+-- (lo leen la cola de revisión, las rondas, los cuadros y el panel del coach).
+-- El registro público escribía registration_status: se vuelca en status y se elimina.
+-- Los miembros (tournaments_participants_members) siguen con registration_status.
+
+ALTER TABLE tournaments_participants
+    ADD COLUMN IF NOT EXISTS status text NOT NULL DEFAULT 'pending';
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'tournaments_participants' AND column_name = 'registration_status'
+    ) THEN
+        UPDATE tournaments_participants
+        SET status = registration_status
+        WHERE registration_status IS NOT NULL AND status IS DISTINCT FROM registration_status;
+
+        ALTER TABLE tournaments_participants DROP COLUMN registration_status;
+    END IF;
+END $$;
@@ -0,0 +1,17 @@
+-- Momento en que se reportó cada partida del cuadro (mismo índice que winner/score_*).
+-- NULL = no se ha jugado o se resolvió sola (BYE). Lo usan los ratings para fechar los resultados.
+-- Los cuadros existentes no tienen el dato: sus partidas ya jugadas toman updated_at del cuadro.
+
+ALTER TABLE tournament_brackets
+    ADD COLUMN IF NOT EXISTS reported_at timestamptz[];
+
+UPDATE tournament_brackets b
+SET reported_at = ARRAY(
+    SELECT CASE WHEN b.slot_a[i] >= 0 AND b.slot_b[i] >= 0 AND b.winner[i] >= 0 THEN b.updated_at END
+    FROM generate_subscripts(b.winner, 1) AS i
+    ORDER BY i
+)
+WHERE b.reported_at IS NULL;
+
+ALTER TABLE tournament_brackets
+    ALTER COLUMN reported_at SET NOT NULL;
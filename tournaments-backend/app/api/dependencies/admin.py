@@ -1,13 +1,7 @@
 from fastapi import Request, HTTPException, status
 from typing import Optional
 
-# JWT opcional (no existe en tu proyecto, así que queda en None)
-try:
-    from src.core.security import decode_jwt  # pragma: no cover
-except Exception:  # pragma: no cover
-    decode_jwt = None
-
-from infrastructure.database.connection import DatabaseConnection
+from core.auth_cache import AuthCache
 
 
 async def get_admin_user(request: Request) -> str:
@@ -15,26 +9,23 @@ async def get_admin_user(request: Request) -> str:
     Dependency que valida si el usuario es admin.
 
     Prioridad:
-    1. JWT (Bearer) con role=admin (si decode_jwt existe)
+    1. JWT (Bearer) con role=admin, o user_id presente en admin_profiles
     2. Header x-user-id contra tabla admin_profiles
-    """
 
-    pool = await DatabaseConnection.get_pool()
+    La verificación del token y la consulta a admin_profiles van cacheadas (AuthCache),
+    así que las peticiones repetidas de un mismo admin no tocan la pool.
+    """
 
     # -------------------------------------------------
-    # 1️⃣ Intentar JWT (si existe decode_jwt)
+    # 1️⃣ JWT
     # -------------------------------------------------
     auth_header: Optional[str] = request.headers.get("authorization")
 
-    if (
-        auth_header
-        and auth_header.lower().startswith("bearer ")
-        and decode_jwt is not None
-    ):
+    if auth_header and auth_header.lower().startswith("bearer "):
         token = auth_header.split(" ", 1)[1]
 
         try:
-            payload = decode_jwt(token)
+            payload = AuthCache.verify_access_token(token)
         except Exception:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -51,17 +42,12 @@ async def get_admin_user(request: Request) -> str:
             )
 
         # Si el JWT ya trae rol admin → OK
-        if "admin" in roles:
+        if payload.get("role") == "admin" or "admin" in roles:
             return user_id
 
-        # Si no, comprobamos en DB
-        async with pool.acquire() as conn:
-            row = await conn.fetchrow(
-                "SELECT user_id FROM admin_profiles WHERE user_id = $1",
-                user_id,
-            )
-            if row:
-                return user_id
+        # Si no, comprobamos en DB (cacheado)
+        if await AuthCache.is_admin(user_id):
+            return user_id
 
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -79,13 +65,7 @@ async def get_admin_user(request: Request) -> str:
             detail="Missing credentials",
         )
 
-    async with pool.acquire() as conn:
-        row = await conn.fetchrow(
-            "SELECT user_id FROM admin_profiles WHERE user_id = $1",
-            user_id,
-        )
-
-    if not row:
+    if not await AuthCache.is_admin(user_id):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="User is not admin",
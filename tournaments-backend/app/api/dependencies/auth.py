@@ -1,8 +1,7 @@
 # src/api/dependencies/auth.py
 from fastapi import Depends, HTTPException, Header
 from typing import Optional, Dict, Any
-from core.security import decode_token
-from config.settings import settings
+from core.auth_cache import AuthCache, TokenRevoked
 import jwt
 
 async def get_bearer_token(authorization: Optional[str] = Header(None)):
@@ -13,9 +12,11 @@ async def get_bearer_token(authorization: Optional[str] = Header(None)):
         raise HTTPException(status_code=401, detail="Invalid Authorization header")
     token = parts[1]
     try:
-        payload = decode_token(token)
+        payload = AuthCache.verify_access_token(token)
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Token expired")
+    except TokenRevoked:
+        raise HTTPException(status_code=401, detail="Token revoked")
     except Exception:
         raise HTTPException(status_code=401, detail="Invalid token")
     return payload
@@ -1,34 +1,140 @@
-from fastapi import Request, HTTPException, status
-from typing import Dict, Tuple
+from fastapi import Request, Response, HTTPException, status
+from typing import Callable, Optional, Tuple
+import math
 import time
 
-# Simple in-memory rate limiter: dict[ip, list[timestamps]]
-# For production, use Redis.
-_request_records: Dict[str, list] = {}
+from core.auth_cache import AuthCache
+from infrastructure.cache.ttl_lru import TTLLRUCache
+from infrastructure.external.redis_client import RedisClient
+
+# Sliding window counter: estimado = previo * peso + actual, con
+# peso = parte de la ventana anterior que aún cae dentro de la ventana deslizante.
+# Un GET/INCR por petición (O(1)), atómico en Redis y compartido por todos los workers.
+_SLIDING_WINDOW_LUA = """
+local cur = tonumber(redis.call('GET', KEYS[1]) or '0')
+local prev = tonumber(redis.call('GET', KEYS[2]) or '0')
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local weight = tonumber(ARGV[3])
+if prev * weight + cur >= limit then
+    return {0, cur, prev}
+end
+cur = redis.call('INCR', KEYS[1])
+if cur == 1 then
+    redis.call('EXPIRE', KEYS[1], window * 2)
+end
+return {1, cur, prev}
+"""
+
+# Fallback en memoria si Redis no está disponible: mismo algoritmo, acotado en número de claves
+_LOCAL_MAX_KEYS = 10000
+
+
+def client_ip_key(request: Request) -> str:
+    return request.client.host if request.client else "127.0.0.1"
+
+
+def user_or_ip_key(request: Request) -> str:
+    """Clave por usuario si trae un access token válido; si no, por IP."""
+    auth = request.headers.get("authorization")
+    if auth and auth.lower().startswith("bearer "):
+        try:
+            sub = AuthCache.verify_access_token(auth.split(" ", 1)[1]).get("sub")
+            if sub:
+                return f"user:{sub}"
+        except Exception:
+            pass
+    return f"ip:{client_ip_key(request)}"
+
 
 class RateLimiter:
-    def __init__(self, requests_limit: int = 5, window_seconds: int = 60):
+    """
+    Dependency de rate limiting por ruta (sliding window counter).
+    Usa Redis (script Lua) para que el límite sea global entre workers y cae a un
+    contador en memoria si Redis falla. Añade X-RateLimit-* y Retry-After.
+    """
+
+    _script = None
+    _script_client = None
+
+    def __init__(
+        self,
+        requests_limit: int = 5,
+        window_seconds: int = 60,
+        scope: Optional[str] = None,
+        key_func: Callable[[Request], str] = client_ip_key,
+    ):
         self.requests_limit = requests_limit
         self.window_seconds = window_seconds
+        self.scope = scope
+        self.key_func = key_func
+        self._local = TTLLRUCache(_LOCAL_MAX_KEYS, ttl=window_seconds * 2)
+
+    async def __call__(self, request: Request, response: Response):
+        route = request.scope.get("route")
+        scope = self.scope or (route.path if route is not None else request.url.path)
+        identity = self.key_func(request)
 
-    async def __call__(self, request: Request):
-        client_ip = request.client.host if request.client else "127.0.0.1"
         now = time.time()
-        
-        # Initialize if not exists
-        if client_ip not in _request_records:
-            _request_records[client_ip] = []
-            
-        # Filter old timestamps
-        window_start = now - self.window_seconds
-        _request_records[client_ip] = [t for t in _request_records[client_ip] if t > window_start]
-        
-        # Check limit
-        if len(_request_records[client_ip]) >= self.requests_limit:
+        window_idx = int(now // self.window_seconds)
+        elapsed = now - window_idx * self.window_seconds
+        weight = 1 - elapsed / self.window_seconds
+
+        base = f"rl:{scope}:{identity}"
+        try:
+            allowed, current, previous = await self._hit_redis(
+                f"{base}:{window_idx}", f"{base}:{window_idx - 1}", weight
+            )
+        except Exception:
+            allowed, current, previous = self._hit_local(base, window_idx, weight)
+
+        estimated = previous * weight + current
+        remaining = max(0, math.floor(self.requests_limit - estimated))
+        reset = math.ceil(self.window_seconds - elapsed)
+        headers = {
+            "X-RateLimit-Limit": str(self.requests_limit),
+            "X-RateLimit-Remaining": str(remaining),
+            "X-RateLimit-Reset": str(reset),
+        }
+
+        if not allowed:
+            headers["Retry-After"] = str(self._retry_after(current, previous, elapsed))
             raise HTTPException(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail="Too many requests. Please try again later."
+                detail="Too many requests. Please try again later.",
+                headers=headers,
             )
-            
-        # Add current timestamp
-        _request_records[client_ip].append(now)
+
+        response.headers.update(headers)
+
+    async def _hit_redis(self, cur_key: str, prev_key: str, weight: float) -> Tuple[bool, int, int]:
+        client = RedisClient.get_client()
+        if RateLimiter._script is None or RateLimiter._script_client is not client:
+            RateLimiter._script = client.register_script(_SLIDING_WINDOW_LUA)
+            RateLimiter._script_client = client
+        allowed, current, previous = await RateLimiter._script(
+            keys=[cur_key, prev_key],
+            args=[self.requests_limit, self.window_seconds, weight],
+        )
+        return bool(int(allowed)), int(current), int(previous)
+
+    def _hit_local(self, base: str, window_idx: int, weight: float) -> Tuple[bool, int, int]:
+        idx, current, previous = self._local.get(base, (window_idx, 0, 0))
+        if idx != window_idx:
+            # Rotamos ventanas: la actual pasa a previa solo si es la inmediatamente anterior
+            previous = current if idx == window_idx - 1 else 0
+            current = 0
+        if previous * weight + current >= self.requests_limit:
+            self._local.set(base, (window_idx, current, previous))
+            return False, current, previous
+        current += 1
+        self._local.set(base, (window_idx, current, previous))
+        return True, current, previous
+
+    def _retry_after(self, current: int, previous: int, elapsed: float) -> int:
+        # Cuando el contador actual ya agota el límite solo queda esperar a la siguiente ventana
+        if current >= self.requests_limit or previous == 0:
+            return max(1, math.ceil(self.window_seconds - elapsed))
+        # Si no, esperar a que el peso de la ventana previa baje lo suficiente
+        needed = self.window_seconds * (1 - (self.requests_limit - current) / previous)
+        return max(1, math.ceil(needed - elapsed))
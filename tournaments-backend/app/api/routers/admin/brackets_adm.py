@@ -0,0 +1,80 @@
+from typing import List
+from uuid import UUID
+from fastapi import APIRouter, Depends, HTTPException, status
+from application.schemas.admin.brackets import (
+    BracketCreateIn,
+    BracketMatchOut,
+    BracketOut,
+    BracketResultIn,
+    BracketUpdateOut,
+)
+from application.services.admin.brackets_service import (
+    create_bracket,
+    get_bracket,
+    list_bracket_matches,
+    report_bracket_result,
+    remove_bracket,
+)
+from api.dependencies.admin import get_admin_user
+
+
+router = APIRouter(prefix="/admin/tournaments", tags=["admin:brackets"])
+
+
+
+
+@router.post("/{tournament_id}/bracket", response_model=BracketOut, status_code=status.HTTP_201_CREATED)
+async def post_bracket(tournament_id: UUID, payload: BracketCreateIn, user_id: str = Depends(get_admin_user)):
+    """Genera el cuadro con los participantes aprobados (seed por rating del equipo y después orden de inscripción)."""
+    try:
+        return await create_bracket(tournament_id, payload.kind)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+
+
+@router.get("/{tournament_id}/bracket", response_model=BracketOut)
+async def get_bracket_endpoint(tournament_id: UUID, user_id: str = Depends(get_admin_user)):
+    out = await get_bracket(tournament_id)
+    if not out:
+        raise HTTPException(status_code=404, detail="Bracket not found")
+    return out
+
+
+
+
+@router.get("/{tournament_id}/bracket/matches", response_model=List[BracketMatchOut])
+async def get_bracket_matches(tournament_id: UUID, user_id: str = Depends(get_admin_user)):
+    out = await list_bracket_matches(tournament_id)
+    if out is None:
+        raise HTTPException(status_code=404, detail="Bracket not found")
+    return out
+
+
+
+
+@router.post("/{tournament_id}/bracket/matches/{match}/result", response_model=BracketUpdateOut)
+async def post_bracket_result(
+    tournament_id: UUID,
+    match: int,
+    payload: BracketResultIn,
+    user_id: str = Depends(get_admin_user),
+):
+    try:
+        out = await report_bracket_result(tournament_id, match, payload)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    if not out:
+        raise HTTPException(status_code=404, detail="Bracket not found")
+    return out
+
+
+
+
+@router.delete("/{tournament_id}/bracket", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_bracket_endpoint(tournament_id: UUID, user_id: str = Depends(get_admin_user)):
+    if not await remove_bracket(tournament_id):
+        raise HTTPException(status_code=404, detail="Bracket not found")
@@ -0,0 +1,36 @@
+from fastapi import APIRouter, Depends
+from core.security import password_hasher
+from infrastructure.database.connection import DatabaseConnection
+from infrastructure.database.pool_metrics import PoolMetrics
+from infrastructure.database.query_registry import QueryRegistry
+from api.dependencies.admin import get_admin_user
+
+
+router = APIRouter(prefix="/admin/metrics", tags=["admin:metrics"])
+
+
+
+
+@router.get("/queries")
+async def get_query_metrics(user_id: str = Depends(get_admin_user)):
+    """Sentencias registradas/preparadas y hits/misses del registro de queries (por worker)."""
+    return QueryRegistry.stats()
+
+
+
+
+@router.get("/pool")
+async def get_pool_metrics(user_id: str = Depends(get_admin_user)):
+    """
+    Estado del pool (tamaño, ociosas, en uso, esperando) e histogramas (segundos) de espera de
+    acquire, retención por ruta y duración por clase de query (por worker).
+    """
+    return PoolMetrics.snapshot(await DatabaseConnection.get_pool())
+
+
+
+
+@router.get("/password-hasher")
+async def get_password_hasher_metrics(user_id: str = Depends(get_admin_user)):
+    """Cola del pool de bcrypt: en curso, encolados, rechazados (503) y tiempo medio (por worker)."""
+    return password_hasher.stats()
@@ -9,6 +9,8 @@ from application.services.admin.players_service import list_players, get_player_
 from api.dependencies.admin import get_admin_user
 from infrastructure.repositories.dashboard_player.user_repository_impl import UserRepositoryImpl
 from application.services.auth_service import AuthService
+from core.security import PasswordHasherBusy
+from infrastructure.database.pool_metrics import DatabaseBusy
 
 router = APIRouter(prefix="/admin/players", tags=["admin:players"])
 
@@ -52,6 +54,9 @@ async def update_player_password(
     try:
         # Usa AuthService.update_password que ya maneja el hashing
         await AuthService.update_password(str(player_id), payload.password)
+    except (PasswordHasherBusy, DatabaseBusy):
+        # Los maneja main.py (503 + Retry-After), no son errores del cliente
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500, 
@@ -0,0 +1,18 @@
+from fastapi import APIRouter, Depends, HTTPException
+from application.schemas.ratings import RatingReplayIn, RatingReplayOut
+from application.services.ratings_service import replay
+from api.dependencies.admin import get_admin_user
+
+
+router = APIRouter(prefix="/admin/ratings", tags=["admin:ratings"])
+
+
+
+
+@router.post("/replay", response_model=RatingReplayOut)
+async def post_replay(payload: RatingReplayIn, user_id: str = Depends(get_admin_user)):
+    """Recalcula todos los ratings de una fórmula desde el historial completo de resultados."""
+    try:
+        return await replay(payload.formula, payload.subject_types)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
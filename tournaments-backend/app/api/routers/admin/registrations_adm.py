@@ -1,11 +1,21 @@
 from typing import List, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException
-from application.schemas.admin.registrations import RegistrationOut, RegistrationReviewIn
+from fastapi import APIRouter, Depends, HTTPException, Query
+from application.schemas.admin.registrations import (
+    RegistrationBulkReviewIn,
+    RegistrationBulkReviewOut,
+    RegistrationOut,
+    RegistrationQueuePage,
+    RegistrationReviewIn,
+)
+from application.schemas.tournament import BulkRegistrationIn, BulkRegistrationOut
 from application.services.admin.registrations_service import (
 list_registrations,
+list_review_queue,
 review_registration,
+review_registrations_bulk,
 create_participant,
+create_participants_bulk,
 change_participant_status,
 )
 from api.dependencies.admin import get_admin_user
@@ -23,6 +33,31 @@ async def get_registrations(status: Optional[str] = None, skip: int = 0, limit:
 
 
 
+@router.get("/queue", response_model=RegistrationQueuePage)
+async def get_review_queue(
+    tournament_id: Optional[UUID] = None,
+    status: str = "pending",
+    cursor: Optional[str] = Query(None, description="next_cursor de la página anterior"),
+    limit: int = Query(50, ge=1, le=200),
+    user_id: str = Depends(get_admin_user),
+):
+    """Cola de revisión: más antiguas primero, paginación keyset, con equipo y nº de miembros."""
+    try:
+        return await list_review_queue(tournament_id, status, cursor, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+
+
+@router.post("/review/bulk", response_model=RegistrationBulkReviewOut)
+async def post_bulk_review(payload: RegistrationBulkReviewIn, user_id: str = Depends(get_admin_user)):
+    """Aprueba / rechaza muchas inscripciones con un solo UPDATE."""
+    return await review_registrations_bulk(payload, user_id)
+
+
+
+
 @router.put("/{participant_id}/review", response_model=RegistrationOut)
 async def put_review(participant_id: UUID, payload: RegistrationReviewIn, user_id: str = Depends(get_admin_user)):
     out = await review_registration(participant_id, payload, user_id)
@@ -39,6 +74,16 @@ async def post_participant(tournament_id: UUID, team_id: UUID, user_id: str = De
 
 
 
+@router.post("/tournaments/{tournament_id}/participants/bulk", response_model=BulkRegistrationOut)
+async def post_participants_bulk(tournament_id: UUID, payload: BulkRegistrationIn, user_id: str = Depends(get_admin_user)):
+    out = await create_participants_bulk(tournament_id, payload.team_ids)
+    if not out:
+        raise HTTPException(status_code=404, detail="Tournament not available")
+    return out
+
+
+
+
 @router.put("/participants/{participant_id}/status", response_model=RegistrationOut)
 async def put_participant_status(participant_id: UUID, payload: RegistrationReviewIn, user_id: str = Depends(get_admin_user)):
     out = await change_participant_status(participant_id, payload, user_id)
@@ -0,0 +1,53 @@
+from uuid import UUID
+from fastapi import APIRouter, Depends, HTTPException, status
+from application.schemas.admin.rounds import MatchOut, MatchResultIn, RoundOut
+from application.services.admin.rounds_service import (
+    pair_next_swiss_round,
+    get_round,
+    report_result,
+    rebuild_standings,
+)
+from api.dependencies.admin import get_admin_user
+
+
+router = APIRouter(prefix="/admin", tags=["admin:rounds"])
+
+
+
+
+@router.post("/tournaments/{tournament_id}/rounds/swiss", response_model=RoundOut, status_code=status.HTTP_201_CREATED)
+async def post_swiss_round(tournament_id: UUID, user_id: str = Depends(get_admin_user)):
+    """Empareja la siguiente ronda suiza (la anterior tiene que estar completa)."""
+    try:
+        return await pair_next_swiss_round(tournament_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+
+
+@router.get("/tournaments/{tournament_id}/rounds/{round_number}", response_model=RoundOut)
+async def get_round_endpoint(tournament_id: UUID, round_number: int, user_id: str = Depends(get_admin_user)):
+    out = await get_round(tournament_id, round_number)
+    if not out:
+        raise HTTPException(status_code=404, detail="Round not found")
+    return out
+
+
+
+
+@router.post("/matches/{match_id}/result", response_model=MatchOut)
+async def post_match_result(match_id: UUID, payload: MatchResultIn, user_id: str = Depends(get_admin_user)):
+    out = await report_result(match_id, payload)
+    if not out:
+        raise HTTPException(status_code=409, detail="Match not found or result already reported")
+    return out
+
+
+
+
+@router.post("/tournaments/{tournament_id}/standings/rebuild")
+async def post_rebuild_standings(tournament_id: UUID, user_id: str = Depends(get_admin_user)):
+    """Recalcula la clasificación completa desde las partidas reportadas."""
+    version = await rebuild_standings(tournament_id)
+    return {"tournament_id": str(tournament_id), "version": version}
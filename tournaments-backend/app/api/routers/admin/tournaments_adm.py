@@ -13,6 +13,11 @@ from application.services.admin.tournaments_service import (
     update_tournament as svc_update_tournament,
     soft_delete_tournament as svc_soft_delete_tournament,
 )
+from application.schemas.admin.rules import RuleCreate, RuleOut, LegalityReport
+from application.services.admin.legality_service import (
+    add_rule as svc_add_rule,
+    revalidate_tournament as svc_revalidate_tournament,
+)
 from api.dependencies.admin import get_admin_user
 
 
@@ -58,4 +63,21 @@ async def delete_def_tournament(tournament_id: UUID, user_id: str = Depends(get_
     ok = await svc_soft_delete_tournament(tournament_id)
     if not ok:
         raise HTTPException(status_code=404, detail="Tournament not found")
-    return None
\ No newline at end of file
+    return None
+
+
+@router.post("/{tournament_id}/rules", response_model=RuleOut, status_code=status.HTTP_201_CREATED)
+async def create_rule(tournament_id: UUID, payload: RuleCreate, user_id: str = Depends(get_admin_user)):
+    try:
+        return await svc_add_rule(tournament_id, payload)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.post("/{tournament_id}/legality", response_model=LegalityReport)
+async def revalidate_tournament_teams(tournament_id: UUID, user_id: str = Depends(get_admin_user)):
+    """Revalida todos los rosters registrados contra la regla de formato vigente."""
+    try:
+        return await svc_revalidate_tournament(tournament_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
@@ -2,7 +2,9 @@
 from fastapi import APIRouter, HTTPException, Depends, Request, status
 from application.schemas.auth import RegisterIn, LoginIn, TokenOut, MeOut
 from application.services.auth_service import AuthService
-from core.security import decode_token
+from core.security import decode_token, PasswordHasherBusy
+from core.auth_cache import AuthCache
+from infrastructure.database.pool_metrics import DatabaseBusy
 from config.settings import settings
 import jwt
 
@@ -17,6 +19,9 @@ async def register(payload: RegisterIn):
     # Validaciones básicas (email unique) -> la BD lanzará error si no unique
     try:
         user = await AuthService.register_user(payload.email, payload.password, payload.role, payload.nickname)
+    except (PasswordHasherBusy, DatabaseBusy):
+        # Los maneja main.py (503 + Retry-After), no son errores del cliente
+        raise
     except Exception as e:
         # Si el email ya existe, asyncpg lanzará UniqueViolation; mapea a 400 o 409
         raise HTTPException(status_code=400, detail=str(e))
@@ -63,15 +68,10 @@ async def refresh(body: dict):
     if not jti or not sub:
         raise HTTPException(status_code=401, detail="Malformed refresh token")
 
-    # Validar contra BD
-    valid = await AuthService.validate_refresh_token_jti(jti)
-    if not valid:
-        raise HTTPException(status_code=401, detail="Refresh token invalid or revoked")
-
-    # Opcional: rotation
+    # Validación contra BD + rotación en una sola operación atómica
     rotated = await AuthService.rotate_refresh_token(jti, sub)
     if not rotated:
-        raise HTTPException(status_code=401, detail="Could not rotate refresh token")
+        raise HTTPException(status_code=401, detail="Refresh token invalid or revoked")
     return {
         "access_token": rotated["access_token"],
         "refresh_token": rotated["refresh_token"],
@@ -134,6 +134,8 @@ async def logout_all(body: dict = None, request: Request = None):
     
     user_id = payload.get("sub")
     await AuthService.revoke_all_user_refresh_tokens(user_id)
+    # Los access tokens ya emitidos también dejan de valer (en todos los workers)
+    await AuthCache.revoke_user(user_id)
     return {"detail": "Logged out from all devices"}
 
 @router.get("/me", response_model=MeOut)
@@ -144,7 +146,7 @@ async def me(request: Request):
     
     token = auth_header.split()[1]
     try:
-        payload = decode_token(token)
+        payload = AuthCache.verify_access_token(token)
     except Exception:
         raise HTTPException(status_code=401, detail="Invalid token")
         
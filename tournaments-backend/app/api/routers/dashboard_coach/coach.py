@@ -142,13 +142,14 @@ async def create_team(
 async def get_users(
     limit: int = Query(20, gt=0, le=100),
     offset: int = Query(0, ge=0),
+    q: Optional[str] = Query(None, min_length=2, max_length=100, description="Busca en nickname o email"),
     coach_user_id: UUID = Depends(get_coach_user_id)
 ):
     """
-    Obtiene listado completo de jugadores con perfil (INNER JOIN).
+    Obtiene listado de jugadores con perfil (INNER JOIN), opcionalmente filtrado por q.
     Devuelve players básicos con game_accounts.
     """
-    users = await service.search_users(limit=limit, offset=offset)
+    users = await service.search_users(limit=limit, offset=offset, q=q)
     return users
 
 
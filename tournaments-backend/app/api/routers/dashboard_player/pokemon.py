@@ -1,16 +1,15 @@
-from fastapi import APIRouter
-from infrastructure.external.pokeapi_client import PokeAPIClient, PokeAPINotFound
+from fastapi import APIRouter, Depends
+from domain.repositories.dashboard_player.pokemon_repository import PokemonAPIRepository
+from infrastructure.external.pokeapi_client import PokeAPINotFound, get_pokeapi_client
 
 router = APIRouter(
     prefix="/dashboard/player/pokemon",
     tags=["Dashboard Player - Pokémon"]
 )
 
-client = PokeAPIClient()
-
 
 @router.get("/{id_or_name}")
-async def get_pokemon(id_or_name: str):
+async def get_pokemon(id_or_name: str, client: PokemonAPIRepository = Depends(get_pokeapi_client)):
     try:
         return await client.get_pokemon(id_or_name)
     except PokeAPINotFound:
@@ -13,12 +13,13 @@ from application.schemas.dashboard_player.pokemon import PokemonResponse
 from application.services.dashboard_player.team_service import TeamService
 from infrastructure.repositories.dashboard_player.team_repository_impl import TeamRepositoryImpl
 from infrastructure.repositories.dashboard_player.pokemon_team_member_repository_impl import PokemonTeamMemberRepositoryImpl
-from infrastructure.external.pokeapi_client import PokeAPIClient
+from infrastructure.external.pokeapi_client import get_pokeapi_client
 
 
 from application.schemas.pokemon import (
     PokemonTeamCreateSchema,
-    PokemonTeamMemberCreateSchema
+    PokemonTeamMemberCreateSchema,
+    PokemonRosterReplaceSchema
 )
 from application.services.dashboard_player.team_service import PokemonTeamService
 from core.exceptions import NotFoundError, ForbiddenError, ValidationError
@@ -34,7 +35,7 @@ def get_team_service():
     return TeamService(
         team_repo=TeamRepositoryImpl(),
         pokemon_member_repo=PokemonTeamMemberRepositoryImpl(),
-        pokeapi_client=PokeAPIClient()
+        pokeapi_client=get_pokeapi_client()
     )
 
 # TODO: Implementar autenticación real
@@ -272,6 +273,28 @@ async def add_pokemon_member(
         return _http_error(400, str(e))
 
 
+@router.put("/{team_id}/members")
+async def replace_pokemon_roster(
+    team_id: UUID,
+    payload: PokemonRosterReplaceSchema,
+    user=Depends(get_current_user)
+):
+    """Guarda el roster completo (hasta 6) de una vez: validación conjunta + una transacción."""
+    try:
+        member_ids = await service.replace_roster(
+            UUID(user["sub"]),
+            team_id,
+            [m.model_dump(by_alias=True, exclude_none=True) for m in payload.members]
+        )
+        return {"member_ids": member_ids}
+    except NotFoundError as e:
+        return _http_error(404, str(e))
+    except ForbiddenError as e:
+        return _http_error(403, str(e))
+    except ValidationError as e:
+        return _http_error(400, str(e))
+
+
 @router.delete("/members/{member_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_pokemon_member(
     member_id: int,
@@ -0,0 +1,53 @@
+# src/api/routers/live.py
+from fastapi import APIRouter, Header, Query, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+from typing import Optional
+from uuid import UUID
+
+from application.services.live_updates import stream
+
+router = APIRouter(prefix="/tournaments", tags=["live"])
+
+
+@router.get("/{tournament_id}/events")
+async def tournament_events_sse(
+    tournament_id: UUID,
+    since: Optional[int] = Query(None, ge=0, description="Último seq recibido"),
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
+):
+    """
+    Eventos del torneo por Server-Sent Events. EventSource reenvía Last-Event-ID al
+    reconectar y se reanuda desde ahí.
+    """
+    if since is None and last_event_id and last_event_id.isdigit():
+        since = int(last_event_id)
+
+    async def body():
+        # Reintento sugerido al navegador tras un corte
+        yield "retry: 3000\n\n"
+        async for batch in stream(tournament_id, since):
+            if not batch:
+                yield ": ping\n\n"
+                continue
+            yield "".join(f"id: {e.seq}\nevent: {e.type}\ndata: {e.raw}\n\n" for e in batch)
+
+    return StreamingResponse(
+        body(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/{tournament_id}/ws")
+async def tournament_events_ws(tournament_id: UUID, websocket: WebSocket, since: Optional[int] = None):
+    """Mismos eventos por WebSocket: un mensaje JSON por evento; reanudar con ?since=<seq>."""
+    await websocket.accept()
+    try:
+        async for batch in stream(tournament_id, since):
+            if not batch:
+                await websocket.send_text('{"type":"ping"}')
+                continue
+            for event in batch:
+                await websocket.send_text(event.raw)
+    except WebSocketDisconnect:
+        pass
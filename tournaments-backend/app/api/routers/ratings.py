@@ -0,0 +1,34 @@
+# src/api/routers/ratings.py
+from fastapi import APIRouter, HTTPException, Query
+from typing import List, Optional
+from uuid import UUID
+
+from application.schemas.ratings import RatingHistoryPoint, RatingOut
+from application.services.ratings_service import get_history, get_ratings
+
+router = APIRouter(prefix="/ratings", tags=["ratings"])
+
+MAX_LOOKUP_IDS = 500
+
+
+@router.get("/{subject_type}", response_model=List[RatingOut])
+async def lookup_ratings(
+    subject_type: str,
+    ids: List[UUID] = Query(..., description="Repetir ?ids= por cada sujeto"),
+    formula: Optional[str] = Query(None),
+):
+    """Ratings de varios equipos/usuarios en una sola consulta (seeding, matchmaking)."""
+    if len(ids) > MAX_LOOKUP_IDS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_LOOKUP_IDS} ids per request")
+    try:
+        return await get_ratings(subject_type, ids, formula)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/{subject_type}/{subject_id}/history", response_model=List[RatingHistoryPoint])
+async def rating_history(subject_type: str, subject_id: UUID, formula: Optional[str] = Query(None)):
+    try:
+        return await get_history(subject_type, subject_id, formula)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
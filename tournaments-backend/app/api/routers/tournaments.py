@@ -1,17 +1,29 @@
 # src/api/routers/tournaments.py
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from typing import List, Optional
 import asyncpg
 from uuid import UUID
+from datetime import datetime
 from pydantic import BaseModel
 
 from application.services.tournament_service import TournamentService
 from infrastructure.repositories.tournament_repository_impl import TournamentRepositoryImpl
-from application.schemas.tournament import TournamentResponse
+from application.schemas.tournament import (
+    TournamentResponse,
+    TournamentPage,
+    BulkRegistrationIn,
+    BulkRegistrationOut,
+)
+from application.schemas.admin.brackets import BracketOut
+from application.schemas.standings import StandingsOut
+from application.services.admin.brackets_service import get_bracket
+from application.services import standings_service
 from core.dependencies import get_tournament_service
 
 # IMPORTS QUE FALTABAN
 from infrastructure.database.connection import DatabaseConnection
+from infrastructure.database.pool_metrics import DatabaseBusy
+from infrastructure.repositories.tournament_registration_repo import register_team, register_teams_bulk
 
 # Intentamos usar la dependencia real de auth si existe; si no, damos un fallback claro.
 try:
@@ -26,15 +38,31 @@ except Exception:
 
 router = APIRouter(prefix="/tournaments", tags=["tournaments"])
 
-@router.get("", response_model=List[TournamentResponse])
-@router.get("/", response_model=List[TournamentResponse])
+@router.get("", response_model=TournamentPage)
+@router.get("/", response_model=TournamentPage)
 async def get_tournaments(
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor de la página anterior"),
+    status_filter: Optional[str] = Query(None, alias="status"),
+    is_active: Optional[bool] = Query(None),
+    start_from: Optional[datetime] = Query(None, description="start_at >= start_from"),
+    start_to: Optional[datetime] = Query(None, description="start_at < start_to"),
     service: TournamentService = Depends(get_tournament_service)
 ):
-    """Get all tournaments"""
+    """Get a page of tournaments (keyset pagination, newest first)"""
     try:
-        tournaments = await service.get_all_tournaments()
-        return tournaments
+        return await service.list_tournaments(
+            limit=limit,
+            cursor=cursor,
+            status=status_filter,
+            is_active=is_active,
+            start_from=start_from,
+            start_to=start_to,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except DatabaseBusy:
+        raise
     except asyncpg.PostgresError as e:
         raise HTTPException(
             status_code=500,
@@ -60,6 +88,8 @@ async def get_tournament_by_id(
                 detail=f"Tournament with ID {tournament_id} not found"
             )
         return tournament
+    except DatabaseBusy:
+        raise
     except asyncpg.PostgresError as e:
         raise HTTPException(
             status_code=500,
@@ -73,11 +103,41 @@ async def get_tournament_by_id(
             detail=f"Internal server error: {str(e)}"
         )
 
+@router.get("/{tournament_id}/bracket", response_model=BracketOut)
+async def get_tournament_bracket(tournament_id: UUID, request: Request, response: Response):
+    """Cuadro completo en formato compacto; ETag = versión, para polling barato."""
+    bracket = await get_bracket(tournament_id)
+    if not bracket:
+        raise HTTPException(status_code=404, detail="Bracket not found")
+    etag = f'W/"bracket-{bracket.version}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return bracket
+
+@router.get("/{tournament_id}/standings", response_model=StandingsOut)
+async def get_tournament_standings(tournament_id: UUID, request: Request):
+    """
+    Clasificación con desempates (Buchholz, OMW%, GW%) desde el snapshot precalculado.
+    Con If-None-Match y la versión vigente responde 304 sin tocar el snapshot.
+    """
+    version = await standings_service.current_version(tournament_id)
+    etag = f'W/"standings-{version}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    version, snapshot = await standings_service.get_snapshot(tournament_id)
+    return Response(
+        content=snapshot,
+        media_type="application/json",
+        headers={"ETag": f'W/"standings-{version}"', "Cache-Control": "no-cache"},
+    )
+
 # ------------------------
 # MODELO DE REQUEST (faltaba)
 # ------------------------
 class TournamentRegisterRequest(BaseModel):
     team_id: UUID
+    pokemon_team_id: Optional[UUID] = None
 
 @router.post("/{tournament_id}/register")
 async def register_team_to_tournament(
@@ -86,106 +146,56 @@ async def register_team_to_tournament(
     current_user_id: UUID = Depends(get_current_user_id)   # asumo que ya tienes esta dependencia
 ):
     """
-    Registra un team_id en tournaments_participants (registration_status = 'pending')
+    Registra un team_id en tournaments_participants (status = 'pending')
     y además inserta cada miembro del equipo en tournaments_participants_members con estado 'pending'.
     """
     try:
-        async with DatabaseConnection.get_connection() as conn:
-            async with conn.transaction():
-
-                # 1) Torneo válido y activo
-                tournament = await conn.fetchrow(
-                    "SELECT id, is_active FROM tournaments WHERE id = $1",
-                    tournament_id
-                )
-                if not tournament or not tournament["is_active"]:
-                    raise HTTPException(status_code=404, detail="Tournament not available")
-
-                # 2) Equipo válido y activo
-                team = await conn.fetchrow(
-                    "SELECT id, owner_user_id, coach_user_id, is_active FROM teams WHERE id = $1",
-                    payload.team_id
-                )
-                if not team or not team["is_active"]:
-                    raise HTTPException(status_code=404, detail="Team not available")
-
-                # 3) Permisos: owner, coach o miembro
-                is_owner_or_coach = (
-                    (team["owner_user_id"] is not None and str(team["owner_user_id"]) == str(current_user_id))
-                    or (team["coach_user_id"] is not None and str(team["coach_user_id"]) == str(current_user_id))
-                )
-
-                is_member = await conn.fetchrow(
-                    "SELECT 1 FROM team_members WHERE team_id = $1 AND user_id = $2",
-                    payload.team_id, current_user_id
-                )
-
-                if not (is_owner_or_coach or is_member):
-                    raise HTTPException(status_code=403, detail="You cannot register this team")
-
-                # 4) Evitar duplicados (un team por torneo)
-                exists = await conn.fetchrow(
-                    "SELECT 1 FROM tournaments_participants WHERE tournament_id = $1 AND team_id = $2",
-                    tournament_id, payload.team_id
-                )
-                if exists:
-                    raise HTTPException(status_code=400, detail="Team already registered for this tournament")
-
-                # 5) Insertar participante (registro de equipo)
-                participant = await conn.fetchrow(
-                    """
-                    INSERT INTO tournaments_participants (
-                        tournament_id,
-                        team_id,
-                        registration_status
-                    )
-                    VALUES ($1, $2, 'pending')
-                    RETURNING id, registration_status, applied_at
-                    """,
-                    tournament_id, payload.team_id
-                )
-
-                participant_id = participant["id"]
-
-                # 6) Obtener miembros actuales del equipo
-                members = await conn.fetch(
-                    """
-                    SELECT tm.user_id, tm.role
-                    FROM team_members tm
-                    WHERE tm.team_id = $1
-                    """,
-                    payload.team_id
-                )
-
-                # 7) Insertar cada miembro en tournaments_participants_members con estado 'pending'
-                #    (si no hay miembros, no insertamos)
-                members_inserted = 0
-                if members:
-                    # Inserción por lotes: construimos un batch
-                    insert_sql = """
-                        INSERT INTO tournaments_participants_members (
-                            participant_id, user_id, role, registration_status
-                        ) VALUES ($1, $2, $3, 'pending')
-                    """
-                    for m in members:
-                        await conn.execute(insert_sql, participant_id, m["user_id"], m.get("role", "member"))
-                        members_inserted += 1
-
-                return {
-                    "participant_id": str(participant_id),
-                    "status": participant["registration_status"],
-                    "applied_at": participant["applied_at"].isoformat() if participant["applied_at"] else None,
-                    "members_registered": members_inserted,
-                    "message": "Team successfully registered and its members recorded as pending"
-                }
+        # Validación + participante + miembros en un único round trip
+        result = await register_team(tournament_id, payload.team_id, current_user_id, payload.pokemon_team_id)
+    except asyncpg.PostgresError as e:
+        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
+    if not result["tournament_ok"]:
+        raise HTTPException(status_code=404, detail="Tournament not available")
+    if not result["team_ok"]:
+        raise HTTPException(status_code=404, detail="Team not available")
+    if not result["allowed"]:
+        raise HTTPException(status_code=403, detail="You cannot register this team")
+    if not result["roster_ok"]:
+        raise HTTPException(status_code=404, detail="Pokemon team not found")
+    if result["participant_id"] is None:
+        raise HTTPException(status_code=400, detail="Team already registered for this tournament")
+
+    return {
+        "participant_id": str(result["participant_id"]),
+        "status": result["registration_status"],
+        "applied_at": result["applied_at"].isoformat() if result["applied_at"] else None,
+        "members_registered": result["members_registered"],
+        "message": "Team successfully registered and its members recorded as pending"
+    }
+
+@router.post("/{tournament_id}/register/bulk", response_model=BulkRegistrationOut)
+async def register_teams_to_tournament(
+    tournament_id: UUID,
+    payload: BulkRegistrationIn,
+    current_user_id: UUID = Depends(get_current_user_id)
+):
+    """
+    Registra varios equipos en una sola petición. Devuelve el resultado por equipo:
+    registered | duplicate | inactive | forbidden.
+    """
+    try:
+        results = await register_teams_bulk(tournament_id, payload.team_ids, current_user_id)
     except asyncpg.PostgresError as e:
-        # Puedes loggear e.detail (si usas logger)
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+    if results is None:
+        raise HTTPException(status_code=404, detail="Tournament not available")
+
+    return {
+        "registered": sum(1 for r in results if r["result"] == "registered"),
+        "results": results,
+    }
 
 @router.get("/{tournament_id}/coach/{coach_id}/eligible-teams")
 async def list_eligible_teams_for_tournament(tournament_id: UUID, coach_id: UUID):
@@ -197,7 +207,7 @@ async def list_eligible_teams_for_tournament(tournament_id: UUID, coach_id: UUID
         rows = await conn.fetch(
             """
             SELECT t.id, t.name, t.status, t.is_active,
-                   (SELECT COUNT(*) FROM team_members tm WHERE tm.team_id = t.id) AS players_count,
+                   t.members_count AS players_count,
                    t.created_at
             FROM teams t
             WHERE (t.owner_user_id = $1 OR t.coach_user_id = $1)
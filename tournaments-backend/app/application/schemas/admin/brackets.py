@@ -0,0 +1,56 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+from uuid import UUID
+
+
+class BracketCreateIn(BaseModel):
+    kind: str = Field("single_elimination", pattern="^(single_elimination|double_elimination)$")
+
+
+
+
+class BracketOut(BaseModel):
+    """
+    Cuadro completo en formato compacto (arrays paralelos indexados por número de partida,
+    índice 0 sin usar). slot_a/slot_b/winner: índice en entrants, -1 = por decidir, -2 = bye.
+    """
+    tournament_id: UUID
+    kind: str
+    size: int
+    version: int
+    entrants: List[UUID]
+    slot_a: List[int]
+    slot_b: List[int]
+    winner: List[int]
+    score_a: List[int]
+    score_b: List[int]
+    champion: Optional[UUID] = None
+
+
+
+
+class BracketMatchOut(BaseModel):
+    match: int
+    section: str                   # winners | losers | grand_final
+    round: int
+    position: int
+    player_a: Optional[UUID]
+    player_b: Optional[UUID]
+    winner: Optional[UUID]
+    score_a: int
+    score_b: int
+
+
+
+
+class BracketResultIn(BaseModel):
+    score_a: int = Field(..., ge=0)
+    score_b: int = Field(..., ge=0)
+
+
+
+
+class BracketUpdateOut(BaseModel):
+    version: int
+    champion: Optional[UUID] = None
+    matches: List[BracketMatchOut]
@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import List, Literal, Optional
 from uuid import UUID
 from datetime import datetime
 
@@ -16,10 +16,49 @@ class RegistrationOut(BaseModel):
     reviewed_by: Optional[UUID]
     rejection_reason: Optional[str]
     game_specific_data: Optional[dict]
+    members_updated: Optional[int] = None   # miembros movidos al nuevo estado en la revisión
 
 
 
 
 class RegistrationReviewIn(BaseModel):
+    status: Literal["pending", "approved", "rejected"]
+    rejection_reason: Optional[str] = None
+
+
+
+class RegistrationQueueItem(BaseModel):
+    id: UUID
+    tournament_id: UUID
+    team_id: UUID
+    team_name: Optional[str]
+    members_count: int
     status: str
-    rejection_reason: Optional[str] = None
\ No newline at end of file
+    applied_at: datetime
+    reviewed_at: Optional[datetime]
+    reviewed_by: Optional[UUID]
+    rejection_reason: Optional[str]
+
+
+
+
+class RegistrationQueuePage(BaseModel):
+    items: List[RegistrationQueueItem]
+    next_cursor: Optional[str] = None   # None -> no hay más páginas
+
+
+
+
+class RegistrationBulkReviewIn(BaseModel):
+    participant_ids: List[UUID] = Field(..., min_length=1, max_length=500)
+    status: Literal["approved", "rejected"]
+    rejection_reason: Optional[str] = None
+
+
+
+
+class RegistrationBulkReviewOut(BaseModel):
+    updated: int
+    members_updated: int
+    ids: List[UUID]
+    not_found: List[UUID]
@@ -0,0 +1,38 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+from uuid import UUID
+from datetime import datetime
+
+
+
+
+class MatchOut(BaseModel):
+    id: UUID
+    table_number: int
+    player1_id: UUID
+    player2_id: Optional[UUID]
+    result: Optional[str]
+    p1_wins: int
+    p2_wins: int
+    draws: int
+    reported_at: Optional[datetime]
+
+
+
+
+class RoundOut(BaseModel):
+    id: UUID
+    tournament_id: UUID
+    round_number: int
+    status: str
+    created_at: datetime
+    completed_at: Optional[datetime]
+    matches: List[MatchOut]
+
+
+
+
+class MatchResultIn(BaseModel):
+    p1_wins: int = Field(..., ge=0)
+    p2_wins: int = Field(..., ge=0)
+    draws: int = Field(0, ge=0)
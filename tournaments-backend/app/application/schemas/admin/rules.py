@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import List, Optional
 from uuid import UUID
 from datetime import datetime
 
@@ -18,4 +18,42 @@ class RuleOut(BaseModel):
     tournament_id: UUID
     key: Optional[str]
     content: str
-    created_at: datetime
\ No newline at end of file
+    created_at: datetime
+
+
+
+# Regla estructurada: tournament_rules con key = FORMAT_RULE_KEY y content = JSON de FormatRules.
+# El resto de reglas siguen siendo texto libre.
+FORMAT_RULE_KEY = "format"
+
+
+class FormatRules(BaseModel):
+    banned_species: List[str] = []
+    banned_moves: List[str] = []
+    banned_abilities: List[str] = []
+    banned_items: List[str] = []
+    species_clause: bool = True
+    item_clause: bool = False
+    level_cap: Optional[int] = Field(None, ge=1, le=100)
+    min_team_size: int = Field(1, ge=1, le=6)
+    max_team_size: int = Field(6, ge=1, le=6)
+
+
+
+
+class LegalityTeamResult(BaseModel):
+    participant_id: UUID
+    team_id: UUID
+    pokemon_team_id: Optional[UUID]
+    legal: bool
+    errors: List[str]
+
+
+
+
+class LegalityReport(BaseModel):
+    tournament_id: UUID
+    checked: int
+    legal: int
+    illegal: int
+    results: List[LegalityTeamResult]
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import List, Optional, Dict
+from typing import Any, List, Optional, Dict
 
 class PokemonType(BaseModel):
     slot: int
@@ -32,7 +32,7 @@ class PokemonResponse(BaseModel):
     base_experience: int
     abilities: List[Dict]
     moves: List[Dict]
-    species: Dict[str, str]
+    species: Dict[str, Any]
 
 class PokemonSimple(BaseModel):
     id: int
@@ -31,6 +31,9 @@ class PokemonTeamMemberCreateSchema(BaseModel):
     evs: Optional[PokemonStatsSchema]
     moves: Optional[List[PokemonMoveSchema]]
 
+class PokemonRosterReplaceSchema(BaseModel):
+    members: List[PokemonTeamMemberCreateSchema] = Field(..., max_length=6)
+
 class PokemonTeamResponseSchema(BaseModel):
     id: UUID
     name: str
@@ -0,0 +1,40 @@
+# src/application/schemas/ratings.py
+from pydantic import BaseModel, Field
+from typing import Dict, List, Optional
+from uuid import UUID
+from datetime import datetime
+
+
+class RatingOut(BaseModel):
+    subject_type: str
+    subject_id: UUID
+    formula: str
+    rating: float
+    rd: float
+    volatility: float
+    matches: int = 0
+    updated_at: Optional[datetime] = None
+
+
+class RatingHistoryPoint(BaseModel):
+    period_start: datetime
+    rating: float
+    rd: float
+    volatility: float
+
+
+class RatingReplayIn(BaseModel):
+    formula: Optional[str] = None
+    subject_types: List[str] = Field(default_factory=lambda: ["team", "user"])
+
+
+class RatingReplayStats(BaseModel):
+    subjects: int
+    matches: int
+    history_rows: int
+    compute_ms: float
+
+
+class RatingReplayOut(BaseModel):
+    formula: str
+    results: Dict[str, RatingReplayStats]
@@ -0,0 +1,24 @@
+# src/application/schemas/standings.py
+from pydantic import BaseModel
+from typing import List, Optional
+from uuid import UUID
+
+
+class StandingRow(BaseModel):
+    rank: int
+    participant_id: UUID
+    team_name: Optional[str] = None
+    points: int
+    wins: int
+    losses: int
+    draws: int
+    byes: int
+    buchholz: int
+    omw: float
+    gw: float
+
+
+class StandingsOut(BaseModel):
+    tournament_id: UUID
+    version: int
+    rows: List[StandingRow]
@@ -1,7 +1,7 @@
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 from uuid import UUID
-from typing import Optional
+from typing import Optional, List
 
 class TournamentBase(BaseModel):
     name: str
@@ -27,6 +27,27 @@ class TournamentResponse(TournamentBase):
     id: UUID
     created_at: Optional[datetime] = None    # <-- opcional si DB puede tener NULL
     updated_at: Optional[datetime] = None
+    status: Optional[str] = None
     is_active: bool
 
     model_config = ConfigDict(from_attributes=True)
+
+class TournamentPage(BaseModel):
+    items: List[TournamentResponse]
+    next_cursor: Optional[str] = None   # None -> no hay más páginas
+
+
+class BulkRegistrationIn(BaseModel):
+    team_ids: List[UUID] = Field(..., min_length=1, max_length=256)
+
+class BulkRegistrationResult(BaseModel):
+    team_id: UUID
+    result: str   # registered | duplicate | inactive | forbidden
+    participant_id: Optional[UUID] = None
+    status: Optional[str] = None
+    applied_at: Optional[datetime] = None
+    members_registered: int = 0
+
+class BulkRegistrationOut(BaseModel):
+    registered: int
+    results: List[BulkRegistrationResult]
@@ -0,0 +1,137 @@
+from typing import List, Optional
+from uuid import UUID
+
+from application.schemas.admin.brackets import (
+    BracketMatchOut,
+    BracketOut,
+    BracketResultIn,
+    BracketUpdateOut,
+)
+from application.services import live_updates
+from application.services.bracket import Bracket, BracketError
+from config.settings import settings
+from infrastructure.repositories.admin.brackets_repo import (
+    delete_bracket,
+    fetch_bracket,
+    fetch_seeded_participants,
+    insert_bracket,
+    update_bracket,
+)
+
+# Reintentos si otro reporte del mismo cuadro se cuela entre lectura y escritura
+MAX_REPORT_ATTEMPTS = 3
+
+
+def _load(row: dict) -> Bracket:
+    return Bracket.from_arrays(
+        row["kind"], row["size"],
+        row["slot_a"], row["slot_b"], row["winner"], row["score_a"], row["score_b"],
+    )
+
+
+def _entrant(entrants: List[UUID], index: int) -> Optional[UUID]:
+    return entrants[index] if index >= 0 else None
+
+
+def _champion(bracket: Bracket, entrants: List[UUID]) -> Optional[UUID]:
+    index = bracket.champion()
+    return entrants[index] if index is not None else None
+
+
+def _to_out(row: dict, bracket: Bracket) -> BracketOut:
+    return BracketOut(
+        tournament_id=row["tournament_id"],
+        kind=row["kind"],
+        size=row["size"],
+        version=row["version"],
+        entrants=row["entrants"],
+        champion=_champion(bracket, row["entrants"]),
+        **bracket.to_arrays(),
+    )
+
+
+def _match_out(bracket: Bracket, entrants: List[UUID], m: int) -> BracketMatchOut:
+    section, rnd, position = bracket.locate(m)
+    return BracketMatchOut(
+        match=m,
+        section=section,
+        round=rnd,
+        position=position,
+        player_a=_entrant(entrants, bracket.a[m]),
+        player_b=_entrant(entrants, bracket.b[m]),
+        winner=_entrant(entrants, bracket.winner[m]),
+        score_a=bracket.score_a[m],
+        score_b=bracket.score_b[m],
+    )
+
+
+
+
+async def create_bracket(tournament_id: UUID, kind: str) -> BracketOut:
+    entrants = await fetch_seeded_participants(tournament_id, settings.rating_formula)
+    try:
+        bracket = Bracket.create(kind, len(entrants))
+    except BracketError as e:
+        raise ValueError(str(e))
+    row = await insert_bracket(tournament_id, kind, bracket.size, entrants, bracket.to_arrays())
+    if not row:
+        raise ValueError("Tournament already has a bracket")
+    return _to_out(row, bracket)
+
+
+
+
+async def get_bracket(tournament_id: UUID) -> Optional[BracketOut]:
+    row = await fetch_bracket(tournament_id)
+    return _to_out(row, _load(row)) if row else None
+
+
+
+
+async def list_bracket_matches(tournament_id: UUID) -> Optional[List[BracketMatchOut]]:
+    """Vista expandida (una entrada por partida), para clientes que no quieran decodificar los arrays."""
+    row = await fetch_bracket(tournament_id)
+    if not row:
+        return None
+    bracket = _load(row)
+    return [_match_out(bracket, row["entrants"], m) for m in range(1, bracket.match_count + 1)]
+
+
+
+
+async def report_bracket_result(tournament_id: UUID, match: int, payload: BracketResultIn) -> Optional[BracketUpdateOut]:
+    """
+    Aplica el resultado en memoria (solo la ruta aguas abajo) y guarda con control optimista.
+    Devuelve únicamente las partidas que cambiaron.
+    """
+    for _ in range(MAX_REPORT_ATTEMPTS):
+        row = await fetch_bracket(tournament_id)
+        if not row:
+            return None
+        bracket = _load(row)
+        try:
+            changed = bracket.report(match, payload.score_a, payload.score_b)
+        except BracketError as e:
+            raise ValueError(str(e))
+        version = await update_bracket(
+            tournament_id,
+            row["version"],
+            match,
+            [(m, bracket.a[m], bracket.b[m], bracket.winner[m], bracket.score_a[m], bracket.score_b[m]) for m in changed],
+        )
+        if version is not None:
+            entrants = row["entrants"]
+            out = BracketUpdateOut(
+                version=version,
+                champion=_champion(bracket, entrants),
+                matches=[_match_out(bracket, entrants, m) for m in changed],
+            )
+            await live_updates.publish(tournament_id, live_updates.BRACKET, out.model_dump(mode="json"))
+            return out
+    raise RuntimeError("Bracket is being updated concurrently, retry")
+
+
+
+
+async def remove_bracket(tournament_id: UUID) -> bool:
+    return await delete_bracket(tournament_id)
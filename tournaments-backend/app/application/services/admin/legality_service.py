@@ -0,0 +1,99 @@
+import asyncio
+from typing import Dict, List
+from uuid import UUID
+
+from pydantic import ValidationError
+
+from application.schemas.admin.rules import (
+    FORMAT_RULE_KEY,
+    FormatRules,
+    LegalityReport,
+    LegalityTeamResult,
+    RuleCreate,
+    RuleOut,
+)
+from application.services.legality_engine import compile_format
+from infrastructure.external.pokeapi_client import PokeAPINotFound, get_pokeapi_client
+from infrastructure.repositories.admin.rules_repo import fetch_latest_rule, fetch_tournament_rosters, insert_rule
+
+
+
+
+async def add_rule(tournament_id: UUID, payload: RuleCreate) -> RuleOut:
+    # La regla de formato tiene que ser un FormatRules válido; el resto es texto libre
+    if payload.key == FORMAT_RULE_KEY:
+        try:
+            FormatRules.model_validate_json(payload.content)
+        except ValidationError as e:
+            raise ValueError(f"Invalid format rules: {e}")
+    row = await insert_rule(tournament_id, payload.key, payload.content)
+    return RuleOut(**row)
+
+
+
+
+async def get_format_rules(tournament_id: UUID) -> FormatRules:
+    row = await fetch_latest_rule(tournament_id, FORMAT_RULE_KEY)
+    if not row:
+        return FormatRules()
+    return FormatRules.model_validate_json(row["content"])
+
+
+
+
+async def revalidate_tournament(tournament_id: UUID) -> LegalityReport:
+    """
+    Valida todos los rosters registrados del torneo contra su formato:
+    1 query para los rosters, fetches concurrentes (deduplicados) de los Pokémon implicados,
+    compilación de tablas una vez y validación en memoria.
+    """
+    rules = await get_format_rules(tournament_id)
+    rows = await fetch_tournament_rosters(tournament_id)
+
+    participants: Dict[UUID, dict] = {}
+    teams: Dict[UUID, List[dict]] = {}
+    for r in rows:
+        pid = r["participant_id"]
+        if pid not in participants:
+            participants[pid] = r
+            teams[pid] = []
+        if r["pokemon_id"] is not None:
+            teams[pid].append(r)
+
+    pokemon_ids = list({m["pokemon_id"] for members in teams.values() for m in members})
+    pokeapi = get_pokeapi_client()
+    fetched = await asyncio.gather(*(pokeapi.get_pokemon(str(i)) for i in pokemon_ids), return_exceptions=True)
+    pokemon_by_id = {}
+    for pokemon_id, data in zip(pokemon_ids, fetched):
+        if isinstance(data, PokeAPINotFound):
+            continue  # queda como "unknown Pokémon" en la validación
+        if isinstance(data, BaseException):
+            raise data
+        pokemon_by_id[pokemon_id] = data
+
+    compiled = compile_format(rules, pokemon_by_id)
+    errors_by_participant = compiled.validate_many(
+        {pid: members for pid, members in teams.items() if participants[pid]["pokemon_team_id"]}
+    )
+
+    results = []
+    for pid, p in participants.items():
+        errors = errors_by_participant.get(pid, ["No Pokémon roster submitted"])
+        results.append(
+            LegalityTeamResult(
+                participant_id=pid,
+                team_id=p["team_id"],
+                pokemon_team_id=p["pokemon_team_id"],
+                legal=not errors,
+                errors=errors,
+            )
+        )
+
+    legal = sum(1 for r in results if r.legal)
+    return LegalityReport(
+        tournament_id=tournament_id,
+        checked=len(results),
+        legal=legal,
+        illegal=len(results) - legal,
+        results=results,
+    )
@@ -16,7 +16,7 @@ async def list_players(skip: int, limit: int) -> List[PlayerOut]:
 async def get_player_detail(user_id: UUID):
     return await fetch_player_detail(user_id)
 
-from core.security import hash_password
+from core.security import hash_password_async
 
 async def update_player_profile(user_id: UUID, profile_data: PlayerProfileUpdate) -> PlayerProfileResponse:
     """
@@ -24,7 +24,7 @@ async def update_player_profile(user_id: UUID, profile_data: PlayerProfileUpdate
     """
     pwd_hash = None
     if profile_data.password:
-        pwd_hash = hash_password(profile_data.password)
+        pwd_hash = await hash_password_async(profile_data.password)
 
     # Llamamos al repo que hace la transacción
     try:
@@ -1,8 +1,21 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 from uuid import UUID
-from application.schemas.admin.registrations import RegistrationOut, RegistrationReviewIn
+from application.schemas.admin.registrations import (
+    RegistrationBulkReviewIn,
+    RegistrationBulkReviewOut,
+    RegistrationOut,
+    RegistrationQueueItem,
+    RegistrationQueuePage,
+    RegistrationReviewIn,
+)
+from application.schemas.tournament import BulkRegistrationOut
+from application.services import live_updates
+from infrastructure.repositories.tournament_registration_repo import register_teams_bulk
+from core.pagination import decode_cursor, encode_cursor
 from infrastructure.repositories.admin.registrations_repo import (
     fetch_registrations,
+    fetch_review_queue,
+    update_registration_reviews_bulk,
     update_registration_review,
     insert_participant,
     update_participant_status,
@@ -18,10 +31,54 @@ async def list_registrations(status: Optional[str], skip: int, limit: int) -> Li
 
 
 
+async def list_review_queue(
+    tournament_id: Optional[UUID],
+    status: str,
+    cursor: Optional[str],
+    limit: int,
+) -> RegistrationQueuePage:
+    after = decode_cursor(cursor)
+    # Uno de más para saber si hay página siguiente
+    rows = await fetch_review_queue(tournament_id, status, after, limit + 1)
+    items = [RegistrationQueueItem(**r) for r in rows[:limit]]
+    next_cursor = None
+    if len(rows) > limit:
+        last = items[-1]
+        next_cursor = encode_cursor(last.applied_at, last.id)
+    return RegistrationQueuePage(items=items, next_cursor=next_cursor)
+
+
+
+
+async def review_registrations_bulk(payload: RegistrationBulkReviewIn, reviewer_id: str) -> RegistrationBulkReviewOut:
+    ids = list(dict.fromkeys(payload.participant_ids))
+    rows = await update_registration_reviews_bulk(ids, payload.status, reviewer_id, payload.rejection_reason)
+
+    # Un evento en vivo por torneo, no uno por inscripción
+    by_tournament: Dict[UUID, list] = {}
+    for r in rows:
+        by_tournament.setdefault(r["tournament_id"], []).append(
+            {"id": r["id"], "team_id": r["team_id"], "status": r["status"]}
+        )
+    for tournament_id, items in by_tournament.items():
+        await live_updates.publish(tournament_id, live_updates.REGISTRATIONS, {"items": items})
+
+    updated = {r["id"] for r in rows}
+    return RegistrationBulkReviewOut(
+        updated=len(updated),
+        members_updated=sum(r["members_updated"] for r in rows),
+        ids=[i for i in ids if i in updated],
+        not_found=[i for i in ids if i not in updated],
+    )
+
+
+
+
 async def review_registration(participant_id: UUID, payload: RegistrationReviewIn, reviewer_id: str) -> Optional[RegistrationOut]:
     row = await update_registration_review(participant_id, payload, reviewer_id)
     if not row:
         return None
+    await _publish_status(row)
     return RegistrationOut(**row)   
 
 
@@ -32,8 +89,34 @@ async def create_participant(tournament_id: UUID, team_id: UUID, actor_user_id:
 
 
 
+async def create_participants_bulk(tournament_id: UUID, team_ids: List[UUID]) -> Optional[BulkRegistrationOut]:
+    # Admin: sin comprobación de owner/coach/miembro
+    results = await register_teams_bulk(tournament_id, team_ids, None)
+    if results is None:
+        return None
+    return BulkRegistrationOut(
+        registered=sum(1 for r in results if r["result"] == "registered"),
+        results=results,
+    )
+
+
+
+
 async def change_participant_status(participant_id: UUID, payload: RegistrationReviewIn, reviewer_id: str) -> Optional[RegistrationOut]:
     row = await update_participant_status(participant_id, payload, reviewer_id)
     if not row:
         return None
-    return RegistrationOut(**row)
\ No newline at end of file
+    await _publish_status(row)
+    return RegistrationOut(**row)
+
+
+
+
+async def _publish_status(row: dict) -> None:
+    # Solo importa el último estado de cada inscripción
+    await live_updates.publish(
+        row["tournament_id"],
+        live_updates.REGISTRATION,
+        {"id": row["id"], "team_id": row["team_id"], "status": row["status"]},
+        coalesce=f"registration:{row['id']}",
+    )
\ No newline at end of file
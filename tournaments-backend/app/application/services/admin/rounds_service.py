@@ -0,0 +1,83 @@
+from typing import Optional
+from uuid import UUID
+
+import asyncpg
+
+from application.schemas.admin.rounds import MatchOut, MatchResultIn, RoundOut
+from application.services import live_updates, standings_service
+from application.services.swiss_pairing import build_players, pair_round
+from config.settings import settings
+from infrastructure.repositories.admin.rounds_repo import (
+    fetch_round,
+    fetch_swiss_state,
+    insert_round,
+    report_match_result,
+)
+
+
+
+
+async def pair_next_swiss_round(tournament_id: UUID) -> RoundOut:
+    participants, matches, last_round = await fetch_swiss_state(tournament_id, settings.rating_formula)
+    if len(participants) < 2:
+        raise ValueError("Not enough approved participants")
+    # La ronda está terminada cuando no le quedan partidas pendientes (no solo por su status)
+    if last_round and any(
+        m["result"] is None and m["round_number"] == last_round["round_number"] for m in matches
+    ):
+        raise ValueError("Previous round still in progress")
+
+    players = build_players(participants, matches)
+    pairing = pair_round(players.values())
+    round_number = (last_round["round_number"] if last_round else 0) + 1
+
+    bye_standings = standings_service.bye_writer(pairing.bye) if pairing.bye is not None else None
+    try:
+        row = await insert_round(tournament_id, round_number, pairing.pairs, pairing.bye, bye_standings)
+    except asyncpg.UniqueViolationError:
+        # Otra petición emparejó esta ronda a la vez
+        raise ValueError("Round already paired")
+    if row["standings_version"] is not None:
+        await standings_service.announce(tournament_id, row["standings_version"])
+    out = RoundOut(**row)
+    await live_updates.publish(tournament_id, live_updates.PAIRINGS, out.model_dump(mode="json"))
+    return out
+
+
+
+
+async def get_round(tournament_id: UUID, round_number: int) -> Optional[RoundOut]:
+    row = await fetch_round(tournament_id, round_number)
+    return RoundOut(**row) if row else None
+
+
+
+
+async def report_result(match_id: UUID, payload: MatchResultIn) -> Optional[MatchOut]:
+    if payload.p1_wins > payload.p2_wins:
+        result = "p1"
+    elif payload.p2_wins > payload.p1_wins:
+        result = "p2"
+    else:
+        result = "draw"
+    # Resultado y clasificación se guardan en la misma transacción
+    row = await report_match_result(
+        match_id, result, payload.p1_wins, payload.p2_wins, payload.draws,
+        standings_service.result_writer(result, payload.p1_wins, payload.p2_wins, payload.draws),
+    )
+    if not row:
+        return None
+    await standings_service.announce(row["tournament_id"], row["standings_version"])
+    out = MatchOut(**row)
+    await live_updates.publish(
+        row["tournament_id"],
+        live_updates.MATCH_RESULT,
+        {**out.model_dump(mode="json"), "round_completed": row["round_completed"]},
+    )
+    return out
+
+
+
+
+async def rebuild_standings(tournament_id: UUID) -> int:
+    return await standings_service.rebuild(tournament_id)
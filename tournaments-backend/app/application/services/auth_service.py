@@ -4,14 +4,23 @@ from datetime import datetime, timedelta, timezone
 import uuid
 
 from infrastructure.database.connection import DatabaseConnection
-from core.security import hash_password, verify_password, create_access_token, create_refresh_token
+from infrastructure.database.query_registry import QueryRegistry
+from core.auth_cache import AuthCache
+from core.security import (
+    hash_password,
+    hash_password_async,
+    verify_password_async,
+    password_needs_rehash,
+    create_access_token,
+    create_refresh_token,
+)
 from config.settings import settings
 import asyncpg
 
 class AuthService:
     @staticmethod
     async def register_user(email: str, password: str, role: str, nickname: Optional[str] = None) -> Dict[str, Any]:
-        pwd_hash = hash_password(password)
+        pwd_hash = await hash_password_async(password)
         async with DatabaseConnection.get_connection() as conn:
             # Inserta usuario
             row = await conn.fetchrow(
@@ -40,6 +49,8 @@ class AuthService:
                     "INSERT INTO admin_profiles (user_id) VALUES ($1) ON CONFLICT DO NOTHING",
                     user_id
                 )
+                # Cualquier worker con el rol cacheado lo vuelve a consultar
+                await AuthCache.forget_admin(user_id)
 
             return dict(row)
 
@@ -50,13 +61,23 @@ class AuthService:
                 "SELECT id, email, password_hash, role, is_active FROM users WHERE email = $1",
                 email
             )
-            if not row:
-                return None
-            if not row["is_active"]:
-                return None
-            if not verify_password(password, row["password_hash"]):
-                return None
-            return dict(row)
+        if not row:
+            return None
+        if not row["is_active"]:
+            return None
+        # bcrypt corre en el pool de hashing, sin tener una conexión de la pool retenida
+        if not await verify_password_async(password, row["password_hash"]):
+            return None
+
+        # Si cambió BCRYPT_ROUNDS, aprovechamos que tenemos la contraseña en claro para rehashear
+        if password_needs_rehash(row["password_hash"]):
+            new_hash = await hash_password_async(password)
+            async with DatabaseConnection.get_connection() as conn:
+                await conn.execute(
+                    "UPDATE users SET password_hash = $1 WHERE id = $2",
+                    new_hash, row["id"]
+                )
+        return dict(row)
 
     @staticmethod
     async def get_user_by_id(user_id: str) -> Optional[Dict[str, Any]]:
@@ -131,48 +152,84 @@ class AuthService:
                 user_id
             )
 
-    @staticmethod
-    async def rotate_refresh_token(old_jti: str, user_id: str, ip: Optional[str] = None, user_agent: Optional[str] = None) -> Dict[str, Any]:
-        # valida que old_jti existe y no revocado
-        async with DatabaseConnection.get_connection() as conn:
-            row = await conn.fetchrow("SELECT * FROM refresh_tokens WHERE jti = $1 AND user_id = $2", old_jti, user_id)
-            if not row or row["revoked"] or row["expires_at"] < datetime.now(timezone.utc):
-                return None
+    # Rotación en una sola sentencia: el UPDATE solo revoca el jti si sigue vigente, así que de
+    # dos refresh concurrentes con el mismo token solo uno obtiene fila (el otro espera el lock
+    # y al re-evaluar ve revoked = true). Sin fila en old no se inserta nada.
+    ROTATE_REFRESH_SQL = """
+        WITH old AS (
+            UPDATE refresh_tokens
+            SET revoked = true, revoked_at = now(), replaced_by_jti = $3
+            WHERE jti = $1 AND user_id = $2 AND revoked = false AND expires_at > now()
+            RETURNING user_id
+        ),
+        u AS (
+            SELECT us.id, us.email, us.role
+            FROM users us
+            JOIN old ON old.user_id = us.id
+        ),
+        ins AS (
+            INSERT INTO refresh_tokens (jti, user_id, created_at, expires_at, ip, user_agent)
+            SELECT $3, u.id, now(), $4, $5, $6 FROM u
+            RETURNING jti
+        )
+        SELECT u.id, u.email, u.role FROM u
+    """
+    ROTATE_REFRESH = QueryRegistry.register(
+        "auth.rotate_refresh", ROTATE_REFRESH_SQL, hot=True, query_class="write"
+    )
 
-            # crear nuevo jti + jwt
-            new_jti = str(uuid.uuid4())
-            # payload para tokens: sub, email, role -> obtener user info
-            user_row = await conn.fetchrow("SELECT id, email, role FROM users WHERE id = $1", user_id)
-            if not user_row:
-                return None
-            user_payload = {"sub": str(user_row["id"]), "email": user_row["email"], "role": user_row["role"]}
-            new_refresh_jwt = create_refresh_token(user_payload, jti=new_jti)
-            new_access_jwt = create_access_token(user_payload)
-
-            expires_at = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+    @staticmethod
+    async def rotate_refresh_token(old_jti: str, user_id: str, ip: Optional[str] = None, user_agent: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Revoca old_jti y guarda su sucesor de forma atómica (un round trip).
+        Devuelve None si el token no existe, está caducado o ya se usó (reuse).
+        """
+        new_jti = str(uuid.uuid4())
+        expires_at = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
 
-            # insert nuevo refresh
-            await conn.execute(
-                "INSERT INTO refresh_tokens (jti, user_id, created_at, expires_at, ip, user_agent) VALUES ($1, $2, now(), $3, $4, $5)",
-                new_jti, user_id, expires_at, ip, user_agent
+        async with DatabaseConnection.get_connection() as conn:
+            user_row = await QueryRegistry.fetchrow(
+                conn,
+                AuthService.ROTATE_REFRESH,
+                old_jti, user_id, new_jti, expires_at, ip, user_agent
             )
+        if not user_row:
+            return None
 
-            # marcar old como revocado y linkear replaced_by_jti
-            await conn.execute(
-                "UPDATE refresh_tokens SET revoked = true, revoked_at = now(), replaced_by_jti = $1 WHERE jti = $2",
-                new_jti, old_jti
+        user_payload = {"sub": str(user_row["id"]), "email": user_row["email"], "role": user_row["role"]}
+        return {
+            "access_token": create_access_token(user_payload),
+            "refresh_token": create_refresh_token(user_payload, jti=new_jti),
+            "refresh_jti": new_jti,
+            "expires_in": settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+        }
+
+    @staticmethod
+    async def purge_refresh_tokens(batch_size: int) -> int:
+        """
+        Borra hasta batch_size refresh tokens caducados o revocados. Devuelve cuántos borró.
+        SKIP LOCKED: varios workers pueden barrer a la vez sin pisarse ni bloquear rotaciones.
+        """
+        async with DatabaseConnection.get_connection() as conn:
+            result = await conn.execute(
+                """
+                DELETE FROM refresh_tokens
+                WHERE jti IN (
+                    SELECT jti FROM refresh_tokens
+                    WHERE expires_at < now() OR revoked = true
+                    LIMIT $1
+                    FOR UPDATE SKIP LOCKED
+                )
+                """,
+                batch_size
             )
+        # asyncpg devuelve el command tag: "DELETE <n>"
+        return int(result.split()[-1])
 
-            return {
-                "access_token": new_access_jwt,
-                "refresh_token": new_refresh_jwt,
-                "refresh_jti": new_jti,
-                "expires_in": settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
-            }
     @staticmethod
     async def update_password(user_id: str, new_password: str):
         """Actualiza la contraseña de un usuario"""
-        pwd_hash = hash_password(new_password)
+        pwd_hash = await hash_password_async(new_password)
         async with DatabaseConnection.get_connection() as conn:
             await conn.execute(
                 "UPDATE users SET password_hash = $1 WHERE id = $2",
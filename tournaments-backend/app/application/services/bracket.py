@@ -0,0 +1,228 @@
+# src/application/services/bracket.py
+"""
+Cuadros de eliminación simple y doble sobre arrays compactos.
+
+Cada partida es un índice entero y su estado vive en arrays paralelos (array('i')):
+  a[m], b[m]       → índice del participante en cada hueco (TBD = aún no se sabe, BYE = vacío)
+  winner[m]        → índice del ganador (TBD = sin jugar)
+  score_a/score_b  → marcador reportado
+
+Numeración (índice 0 sin usar):
+  - Winners: heap implícito 1..size-1 (1 = final, hijos 2m y 2m+1; primera ronda = size/2..size-1).
+  - Losers (solo doble): size..size+L-1, por rondas; el enrutado se calcula con aritmética.
+  - Gran final = size+L y su "reset" = size+L+1 (solo doble).
+
+Reportar un resultado solo toca la ruta aguas abajo de esa partida (más las partidas contra
+BYE que se resuelven solas), así que cuesta O(profundidad) y no O(cuadro).
+"""
+from array import array
+from bisect import bisect_right
+from typing import Dict, List, Optional, Tuple
+
+SINGLE = "single_elimination"
+DOUBLE = "double_elimination"
+KINDS = (SINGLE, DOUBLE)
+
+TBD = -1
+BYE = -2
+
+
+class BracketError(ValueError):
+    pass
+
+
+def seed_order(size: int) -> List[int]:
+    """Posición → seed (0-based) con el orden estándar: 1-vs-16, 8-vs-9, ... (size potencia de 2)."""
+    order = [0]
+    while len(order) < size:
+        n = len(order) * 2
+        order = [x for s in order for x in (s, n - 1 - s)]
+    return order
+
+
+class Bracket:
+    __slots__ = ("kind", "size", "depth", "lb_offsets", "gf", "a", "b", "winner", "score_a", "score_b")
+
+    def __init__(self, kind: str, size: int):
+        if kind not in KINDS:
+            raise BracketError(f"Unknown bracket kind: {kind}")
+        self.kind = kind
+        self.size = size
+        self.depth = size.bit_length() - 1           # rondas del cuadro de winners
+
+        # Losers: ronda i (1-based) tiene size >> (ceil(i/2) + 1) partidas
+        self.lb_offsets = [0]
+        if kind == DOUBLE:
+            for i in range(1, 2 * (self.depth - 1) + 1):
+                self.lb_offsets.append(self.lb_offsets[-1] + (size >> ((i + 1) // 2 + 1)))
+        self.gf = size + self.lb_offsets[-1] if kind == DOUBLE else 0
+
+        total = self.match_count + 1
+        self.a = array("i", [TBD]) * total
+        self.b = array("i", [TBD]) * total
+        self.winner = array("i", [TBD]) * total
+        self.score_a = array("i", [0]) * total
+        self.score_b = array("i", [0]) * total
+
+    # -------------------------
+    # Construcción / serialización
+    # -------------------------
+    @classmethod
+    def create(cls, kind: str, entrants: int) -> "Bracket":
+        """Cuadro para `entrants` participantes ya ordenados por seed (0 = mejor)."""
+        if entrants < 2:
+            raise BracketError("A bracket needs at least 2 entrants")
+        size = 1 << (entrants - 1).bit_length()
+        bracket = cls(kind, size)
+        order = seed_order(size)
+        first = size // 2
+        changed: List[int] = []
+        for pos in range(first):
+            m = first + pos
+            sa, sb = order[2 * pos], order[2 * pos + 1]
+            bracket.a[m] = sa if sa < entrants else BYE
+            bracket.b[m] = sb if sb < entrants else BYE
+        # Los byes de primera ronda (y lo que arrastran en losers) se resuelven ya
+        for m in range(first, size):
+            slot = bracket._auto_slot(m)
+            if slot is not None:
+                bracket._settle(m, slot, changed)
+        return bracket
+
+    @classmethod
+    def from_arrays(cls, kind: str, size: int, a, b, winner, score_a, score_b) -> "Bracket":
+        bracket = cls(kind, size)
+        bracket.a = array("i", a)
+        bracket.b = array("i", b)
+        bracket.winner = array("i", winner)
+        bracket.score_a = array("i", score_a)
+        bracket.score_b = array("i", score_b)
+        return bracket
+
+    def to_arrays(self) -> Dict[str, List[int]]:
+        return {
+            "slot_a": self.a.tolist(),
+            "slot_b": self.b.tolist(),
+            "winner": self.winner.tolist(),
+            "score_a": self.score_a.tolist(),
+            "score_b": self.score_b.tolist(),
+        }
+
+    # -------------------------
+    # Topología
+    # -------------------------
+    @property
+    def match_count(self) -> int:
+        if self.kind == SINGLE:
+            return self.size - 1
+        return self.gf + 1
+
+    def locate(self, m: int) -> Tuple[str, int, int]:
+        """Partida → (sección, ronda 1-based, posición dentro de la ronda)."""
+        if 1 <= m < self.size:
+            r = self.depth - (m.bit_length() - 1)
+            return "winners", r, m - (self.size >> r)
+        if self.kind == DOUBLE and self.size <= m < self.gf:
+            i = bisect_right(self.lb_offsets, m - self.size)
+            return "losers", i, m - self.size - self.lb_offsets[i - 1]
+        if self.kind == DOUBLE and m in (self.gf, self.gf + 1):
+            return "grand_final", m - self.gf + 1, 0
+        raise BracketError(f"Match {m} not in bracket")
+
+    def _lb(self, i: int, j: int) -> int:
+        return self.size + self.lb_offsets[i - 1] + j
+
+    def _next_winner(self, m: int) -> Optional[Tuple[int, int]]:
+        section, r, p = self.locate(m)
+        if section == "winners":
+            if m > 1:
+                return m // 2, m % 2
+            return (self.gf, 0) if self.kind == DOUBLE else None
+        if section == "losers":
+            last = len(self.lb_offsets) - 1
+            if r == last:
+                return self.gf, 1
+            if r % 2:
+                return self._lb(r + 1, p), 0
+            return self._lb(r + 1, p // 2), p % 2
+        return None
+
+    def _next_loser(self, m: int) -> Optional[Tuple[int, int]]:
+        if self.kind != DOUBLE or m >= self.size:
+            return None
+        _, r, p = self.locate(m)
+        if self.depth < 2:
+            return self.gf, 1
+        if r == 1:
+            return self._lb(1, p // 2), p % 2
+        # Los que caen de winners entran en la ronda par de losers, alternando el orden para
+        # no repetir cruces de la ronda anterior
+        count = self.size >> r
+        return self._lb(2 * (r - 1), count - 1 - p if r % 2 == 0 else p), 1
+
+    # -------------------------
+    # Resultados
+    # -------------------------
+    def _auto_slot(self, m: int) -> Optional[int]:
+        a, b = self.a[m], self.b[m]
+        if a == TBD or b == TBD:
+            return None
+        if b == BYE:
+            return 0
+        if a == BYE:
+            return 1
+        return None
+
+    def _settle(self, m: int, winner_slot: int, changed: List[int]) -> None:
+        stack = [(m, winner_slot)]
+        while stack:
+            m, slot = stack.pop()
+            a, b = self.a[m], self.b[m]
+            won, lost = (a, b) if slot == 0 else (b, a)
+            self.winner[m] = won
+            changed.append(m)
+
+            if self.kind == DOUBLE and m == self.gf:
+                reset = self.gf + 1
+                if slot == 1:
+                    # Gana quien venía de losers: se juega el reset
+                    self.a[reset], self.b[reset] = a, b
+                else:
+                    self.a[reset] = self.b[reset] = self.winner[reset] = BYE
+                changed.append(reset)
+                continue
+
+            for target, entrant in ((self._next_winner(m), won), (self._next_loser(m), lost)):
+                if target is None:
+                    continue
+                nm, nslot = target
+                (self.a if nslot == 0 else self.b)[nm] = entrant
+                changed.append(nm)
+                auto = self._auto_slot(nm)
+                if auto is not None:
+                    stack.append((nm, auto))
+
+    def report(self, m: int, score_a: int, score_b: int) -> List[int]:
+        """Aplica un resultado y devuelve las partidas modificadas (ordenadas)."""
+        self.locate(m)
+        if self.a[m] < 0 or self.b[m] < 0:
+            raise BracketError("Match is not ready to be played")
+        if self.winner[m] != TBD:
+            raise BracketError("Match already reported")
+        if score_a == score_b:
+            raise BracketError("Elimination matches can't end in a draw")
+        self.score_a[m] = score_a
+        self.score_b[m] = score_b
+        changed: List[int] = []
+        self._settle(m, 0 if score_a > score_b else 1, changed)
+        return sorted(set(changed))
+
+    def champion(self) -> Optional[int]:
+        if self.kind == SINGLE:
+            w = self.winner[1]
+        else:
+            gf = self.gf
+            if self.winner[gf] == TBD:
+                return None
+            w = self.winner[gf] if self.winner[gf] == self.a[gf] else self.winner[gf + 1]
+        return w if w >= 0 else None
@@ -42,12 +42,12 @@ class CoachService:
         team = await self.repo.create_team(name=payload.name, owner_user_id=coach_user_id, coach_user_id=coach_user_id)
         return team
 
-    async def search_users(self, limit: int = 20, offset: int = 0) -> List[dict]:
+    async def search_users(self, limit: int = 20, offset: int = 0, q: Optional[str] = None) -> List[dict]:
         """
-        Obtiene listado completo de jugadores con perfil (INNER JOIN).
+        Obtiene listado de jugadores con perfil (INNER JOIN), filtrado por nickname/email si hay q.
         Devuelve lista con game_accounts incluidas.
         """
-        users = await self.repo.search_users(limit=limit, offset=offset)
+        users = await self.repo.search_users(limit=limit, offset=offset, q=q)
         return users
 
     async def add_player_to_team(self, coach_user_id: UUID, team_id: UUID, user_id: UUID, role: str = "member") -> bool:
@@ -9,7 +9,7 @@ from application.schemas.dashboard_player.player import (
     PlayerProfileResponse, PlayerDashboardResponse
 )
 from application.schemas.dashboard_player.game_account import GameAccountCreate, GameAccountResponse
-import bcrypt
+from core.security import hash_password, verify_password, hash_password_async
 
 class PlayerService:
     def __init__(
@@ -26,16 +26,12 @@ class PlayerService:
     
     @staticmethod
     def hash_password(password: str) -> str:
-        salt = bcrypt.gensalt()
-        hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
-        return hashed.decode('utf-8')
+        # Síncrono: desde código async usar core.security.hash_password_async
+        return hash_password(password)
     
     @staticmethod
     def verify_password(password: str, hashed_password: str) -> bool:
-        return bcrypt.checkpw(
-            password.encode('utf-8'),
-            hashed_password.encode('utf-8')
-        )
+        return verify_password(password, hashed_password)
     
     async def create_user(self, user_data: UserCreate) -> UserResponse:
         # Verificar si el usuario ya existe
@@ -46,12 +42,13 @@ class PlayerService:
         # Crear usuario
         user_id = uuid4()
         now = datetime.now()
+        password_hash = await hash_password_async(user_data.password)
         
         user = await self.user_repo.save(
             type('User', (), {
                 'id': user_id,
                 'email': user_data.email,
-                'password_hash': self.hash_password(user_data.password),
+                'password_hash': password_hash,
                 'status': 'active',
                 'is_active': True,
                 'created_at': now,
@@ -1,3 +1,4 @@
+import asyncio
 from typing import List, Optional, Dict, Any
 from uuid import UUID, uuid4
 from datetime import datetime
@@ -16,8 +17,8 @@ from core.exceptions import (
     ValidationError
 )
 from infrastructure.external.pokeapi_client import (
-    PokeAPIClient,
-    PokeAPINotFound
+    PokeAPINotFound,
+    get_pokeapi_client
 )
 from infrastructure.repositories.dashboard_player.pokemon_team_repository_impl import (
     PokemonTeamRepositoryImpl
@@ -309,7 +310,8 @@ class TeamService:
         
         # Obtener detalles de la PokeAPI
         try:
-            pokemon_data = await self.pokeapi_client.get_pokemon(str(pokemon_id))
+            # El cliente devuelve objetos compartidos (cache L1): trabajamos sobre una copia
+            pokemon_data = dict(await self.pokeapi_client.get_pokemon(str(pokemon_id)))
             
             # Transformar los datos para nuestro schema
             pokemon_data['types'] = [
@@ -331,17 +333,24 @@ class TeamService:
             return None
 
 # src/application/services/dashboard_player/team_service.py
+MAX_TEAM_SIZE = 6
 MAX_MOVES = 4
 MAX_EV_TOTAL = 510
 MAX_EV_STAT = 252
+MAX_IV_STAT = 31
 
 
 class PokemonTeamService:
 
-    def __init__(self):
+    def __init__(self, pokeapi: Optional[PokemonAPIRepository] = None):
         self.team_repo = PokemonTeamRepositoryImpl()
         self.member_repo = PokemonTeamMemberRepositoryImpl()
-        self.pokeapi = PokeAPIClient()
+        self._pokeapi = pokeapi
+
+    @property
+    def pokeapi(self) -> PokemonAPIRepository:
+        # Se resuelve en cada uso: el data pack local se carga en el lifespan, después del import
+        return self._pokeapi or get_pokeapi_client()
 
     # ---------- Teams ----------
 
@@ -376,34 +385,116 @@ class PokemonTeamService:
         if team["owner_user_id"] != user_id:
             raise ForbiddenError("You do not own this team")
 
-        # ---- Validate Pokémon exists ----
-        try:
-            pokemon_data = await self.pokeapi.get_pokemon(payload["pokemon_id"])
-            species_data = await self.pokeapi.get_pokemon_species(
-                pokemon_data["species"]["name"]
-            )
-        except PokeAPINotFound:
-            raise ValidationError("Invalid Pokémon ID")
+        # ---- Validate (mismo pipeline que el roster completo) ----
+        await self.validate_roster([payload])
 
-        payload["species_id"] = species_data["id"]
+        # ---- Persist ----
+        return await self.member_repo.add_member(team_id, payload)
 
-        # ---- Validate moves ----
-        moves = payload.get("moves", [])
-        if len(moves) > MAX_MOVES:
-            raise ValidationError("A Pokémon can only have 4 moves")
+    async def replace_roster(
+        self,
+        user_id: UUID,
+        team_id: UUID,
+        members: List[dict]
+    ) -> List[int]:
+        """Sustituye todos los miembros del equipo (validados juntos) en una sola transacción."""
+        team = await self.team_repo.get_team_by_id(team_id)
+        if not team:
+            raise NotFoundError("Pokémon team not found")
+
+        if team["owner_user_id"] != user_id:
+            raise ForbiddenError("You do not own this team")
 
-        # ---- Validate EVs ----
-        evs = payload.get("evs", {})
-        total_evs = sum(evs.values())
-        if total_evs > MAX_EV_TOTAL:
-            raise ValidationError("Total EVs cannot exceed 510")
+        await self.validate_roster(members)
+        return await self.member_repo.replace_members(team_id, members)
 
-        for stat, value in evs.items():
-            if value > MAX_EV_STAT:
-                raise ValidationError(f"EV {stat} exceeds max value (252)")
+    # ---------- Validation ----------
 
-        # ---- Persist ----
-        return await self.member_repo.add_member(team_id, payload)
+    async def validate_roster(self, members: List[dict]) -> List[dict]:
+        """
+        Valida todos los miembros en una pasada: un único round de peticiones concurrentes
+        (Pokémon + movimientos, claves deduplicadas) y después los checks de legalidad en memoria.
+        Rellena species_id en cada miembro. Lanza ValidationError con todos los errores juntos.
+        """
+        errors: List[str] = []
+
+        if len(members) > MAX_TEAM_SIZE:
+            errors.append(f"A team can have at most {MAX_TEAM_SIZE} Pokémon")
+
+        positions = [m["position"] for m in members]
+        if len(positions) != len(set(positions)):
+            errors.append("Duplicate team positions")
+
+        pokemon_keys = [str(m["pokemon_id"]) for m in members]
+        move_keys = [str(mv["move_id"]) for m in members for mv in (m.get("moves") or [])]
+        pokemon_by_key, moves_by_key = await asyncio.gather(
+            self._fetch_all(self.pokeapi.get_pokemon, pokemon_keys),
+            self._fetch_all(self.pokeapi.get_move, move_keys),
+        )
+
+        for member in members:
+            label = f"Position {member['position']}"
+
+            pokemon = self._unwrap(pokemon_by_key[str(member["pokemon_id"])])
+            if pokemon is None:
+                errors.append(f"{label}: invalid Pokémon ID")
+                continue
+            member["species_id"] = pokemon["species"]["id"]
+
+            # ---- Ability ----
+            ability = member.get("ability")
+            abilities = {a["ability"]["name"] for a in pokemon.get("abilities", [])}
+            if ability and abilities and _slug(ability) not in abilities:
+                errors.append(f"{label}: {pokemon['name']} cannot have ability {ability}")
+
+            # ---- Moves ----
+            moves = member.get("moves") or []
+            if len(moves) > MAX_MOVES:
+                errors.append(f"{label}: a Pokémon can only have {MAX_MOVES} moves")
+            move_ids = [mv["move_id"] for mv in moves]
+            if len(move_ids) != len(set(move_ids)):
+                errors.append(f"{label}: duplicate moves")
+
+            learnset = {mv["move"]["name"] for mv in pokemon.get("moves", [])}
+            for move_id in move_ids:
+                move = self._unwrap(moves_by_key[str(move_id)])
+                if move is None:
+                    errors.append(f"{label}: invalid move ID {move_id}")
+                elif learnset and move["name"] not in learnset:
+                    errors.append(f"{label}: {pokemon['name']} cannot learn {move['name']}")
+
+            # ---- EVs / IVs ----
+            evs = member.get("evs") or {}
+            if sum(evs.values()) > MAX_EV_TOTAL:
+                errors.append(f"{label}: total EVs cannot exceed {MAX_EV_TOTAL}")
+            for stat, value in evs.items():
+                if value > MAX_EV_STAT:
+                    errors.append(f"{label}: EV {stat} exceeds max value ({MAX_EV_STAT})")
+
+            ivs = member.get("ivs") or {}
+            for stat, value in ivs.items():
+                if value > MAX_IV_STAT:
+                    errors.append(f"{label}: IV {stat} exceeds max value ({MAX_IV_STAT})")
+
+        if errors:
+            raise ValidationError("; ".join(errors))
+        return members
+
+    @staticmethod
+    async def _fetch_all(fetch, keys: List[str]) -> Dict[str, Any]:
+        # Deduplica y lanza todas las peticiones a la vez; los errores vuelven como valores
+        unique = list(dict.fromkeys(keys))
+        results = await asyncio.gather(*(fetch(k) for k in unique), return_exceptions=True)
+        return dict(zip(unique, results))
+
+    @staticmethod
+    def _unwrap(result):
+        # NotFound → None (error de validación); cualquier otro fallo de upstream se propaga
+        if isinstance(result, PokeAPINotFound):
+            return None
+        if isinstance(result, BaseException):
+            raise result
+        return result
 
     async def update_member(
         self,
@@ -439,3 +530,8 @@ class PokemonTeamService:
             raise ForbiddenError("You do not own this team")
 
         await self.member_repo.delete_member(member_id)
+
+
+def _slug(name: str) -> str:
+    # "Swift Swim" → "swift-swim" (formato de nombres de PokeAPI)
+    return name.strip().lower().replace(" ", "-")
@@ -0,0 +1,154 @@
+# src/application/services/legality_engine.py
+"""
+Motor de legalidad por formato.
+
+compile_format() convierte las FormatRules de un torneo + los datos de los Pokémon implicados
+en tablas de lookup precalculadas:
+  - banned: bytearray indexado por pokemon_id (especie o forma prohibida)
+  - allowed_moves: bitset (int) por pokemon_id = learnset & ~movimientos prohibidos
+  - allowed_abilities: frozenset por pokemon_id = habilidades posibles - prohibidas
+  - banned_items / level_cap / clauses
+
+Con eso validar un miembro son unas pocas operaciones de bits e índices, sin llamadas
+externas ni recorrer listas de movimientos: miles de equipos se revalidan en milisegundos.
+"""
+from dataclasses import dataclass, field
+from typing import Any, Dict, Hashable, Iterable, List, Optional
+
+from application.schemas.admin.rules import FormatRules
+
+
+def _slug(name: Optional[str]) -> Optional[str]:
+    return name.strip().lower().replace(" ", "-") if name else None
+
+
+def _bits(ids: Iterable[int]) -> int:
+    mask = 0
+    for i in ids:
+        if i is not None:
+            mask |= 1 << i
+    return mask
+
+
+def _bit_ids(mask: int) -> List[int]:
+    out = []
+    while mask:
+        low = mask & -mask
+        out.append(low.bit_length() - 1)
+        mask ^= low
+    return out
+
+
+@dataclass
+class CompiledFormat:
+    rules: FormatRules
+    banned: bytearray
+    allowed_moves: Dict[int, int]
+    allowed_abilities: Dict[int, frozenset]
+    banned_items: frozenset
+    names: Dict[int, str] = field(default_factory=dict)
+    move_names: Dict[int, str] = field(default_factory=dict)
+
+    def validate_team(self, members: List[Dict[str, Any]]) -> List[str]:
+        """Devuelve la lista de errores (vacía = legal). members: filas de pokemon_team_members."""
+        rules = self.rules
+        errors: List[str] = []
+
+        size = len(members)
+        if size < rules.min_team_size or size > rules.max_team_size:
+            errors.append(f"Team size {size} outside {rules.min_team_size}-{rules.max_team_size}")
+
+        seen_species = set()
+        seen_items = set()
+        for member in members:
+            pokemon_id = member.get("pokemon_id")
+            label = f"Position {member.get('position')}"
+            allowed_moves = self.allowed_moves.get(pokemon_id)
+            if allowed_moves is None:
+                errors.append(f"{label}: unknown Pokémon {pokemon_id}")
+                continue
+            name = self.names.get(pokemon_id, str(pokemon_id))
+
+            if pokemon_id < len(self.banned) and self.banned[pokemon_id]:
+                errors.append(f"{label}: {name} is banned")
+
+            if rules.level_cap is not None and (member.get("level") or 0) > rules.level_cap:
+                errors.append(f"{label}: level above cap {rules.level_cap}")
+
+            ability = _slug(member.get("ability"))
+            if ability and ability not in self.allowed_abilities[pokemon_id]:
+                errors.append(f"{label}: ability {ability} not allowed on {name}")
+
+            item = _slug(member.get("held_item"))
+            if item:
+                if item in self.banned_items:
+                    errors.append(f"{label}: item {item} is banned")
+                if rules.item_clause:
+                    if item in seen_items:
+                        errors.append(f"{label}: item clause ({item} repeated)")
+                    seen_items.add(item)
+
+            if rules.species_clause:
+                species = member.get("species_id") or pokemon_id
+                if species in seen_species:
+                    errors.append(f"{label}: species clause ({name} repeated)")
+                seen_species.add(species)
+
+            move_mask = _bits(m.get("move_id") for m in (member.get("moves") or []))
+            illegal = move_mask & ~allowed_moves
+            if illegal:
+                names = ", ".join(self.move_names.get(i, str(i)) for i in _bit_ids(illegal))
+                errors.append(f"{label}: illegal moves for {name}: {names}")
+
+        return errors
+
+    def validate_many(self, teams: Dict[Hashable, List[Dict[str, Any]]]) -> Dict[Hashable, List[str]]:
+        return {key: self.validate_team(members) for key, members in teams.items()}
+
+
+def compile_format(rules: FormatRules, pokemon_by_id: Dict[int, Dict[str, Any]]) -> CompiledFormat:
+    """
+    pokemon_by_id: payloads proyectados (get_pokemon) de todos los Pokémon a validar.
+    Solo se compilan tablas para esos Pokémon.
+    """
+    banned_species = {_slug(n) for n in rules.banned_species}
+    banned_moves = {_slug(n) for n in rules.banned_moves}
+    banned_abilities = {_slug(n) for n in rules.banned_abilities}
+
+    size = max(pokemon_by_id, default=0) + 1
+    banned = bytearray(size)
+    allowed_moves: Dict[int, int] = {}
+    allowed_abilities: Dict[int, frozenset] = {}
+    names: Dict[int, str] = {}
+    move_names: Dict[int, str] = {}
+
+    for pokemon_id, data in pokemon_by_id.items():
+        names[pokemon_id] = data["name"]
+        species_name = (data.get("species") or {}).get("name")
+        if data["name"] in banned_species or species_name in banned_species:
+            banned[pokemon_id] = 1
+
+        learnset = 0
+        for entry in data.get("moves", []):
+            move = entry["move"]
+            move_id = move.get("id")
+            if move_id is None:
+                continue
+            move_names[move_id] = move["name"]
+            if move["name"] not in banned_moves:
+                learnset |= 1 << move_id
+        allowed_moves[pokemon_id] = learnset
+
+        allowed_abilities[pokemon_id] = frozenset(
+            a["ability"]["name"] for a in data.get("abilities", [])
+        ) - banned_abilities
+
+    return CompiledFormat(
+        rules=rules,
+        banned=banned,
+        allowed_moves=allowed_moves,
+        allowed_abilities=allowed_abilities,
+        banned_items=frozenset(_slug(n) for n in rules.banned_items),
+        names=names,
+        move_names=move_names,
+    )
@@ -0,0 +1,66 @@
+# src/application/services/live_updates.py
+"""
+Eventos en vivo por torneo: reviews de inscripciones, emparejamientos, resultados,
+cuadros y clasificación. Los servicios llaman a publish() después de escribir; las
+conexiones WebSocket/SSE consumen stream().
+"""
+import logging
+from typing import Any, AsyncIterator, List, Optional
+
+from config.settings import settings
+from infrastructure.external.live_events import LiveEvent, LiveEvents
+
+logger = logging.getLogger(__name__)
+
+REGISTRATION = "registration"
+REGISTRATIONS = "registrations"     # revisión en bloque: {"items": [...]}
+PAIRINGS = "pairings"
+MATCH_RESULT = "match_result"
+BRACKET = "bracket"
+STANDINGS = "standings"
+
+
+async def publish(tournament_id, event_type: str, data: Any, coalesce: Optional[str] = None) -> None:
+    # La escritura ya está hecha: si Redis falla los clientes se quedan sin el push, no sin el dato
+    try:
+        await LiveEvents.publish(tournament_id, event_type, data, coalesce)
+    except Exception:
+        logger.warning("Could not publish %s event for tournament %s", event_type, tournament_id, exc_info=True)
+
+
+async def stream(tournament_id, since: Optional[int] = None) -> AsyncIterator[List[LiveEvent]]:
+    """
+    Lotes de eventos para una conexión. Con `since` primero se reenvía lo que falta desde el
+    buffer (o un "resync" si ya no está). Lote vacío = heartbeat.
+    """
+    # Suscribir antes de leer el buffer: lo que llegue entretanto se deduplica por seq
+    subscriber = LiveEvents.subscribe(tournament_id)
+    try:
+        last = since
+        if since is not None:
+            complete, backlog = await LiveEvents.replay(tournament_id, since)
+            if not complete:
+                yield [LiveEvents.resync_event(tournament_id, since)]
+                last = None
+            elif backlog:
+                last = backlog[-1].seq
+                yield backlog
+
+        while True:
+            item = await subscriber.get(settings.live_heartbeat_seconds)
+            if item is None:
+                yield []
+                continue
+            resync, events = item
+            batch: List[LiveEvent] = []
+            if resync:
+                batch.append(LiveEvents.resync_event(tournament_id, last or 0))
+                last = None
+            for event in events:
+                if last is None or event.seq > last:
+                    batch.append(event)
+                    last = event.seq
+            if batch:
+                yield batch
+    finally:
+        LiveEvents.unsubscribe(tournament_id, subscriber)
@@ -0,0 +1,241 @@
+# src/application/services/rating_engine.py
+"""
+Motor de ratings (Glicko-2 / Elo) vectorizado con NumPy.
+
+Las partidas llegan como arrays paralelos ordenados por periodo:
+    period[k], a[k], b[k] (índices de sujeto), score[k] (1 = gana a, 0.5 = empate, 0 = gana b)
+y cada periodo se procesa de una vez: las sumas por jugador (v⁻¹ y Δ de Glicko-2) son
+np.bincount sobre todas sus partidas del periodo, y la volatilidad se resuelve con el
+método Illinois sobre todos los jugadores a la vez. No hay bucles Python por partida: una
+temporada de ~1M partidas se recalcula en segundos.
+
+Como en Glicko-2, dentro de un periodo todos juegan contra el rating del inicio del periodo,
+y los periodos sin partidas también cuentan: la RD de todos crece sqrt(φ² + k·σ²) por los k
+periodos vacíos.
+
+Cada partida puede llevar un peso por lado (weight_a, weight_b): con equipos, cada miembro
+juega contra todos los rivales con peso 1/tamaño del equipo rival, es decir, una partida
+contra el "promedio" del otro equipo.
+"""
+from dataclasses import dataclass, replace
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+GLICKO2_SCALE = 173.7178
+VOLATILITY_EPSILON = 1e-6
+VOLATILITY_MAX_ITER = 100
+
+
+@dataclass(frozen=True)
+class RatingFormula:
+    name: str
+    kind: str                      # glicko2 | elo
+    initial_rating: float = 1500.0
+    initial_rd: float = 350.0
+    initial_volatility: float = 0.06
+    tau: float = 0.5               # Glicko-2: cuánto puede cambiar la volatilidad
+    k_factor: float = 32.0         # Elo
+
+
+# Cambiar parámetros = formula nueva (otro nombre) + replay completo del historial
+FORMULAS: Dict[str, RatingFormula] = {
+    "glicko2": RatingFormula(name="glicko2", kind="glicko2"),
+    "elo": RatingFormula(name="elo", kind="elo", initial_rd=0.0, initial_volatility=0.0),
+}
+
+
+@dataclass
+class RatingState:
+    rating: np.ndarray
+    rd: np.ndarray
+    volatility: np.ndarray
+    matches: np.ndarray
+
+    @classmethod
+    def initial(cls, formula: RatingFormula, n: int) -> "RatingState":
+        return cls(
+            rating=np.full(n, formula.initial_rating),
+            rd=np.full(n, formula.initial_rd),
+            volatility=np.full(n, formula.initial_volatility),
+            matches=np.zeros(n, dtype=np.int64),
+        )
+
+
+@dataclass
+class RatingHistory:
+    """Una fila por (periodo, sujeto que jugó en ese periodo), con el estado al cerrar el periodo."""
+    period: np.ndarray
+    subject: np.ndarray
+    rating: np.ndarray
+    rd: np.ndarray
+    volatility: np.ndarray
+
+
+# -------------------------
+# Glicko-2
+# -------------------------
+def _volatility(delta: np.ndarray, phi: np.ndarray, v: np.ndarray, sigma: np.ndarray, tau: float) -> np.ndarray:
+    """Paso 5 de Glicko-2 (Illinois) para todos los jugadores del periodo a la vez."""
+    a = np.log(sigma ** 2)
+    delta2 = delta ** 2
+    phi2 = phi ** 2
+    tau2 = tau ** 2
+
+    def f(x):
+        ex = np.exp(x)
+        return ex * (delta2 - phi2 - v - ex) / (2.0 * (phi2 + v + ex) ** 2) - (x - a) / tau2
+
+    A = a.copy()
+    big = delta2 > phi2 + v
+    B = np.where(big, np.log(np.maximum(delta2 - phi2 - v, 1e-300)), a - tau)
+    # Donde Δ² <= φ² + v hay que bajar B en pasos de τ hasta que f(B) >= 0
+    pending = ~big & (f(B) < 0)
+    while pending.any():
+        B = np.where(pending, B - tau, B)
+        pending &= f(B) < 0
+
+    fA, fB = f(A), f(B)
+    for _ in range(VOLATILITY_MAX_ITER):
+        active = np.abs(B - A) > VOLATILITY_EPSILON
+        if not active.any():
+            break
+        C = A + (A - B) * fA / (fB - fA)
+        fC = f(C)
+        swap = fC * fB <= 0
+        A = np.where(active & swap, B, A)
+        fA = np.where(active, np.where(swap, fB, fA / 2.0), fA)
+        B = np.where(active, C, B)
+        fB = np.where(active, fC, fB)
+    return np.exp(A / 2.0)
+
+
+def _glicko2_idle(formula: RatingFormula, state: RatingState, periods: int) -> None:
+    """`periods` periodos sin partidas: solo crece la RD (con tope en la inicial)."""
+    state.rd = np.minimum(
+        np.sqrt(state.rd ** 2 + periods * (state.volatility * GLICKO2_SCALE) ** 2), formula.initial_rd
+    )
+
+
+def _glicko2_period(formula: RatingFormula, state: RatingState, i, j, s, w) -> np.ndarray:
+    n = state.rating.shape[0]
+    mu = (state.rating - 1500.0) / GLICKO2_SCALE
+    phi = state.rd / GLICKO2_SCALE
+    sigma = state.volatility
+
+    g = 1.0 / np.sqrt(1.0 + 3.0 * phi[j] ** 2 / np.pi ** 2)
+    expected = 1.0 / (1.0 + np.exp(-g * (mu[i] - mu[j])))
+    v_inv = np.bincount(i, weights=w * g * g * expected * (1.0 - expected), minlength=n)
+    d_sum = np.bincount(i, weights=w * g * (s - expected), minlength=n)
+
+    played = np.flatnonzero(np.bincount(i, minlength=n))
+    idle = np.ones(n, dtype=bool)
+    idle[played] = False
+
+    v = 1.0 / v_inv[played]
+    new_sigma = _volatility(v * d_sum[played], phi[played], v, sigma[played], formula.tau)
+    phi_star = np.sqrt(phi[played] ** 2 + new_sigma ** 2)
+    new_phi = 1.0 / np.sqrt(1.0 / phi_star ** 2 + 1.0 / v)
+    new_mu = mu[played] + new_phi ** 2 * d_sum[played]
+
+    # Quien no juega solo gana incertidumbre (con tope en la RD inicial)
+    max_phi = formula.initial_rd / GLICKO2_SCALE
+    phi_idle = np.minimum(np.sqrt(phi[idle] ** 2 + sigma[idle] ** 2), max_phi)
+
+    state.rating[played] = new_mu * GLICKO2_SCALE + 1500.0
+    state.rd[played] = new_phi * GLICKO2_SCALE
+    state.rd[idle] = phi_idle * GLICKO2_SCALE
+    state.volatility[played] = new_sigma
+    return played
+
+
+# -------------------------
+# Elo (simultáneo por periodo)
+# -------------------------
+def _elo_idle(formula: RatingFormula, state: RatingState, periods: int) -> None:
+    pass
+
+
+def _elo_period(formula: RatingFormula, state: RatingState, i, j, s, w) -> np.ndarray:
+    n = state.rating.shape[0]
+    r = state.rating
+    expected = 1.0 / (1.0 + np.power(10.0, (r[j] - r[i]) / 400.0))
+    state.rating = r + formula.k_factor * np.bincount(i, weights=w * (s - expected), minlength=n)
+    return np.flatnonzero(np.bincount(i, minlength=n))
+
+
+_PERIOD_FUNCTIONS = {"glicko2": (_glicko2_period, _glicko2_idle), "elo": (_elo_period, _elo_idle)}
+
+
+def run(
+    formula: RatingFormula,
+    n_subjects: int,
+    period: np.ndarray,
+    a: np.ndarray,
+    b: np.ndarray,
+    score: np.ndarray,
+    state: Optional[RatingState] = None,
+    keep_history: bool = True,
+    weight_a: Optional[np.ndarray] = None,
+    weight_b: Optional[np.ndarray] = None,
+    until: Optional[int] = None,
+) -> Tuple[RatingState, Optional[RatingHistory]]:
+    """
+    Aplica todos los periodos (period tiene que venir ordenado). Sin `state` es un replay
+    desde cero; con él continúa desde ese estado. `until` = último periodo a cerrar (p. ej. el
+    actual): los periodos vacíos hasta él también suben la RD.
+    """
+    state = state or RatingState.initial(formula, n_subjects)
+    step, idle = _PERIOD_FUNCTIONS[formula.kind]
+    period = np.asarray(period)
+    a = np.asarray(a, dtype=np.int64)
+    b = np.asarray(b, dtype=np.int64)
+    score = np.asarray(score, dtype=np.float64)
+    weight_a = np.ones(len(period)) if weight_a is None else np.asarray(weight_a, dtype=np.float64)
+    weight_b = np.ones(len(period)) if weight_b is None else np.asarray(weight_b, dtype=np.float64)
+
+    chunks = []
+    bounds = np.flatnonzero(np.diff(period)) + 1
+    starts = np.concatenate(([0], bounds))
+    ends = np.concatenate((bounds, [len(period)]))
+    previous = None
+    for start, end in zip(starts, ends):
+        if start == end:
+            continue
+        if previous is not None and period[start] - previous > 1:
+            idle(formula, state, int(period[start] - previous - 1))
+        previous = period[start]
+        pa, pb, ps = a[start:end], b[start:end], score[start:end]
+        # Cada partida cuenta desde los dos lados
+        i = np.concatenate((pa, pb))
+        j = np.concatenate((pb, pa))
+        s = np.concatenate((ps, 1.0 - ps))
+        w = np.concatenate((weight_a[start:end], weight_b[start:end]))
+        played = step(formula, state, i, j, s, w)
+        # Con pesos, la suma de un miembro en una partida es 1: redondeamos por periodo
+        state.matches += np.rint(np.bincount(i, weights=w, minlength=n_subjects)).astype(np.int64)
+        if keep_history:
+            chunks.append((
+                np.full(played.shape[0], period[start]),
+                played,
+                state.rating[played].copy(),
+                state.rd[played].copy(),
+                state.volatility[played].copy(),
+            ))
+
+    if until is not None and previous is not None and until > previous:
+        idle(formula, state, int(until - previous))
+
+    if not keep_history:
+        return state, None
+    if not chunks:
+        empty = np.empty(0)
+        return state, RatingHistory(empty, empty.astype(np.int64), empty, empty, empty)
+    return state, RatingHistory(*(np.concatenate(column) for column in zip(*chunks)))
+
+
+def formula(name: str, **overrides) -> RatingFormula:
+    base = FORMULAS.get(name)
+    if base is None:
+        raise ValueError(f"Unknown rating formula: {name}")
+    return replace(base, **overrides) if overrides else base
@@ -0,0 +1,107 @@
+# src/application/services/ratings_service.py
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+from uuid import UUID
+
+import numpy as np
+
+from application.schemas.ratings import RatingHistoryPoint, RatingOut, RatingReplayOut, RatingReplayStats
+from application.services import rating_engine
+from config.settings import settings
+from infrastructure.repositories.ratings_repo import (
+    fetch_history,
+    fetch_ratings,
+    fetch_results,
+    replace_ratings,
+)
+
+SUBJECT_TYPES = ("team", "user")
+
+
+def _compute(formula: rating_engine.RatingFormula, rows: list, period_seconds: int):
+    """Records → arrays → replay. Se ejecuta en un hilo (NumPy suelta el GIL en lo pesado)."""
+    n = len(rows)
+    index: Dict[UUID, int] = {}
+    period = np.fromiter((r["period"] for r in rows), dtype=np.int64, count=n)
+    a = np.fromiter((index.setdefault(r["a"], len(index)) for r in rows), dtype=np.int64, count=n)
+    b = np.fromiter((index.setdefault(r["b"], len(index)) for r in rows), dtype=np.int64, count=n)
+    score = np.fromiter((r["score"] for r in rows), dtype=np.float64, count=n)
+    weight_a = np.fromiter((r["weight_a"] for r in rows), dtype=np.float64, count=n)
+    weight_b = np.fromiter((r["weight_b"] for r in rows), dtype=np.float64, count=n)
+    ids = list(index)
+
+    # Hasta el periodo actual: la RD de quien lleva tiempo sin jugar sigue creciendo
+    until = int(time.time() // period_seconds)
+    state, history = rating_engine.run(
+        formula, len(ids), period, a, b, score, weight_a=weight_a, weight_b=weight_b, until=until
+    )
+
+    ratings = list(zip(
+        ids, state.rating.tolist(), state.rd.tolist(), state.volatility.tolist(), state.matches.tolist()
+    ))
+    starts = {
+        p: datetime.fromtimestamp(p * period_seconds, tz=timezone.utc)
+        for p in np.unique(history.period).tolist()
+    }
+    history_rows = [
+        (ids[s], starts[p], r, rd, v)
+        for p, s, r, rd, v in zip(
+            history.period.tolist(), history.subject.tolist(),
+            history.rating.tolist(), history.rd.tolist(), history.volatility.tolist(),
+        )
+    ]
+    return ratings, history_rows
+
+
+async def replay(formula_name: Optional[str] = None, subject_types=SUBJECT_TYPES) -> RatingReplayOut:
+    """
+    Recalcula desde cero los ratings de la fórmula con todo el historial de resultados y los
+    guarda en bloque (ratings + historial por periodo).
+    """
+    formula = rating_engine.formula(formula_name or settings.rating_formula)
+    period_seconds = settings.rating_period_days * 86400
+    results: Dict[str, RatingReplayStats] = {}
+
+    for subject_type in subject_types:
+        if subject_type not in SUBJECT_TYPES:
+            raise ValueError(f"Unknown subject type: {subject_type}")
+        rows = await fetch_results(subject_type, period_seconds)
+        started = time.perf_counter()
+        ratings, history = await asyncio.to_thread(_compute, formula, rows, period_seconds)
+        compute_ms = (time.perf_counter() - started) * 1000
+
+        await replace_ratings(
+            formula.name,
+            subject_type,
+            [(formula.name, subject_type, *r) for r in ratings],
+            [(formula.name, subject_type, *h) for h in history],
+        )
+        results[subject_type] = RatingReplayStats(
+            subjects=len(ratings), matches=len(rows), history_rows=len(history), compute_ms=round(compute_ms, 1)
+        )
+    return RatingReplayOut(formula=formula.name, results=results)
+
+
+async def get_ratings(subject_type: str, subject_ids: List[UUID], formula_name: Optional[str] = None) -> List[RatingOut]:
+    """Lookup en bloque; los sujetos sin partidas salen con el rating inicial de la fórmula."""
+    if subject_type not in SUBJECT_TYPES:
+        raise ValueError(f"Unknown subject type: {subject_type}")
+    formula = rating_engine.formula(formula_name or settings.rating_formula)
+    found = await fetch_ratings(formula.name, subject_type, subject_ids)
+    out = []
+    for subject_id in subject_ids:
+        row = found.get(subject_id) or {
+            "rating": formula.initial_rating,
+            "rd": formula.initial_rd,
+            "volatility": formula.initial_volatility,
+        }
+        out.append(RatingOut(subject_type=subject_type, subject_id=subject_id, formula=formula.name, **row))
+    return out
+
+
+async def get_history(subject_type: str, subject_id: UUID, formula_name: Optional[str] = None) -> List[RatingHistoryPoint]:
+    formula = rating_engine.formula(formula_name or settings.rating_formula)
+    rows = await fetch_history(formula.name, subject_type, subject_id)
+    return [RatingHistoryPoint(**r) for r in rows]
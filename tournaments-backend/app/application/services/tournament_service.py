@@ -1,8 +1,11 @@
-from typing import List
+from typing import List, Optional
 from uuid import UUID
+from datetime import datetime
 from domain.entities.tournament import Tournament
 from domain.repositories.tournament_repository import TournamentRepository
-from application.schemas.tournament import TournamentCreate, TournamentUpdate
+from application.schemas.tournament import TournamentCreate, TournamentUpdate, TournamentPage, TournamentResponse
+from core.pagination import encode_cursor, decode_cursor
+from infrastructure.cache.tournament_cache import TournamentCache
 
 class TournamentService:
     """Application service for tournament operations"""
@@ -10,16 +13,65 @@ class TournamentService:
     def __init__(self, repository: TournamentRepository):
         self.repository = repository
     
-    async def get_all_tournaments(self) -> List[Tournament]:
-        """Get all tournaments"""
-        return await self.repository.get_all()
+    async def list_tournaments(
+        self,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        status: Optional[str] = None,
+        is_active: Optional[bool] = None,
+        start_from: Optional[datetime] = None,
+        start_to: Optional[datetime] = None,
+    ) -> TournamentPage:
+        """Get one page of tournaments (newest first) and the cursor for the next one"""
+        params_key = "|".join(
+            str(v) for v in (limit, cursor, status, is_active, start_from, start_to)
+        )
+        return await TournamentCache.get_page(
+            params_key,
+            lambda: self._load_page(limit, cursor, status, is_active, start_from, start_to),
+            TournamentPage,
+        )
+
+    async def _load_page(
+        self,
+        limit: int,
+        cursor: Optional[str],
+        status: Optional[str],
+        is_active: Optional[bool],
+        start_from: Optional[datetime],
+        start_to: Optional[datetime],
+    ) -> TournamentPage:
+        after = decode_cursor(cursor)
+        # Pedimos uno de más para saber si existe una página siguiente
+        rows = await self.repository.list_page(
+            limit + 1,
+            after=after,
+            status=status,
+            is_active=is_active,
+            start_from=start_from,
+            start_to=start_to,
+        )
+        items = rows[:limit]
+        next_cursor = None
+        if len(rows) > limit:
+            last = items[-1]
+            next_cursor = encode_cursor(last.created_at, last.id)
+        return TournamentPage(items=items, next_cursor=next_cursor)
     
-    async def get_tournament_by_id(self, tournament_id: UUID) -> Tournament:
+    async def get_tournament_by_id(self, tournament_id: UUID) -> TournamentResponse:
         """Get tournament by ID"""
-        tournament = await self.repository.get_by_id(tournament_id)
+        tournament = await TournamentCache.get_detail(
+            tournament_id,
+            lambda: self._load_tournament(tournament_id),
+            TournamentResponse,
+        )
         if not tournament:
             raise ValueError(f"Tournament with ID {tournament_id} not found")
         return tournament
+
+    async def _load_tournament(self, tournament_id: UUID) -> Optional[TournamentResponse]:
+        tournament = await self.repository.get_by_id(tournament_id)
+        return TournamentResponse.model_validate(tournament) if tournament else None
     
     async def create_tournament(self, data: TournamentCreate) -> Tournament:
         """Create a new tournament"""
@@ -17,19 +17,77 @@ class Settings(BaseSettings):
     db_port: int = Field(5432, env="DB_PORT")
     db_min_size: int = Field(1, env="DB_MIN_SIZE")
     db_max_size: int = Field(10, env="DB_MAX_SIZE")
+    # Cache LRU de sentencias de asyncpg (por conexión) para el SQL que no pasa por QueryRegistry
+    db_statement_cache_size: int = Field(256, env="DB_STATEMENT_CACHE_SIZE")
+    db_max_cacheable_statement_size: int = Field(32 * 1024, env="DB_MAX_CACHEABLE_STATEMENT_SIZE")
+    db_max_inactive_connection_lifetime: float = Field(300.0, env="DB_MAX_INACTIVE_CONNECTION_LIFETIME")
+    # Segundos esperando conexión libre antes de responder 503
+    db_acquire_timeout: float = Field(2.0, env="DB_ACQUIRE_TIMEOUT")
+    # Presupuesto por clase de query (segundos); batch también es el techo de todo lo demás
+    db_timeout_read: float = Field(2.0, env="DB_TIMEOUT_READ")
+    db_timeout_write: float = Field(5.0, env="DB_TIMEOUT_WRITE")
+    db_timeout_batch: float = Field(120.0, env="DB_TIMEOUT_BATCH")
     
     # Configuración de Redis
     redis_url: str = Field("redis://localhost:6379/0", env="REDIS_URL")
+
+    # Cache de lecturas de torneos (L1 en proceso + L2 en Redis)
+    tournament_cache_ttl: int = Field(300, env="TOURNAMENT_CACHE_TTL")
+    tournament_local_cache_ttl: int = Field(30, env="TOURNAMENT_LOCAL_CACHE_TTL")
+    tournament_local_cache_size: int = Field(512, env="TOURNAMENT_LOCAL_CACHE_SIZE")
+
+    # Snapshots de clasificación (clave = torneo + versión, no hace falta invalidar)
+    standings_cache_ttl: int = Field(3600, env="STANDINGS_CACHE_TTL")
+    standings_local_cache_size: int = Field(256, env="STANDINGS_LOCAL_CACHE_SIZE")
+    # Cuánto puede tardar un worker en ver una versión nueva (segundos)
+    standings_version_ttl: float = Field(1.0, env="STANDINGS_VERSION_TTL")
+
+    # Ratings: fórmula usada para seeding y duración del periodo de rating
+    rating_formula: str = Field("glicko2", env="RATING_FORMULA")
+    rating_period_days: int = Field(7, env="RATING_PERIOD_DAYS")
+
+    # Eventos en vivo por torneo (WebSocket / SSE)
+    live_buffer_size: int = Field(500, env="LIVE_BUFFER_SIZE")            # eventos guardados para reanudar
+    live_buffer_ttl: int = Field(86400, env="LIVE_BUFFER_TTL")
+    live_max_pending: int = Field(256, env="LIVE_MAX_PENDING")            # por conexión; si se supera → resync
+    live_heartbeat_seconds: float = Field(15.0, env="LIVE_HEARTBEAT_SECONDS")
     
     JWT_SECRET_KEY: str = Field(..., env="JWT_SECRET_KEY")
     JWT_REFRESH_SECRET_KEY: str = Field(..., env="JWT_REFRESH_SECRET_KEY")
     JWT_ALGORITHM: str = Field("HS256", env="JWT_ALGORITHM")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(60, env="ACCESS_TOKEN_EXPIRE_MINUTES")
     REFRESH_TOKEN_EXPIRE_DAYS: int = Field(7, env="REFRESH_TOKEN_EXPIRE_DAYS")
+    REFRESH_TOKEN_SWEEP_INTERVAL_SECONDS: int = Field(900, env="REFRESH_TOKEN_SWEEP_INTERVAL_SECONDS")
+    REFRESH_TOKEN_SWEEP_BATCH: int = Field(1000, env="REFRESH_TOKEN_SWEEP_BATCH")
+
+    # Hashing de contraseñas (bcrypt) fuera del event loop
+    BCRYPT_ROUNDS: int = Field(12, env="BCRYPT_ROUNDS")
+    PASSWORD_HASH_WORKERS: int = Field(2, env="PASSWORD_HASH_WORKERS")
+    PASSWORD_HASH_MAX_QUEUE: int = Field(32, env="PASSWORD_HASH_MAX_QUEUE")
+
+    # Cache de verificación de tokens y de rol admin (por worker)
+    AUTH_TOKEN_CACHE_SIZE: int = Field(10000, env="AUTH_TOKEN_CACHE_SIZE")
+    ADMIN_ROLE_CACHE_TTL: int = Field(60, env="ADMIN_ROLE_CACHE_TTL")
 
     DATABASE_URL: Optional[str] = Field(None, env="DATABASE_URL")
     POKEAPI_BASE_URL: str = "https://pokeapi.co/api/v2"
 
+    # Cliente HTTP compartido hacia PokeAPI (uno por worker, abierto en el lifespan)
+    POKEAPI_TIMEOUT: float = Field(10.0, env="POKEAPI_TIMEOUT")
+    POKEAPI_MAX_CONNECTIONS: int = Field(20, env="POKEAPI_MAX_CONNECTIONS")
+    POKEAPI_MAX_KEEPALIVE: int = Field(10, env="POKEAPI_MAX_KEEPALIVE")
+    POKEAPI_KEEPALIVE_EXPIRY: float = Field(60.0, env="POKEAPI_KEEPALIVE_EXPIRY")
+    POKEAPI_HTTP2: bool = Field(True, env="POKEAPI_HTTP2")
+    # L1 en memoria (objetos ya decodificados) delante de Redis
+    POKEAPI_LOCAL_CACHE_SIZE: int = Field(2048, env="POKEAPI_LOCAL_CACHE_SIZE")
+    POKEAPI_LOCAL_CACHE_TTL: int = Field(600, env="POKEAPI_LOCAL_CACHE_TTL")
+    # Lease en Redis para que un solo worker rellene cada clave
+    POKEAPI_FILL_LEASE_MS: int = Field(10000, env="POKEAPI_FILL_LEASE_MS")
+    # Cuánto se recuerda un 404 de PokeAPI (L1 y Redis)
+    POKEAPI_NOT_FOUND_TTL: int = Field(60, env="POKEAPI_NOT_FOUND_TTL")
+    # Data pack local (SQLite generado con pokeapi_datapack_import); si existe sustituye a PokeAPI
+    POKEAPI_DATAPACK_PATH: Optional[str] = Field(None, env="POKEAPI_DATAPACK_PATH")
+
     # Dejar default vacío; se rellenará desde .env si existe
     CORS_ORIGINS: List[str] = Field(default_factory=list, env="CORS_ORIGINS")
 
@@ -0,0 +1,141 @@
+# src/core/auth_cache.py
+import hashlib
+import logging
+import time
+from typing import Any, Dict
+
+import jwt
+
+from config.settings import settings
+from core.security import decode_token
+from infrastructure.cache.ttl_lru import TTLLRUCache
+from infrastructure.database.connection import DatabaseConnection
+from infrastructure.external.redis_client import RedisClient
+from infrastructure.external.redis_pubsub import RedisPubSub
+
+logger = logging.getLogger(__name__)
+
+
+class TokenRevoked(jwt.InvalidTokenError):
+    """El usuario hizo logout-all después de emitirse el token."""
+    pass
+
+
+class AuthCache:
+    """
+    Capa de auth compartida por todas las dependencias:
+      - payloads de access tokens ya verificados (LRU por hash del token, caduca en exp)
+      - rol admin por user_id (TTL corto; forget_admin lo borra en todos los workers)
+      - revocaciones por usuario: tokens con iat anterior a revoked_before se rechazan.
+        Se guardan en Redis y se propagan por pub/sub para que logout-all sea inmediato.
+    """
+
+    CHANNEL = "auth:revocations"
+    ADMIN_PREFIX = "admin:"          # mensajes "admin:{user_id}" en CHANNEL: olvidar el rol cacheado
+    REVOKED_KEY = "auth:revoked_before:{user_id}"
+
+    _tokens = TTLLRUCache(settings.AUTH_TOKEN_CACHE_SIZE, ttl=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60)
+    _admins = TTLLRUCache(settings.AUTH_TOKEN_CACHE_SIZE, ttl=settings.ADMIN_ROLE_CACHE_TTL)
+    # Solo hace falta recordar la revocación mientras pueda quedar vivo algún access token anterior
+    _revoked_before = TTLLRUCache(settings.AUTH_TOKEN_CACHE_SIZE * 10, ttl=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60)
+
+    # -------------------------
+    # Access tokens
+    # -------------------------
+    @classmethod
+    def verify_access_token(cls, token: str) -> Dict[str, Any]:
+        """
+        Igual que decode_token(token) pero sin repetir la verificación de firma para tokens
+        ya vistos. Lanza jwt.ExpiredSignatureError / jwt.InvalidTokenError / TokenRevoked.
+        """
+        key = hashlib.sha256(token.encode("utf-8")).digest()
+        payload = cls._tokens.get(key)
+        if payload is None:
+            payload = decode_token(token)
+            exp = payload.get("exp")
+            ttl = exp - time.time() if exp else None
+            if ttl is None or ttl > 0:
+                cls._tokens.set(key, payload, ttl=ttl)
+
+        revoked_before = cls._revoked_before.get(str(payload.get("sub")))
+        if revoked_before is not None and payload.get("iat", 0) < revoked_before:
+            raise TokenRevoked("Token revoked")
+        return payload
+
+    # -------------------------
+    # Rol admin
+    # -------------------------
+    @classmethod
+    async def is_admin(cls, user_id: str) -> bool:
+        cached = cls._admins.get(str(user_id))
+        if cached is not None:
+            return cached
+        async with DatabaseConnection.get_connection() as conn:
+            row = await conn.fetchrow(
+                "SELECT user_id FROM admin_profiles WHERE user_id = $1",
+                user_id,
+            )
+        is_admin = row is not None
+        cls._admins.set(str(user_id), is_admin)
+        return is_admin
+
+    @classmethod
+    async def forget_admin(cls, user_id: str) -> None:
+        """Llamar tras cambiar admin_profiles de un usuario: se vuelve a consultar en todos los workers."""
+        cls._admins.delete(str(user_id))
+        try:
+            await RedisPubSub.publish(cls.CHANNEL, f"{cls.ADMIN_PREFIX}{user_id}")
+        except Exception:
+            logger.warning("Could not propagate admin role change for %s", user_id, exc_info=True)
+
+    # -------------------------
+    # Revocación (logout-all)
+    # -------------------------
+    @classmethod
+    async def revoke_user(cls, user_id: str) -> None:
+        """Invalida todos los access tokens emitidos hasta ahora para el usuario, en todos los workers."""
+        user_id = str(user_id)
+        revoked_before = int(time.time())
+        cls._apply_revocation(f"{user_id}:{revoked_before}")
+        try:
+            redis = RedisClient.get_client()
+            async with redis.pipeline(transaction=False) as pipe:
+                pipe.set(
+                    cls.REVOKED_KEY.format(user_id=user_id),
+                    revoked_before,
+                    ex=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+                )
+                pipe.publish(cls.CHANNEL, f"{user_id}:{revoked_before}")
+                await pipe.execute()
+        except Exception:
+            logger.warning("Could not propagate token revocation for %s", user_id, exc_info=True)
+
+    @classmethod
+    def _apply_revocation(cls, message: str) -> None:
+        user_id, _, revoked_before = message.rpartition(":")
+        current = cls._revoked_before.get(user_id)
+        value = int(revoked_before)
+        if current is None or value > current:
+            cls._revoked_before.set(user_id, value)
+
+    @classmethod
+    def _on_message(cls, message: str) -> None:
+        if message.startswith(cls.ADMIN_PREFIX):
+            cls._admins.delete(message[len(cls.ADMIN_PREFIX):])
+        else:
+            cls._apply_revocation(message)
+
+    @classmethod
+    async def _load_revocations(cls) -> None:
+        # Al (re)conectar cargamos las revocaciones vigentes que pudimos perdernos
+        # (y olvidamos los roles admin cacheados: algún cambio pudo publicarse mientras tanto)
+        cls._admins.clear()
+        redis = RedisClient.get_client()
+        prefix = cls.REVOKED_KEY.format(user_id="")
+        async for key in redis.scan_iter(match=f"{prefix}*"):
+            value = await redis.get(key)
+            if value is not None:
+                cls._apply_revocation(f"{key[len(prefix):]}:{value}")
+
+
+RedisPubSub.register(AuthCache.CHANNEL, AuthCache._on_message, on_connect=AuthCache._load_revocations)
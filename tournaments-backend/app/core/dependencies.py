@@ -8,7 +8,7 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
 import jwt
 
-from config.settings import settings
+from core.auth_cache import AuthCache, TokenRevoked
 from infrastructure.repositories.tournament_repository_impl import TournamentRepositoryImpl
 from application.services.tournament_service import TournamentService
 
@@ -27,17 +27,18 @@ async def get_current_user_id(
     token = credentials.credentials
 
     try:
-         payload = jwt.decode(
-             token,
-             settings.JWT_SECRET_KEY,
-             algorithms=["HS256"],
-         )
+        payload = AuthCache.verify_access_token(token)
 
     except jwt.ExpiredSignatureError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token expired",
         )
+    except TokenRevoked:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token revoked",
+        )
     except jwt.InvalidTokenError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -0,0 +1,27 @@
+# src/core/pagination.py
+import base64
+import json
+from datetime import datetime
+from typing import Optional, Tuple
+from uuid import UUID
+
+
+def encode_cursor(sort_value: datetime, row_id: UUID) -> str:
+    """
+    Cursor opaco para paginación keyset sobre (sort_value, id).
+    El cliente solo debe devolverlo tal cual en la siguiente petición.
+    """
+    raw = json.dumps({"v": sort_value.isoformat(), "id": str(row_id)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Tuple[datetime, UUID]]:
+    """Decodifica un cursor generado por encode_cursor. Lanza ValueError si no es válido."""
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(data["v"]), UUID(data["id"])
+    except Exception:
+        raise ValueError("Invalid cursor")
@@ -1,4 +1,7 @@
 # src/core/security.py
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 
@@ -11,12 +14,77 @@ import uuid
 
 # Passwords
 def hash_password(password: str) -> str:
-    hashed = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt())
+    hashed = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS))
     return hashed.decode("utf-8")
 
 def verify_password(password: str, password_hash: str) -> bool:
     return bcrypt.checkpw(password.encode("utf-8"), password_hash.encode("utf-8"))
 
+def password_needs_rehash(password_hash: str) -> bool:
+    """True si el hash se generó con un coste distinto de BCRYPT_ROUNDS ($2b$<cost>$...)."""
+    try:
+        return int(password_hash.split("$")[2]) != settings.BCRYPT_ROUNDS
+    except (IndexError, ValueError):
+        return True
+
+
+class PasswordHasherBusy(Exception):
+    """La cola del pool de hashing está llena; el cliente debe reintentar más tarde."""
+    pass
+
+
+class PasswordHasher:
+    """
+    Ejecuta bcrypt en un pool de hilos acotado (bcrypt libera el GIL) para no bloquear
+    el event loop. Si hay más de workers + max_queue operaciones pendientes rechaza
+    con PasswordHasherBusy en lugar de encolar sin límite.
+    """
+
+    def __init__(self, workers: int, max_queue: int):
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bcrypt")
+        self.pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self._total_seconds = 0.0
+
+    async def run(self, fn, *args):
+        if self.pending >= self.workers + self.max_queue:
+            self.rejected += 1
+            raise PasswordHasherBusy()
+        self.pending += 1
+        start = time.perf_counter()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+        finally:
+            self.pending -= 1
+            self.completed += 1
+            self._total_seconds += time.perf_counter() - start
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "in_flight": min(self.pending, self.workers),
+            "queued": max(0, self.pending - self.workers),
+            "max_queue": self.max_queue,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "avg_ms": round(self._total_seconds / self.completed * 1000, 2) if self.completed else 0.0,
+        }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False)
+
+
+password_hasher = PasswordHasher(settings.PASSWORD_HASH_WORKERS, settings.PASSWORD_HASH_MAX_QUEUE)
+
+async def hash_password_async(password: str) -> str:
+    return await password_hasher.run(hash_password, password)
+
+async def verify_password_async(password: str, password_hash: str) -> bool:
+    return await password_hasher.run(verify_password, password, password_hash)
+
 def create_refresh_token(data: Dict[str, Any], expires_delta: Optional[timedelta] = None, jti: Optional[str] = None) -> str:
     to_encode = data.copy()
     now = datetime.utcnow()
@@ -17,6 +17,7 @@ class Tournament:
     updated_at: Optional[datetime] = None
     price_client: Optional[Decimal] = None  # numeric(10,2)
     price_player: Optional[Decimal] = None  # numeric(10,2)
+    status: Optional[str] = None
     is_active: Optional[bool] = None  # Si viene de DB
 
     def is_active(self) -> bool:
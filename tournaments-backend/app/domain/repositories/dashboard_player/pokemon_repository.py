@@ -5,7 +5,15 @@ class PokemonAPIRepository(ABC):
     @abstractmethod
     async def get_pokemon(self, identifier: str) -> Dict[str, Any]:
         pass
-    
+
+    @abstractmethod
+    async def get_pokemon_species(self, identifier: str) -> Dict[str, Any]:
+        pass
+
+    @abstractmethod
+    async def get_move(self, identifier: str) -> Dict[str, Any]:
+        pass
+
     @abstractmethod
     async def search_pokemon(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
-        pass
\ No newline at end of file
+        pass
@@ -1,14 +1,23 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
+from datetime import datetime
 from domain.entities.tournament import Tournament
 
 class TournamentRepository(ABC):
     """Abstract base class for tournament repository"""
     
     @abstractmethod
-    async def get_all(self) -> List[Tournament]:
-        """Get all tournaments"""
+    async def list_page(
+        self,
+        limit: int,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        status: Optional[str] = None,
+        is_active: Optional[bool] = None,
+        start_from: Optional[datetime] = None,
+        start_to: Optional[datetime] = None,
+    ) -> List[Tournament]:
+        """Get a page of tournaments ordered by (created_at, id) DESC, starting after the given key"""
         pass
     
     @abstractmethod
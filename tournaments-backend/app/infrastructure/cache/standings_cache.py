@@ -0,0 +1,66 @@
+# infrastructure/cache/standings_cache.py
+from typing import Optional
+from uuid import UUID
+
+from config.settings import settings
+from infrastructure.cache.ttl_lru import TTLLRUCache
+from infrastructure.external.redis_client import RedisClient
+
+
+class StandingsCache:
+    """
+    Snapshots de clasificación ya serializados (JSON), por (torneo, versión).
+    Como la versión forma parte de la clave, un snapshot nunca queda obsoleto: solo hay que
+    saber cuál es la versión actual, que se guarda en un L1 de TTL muy corto.
+    """
+
+    SNAPSHOT_KEY = "standings:{id}:{version}"
+
+    _snapshots = TTLLRUCache(settings.standings_local_cache_size, settings.standings_cache_ttl)
+    _versions = TTLLRUCache(settings.standings_local_cache_size * 4, settings.standings_version_ttl)
+
+    @classmethod
+    def get_version(cls, tournament_id: UUID) -> Optional[int]:
+        return cls._versions.get(tournament_id)
+
+    @classmethod
+    def set_version(cls, tournament_id: UUID, version: int) -> None:
+        cls._versions.set(tournament_id, version)
+
+    @classmethod
+    async def get_snapshot(cls, tournament_id: UUID, version: int) -> Optional[str]:
+        key = (tournament_id, version)
+        snapshot = cls._snapshots.get(key)
+        if snapshot is not None:
+            return snapshot
+        redis = cls._redis()
+        if redis:
+            try:
+                snapshot = await redis.get(cls.SNAPSHOT_KEY.format(id=tournament_id, version=version))
+            except Exception:
+                snapshot = None
+            if snapshot:
+                cls._snapshots.set(key, snapshot)
+                return snapshot
+        return None
+
+    @classmethod
+    async def set_snapshot(cls, tournament_id: UUID, version: int, snapshot: str) -> None:
+        cls._snapshots.set((tournament_id, version), snapshot)
+        redis = cls._redis()
+        if redis:
+            try:
+                await redis.set(
+                    cls.SNAPSHOT_KEY.format(id=tournament_id, version=version),
+                    snapshot,
+                    ex=settings.standings_cache_ttl,
+                )
+            except Exception:
+                pass
+
+    @staticmethod
+    def _redis():
+        try:
+            return RedisClient.get_client()
+        except Exception:
+            return None
@@ -0,0 +1,188 @@
+# infrastructure/cache/tournament_cache.py
+import logging
+from typing import Awaitable, Callable, Optional, Type, TypeVar
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from config.settings import settings
+from infrastructure.cache.ttl_lru import TTLLRUCache
+from infrastructure.external.redis_client import RedisClient
+from infrastructure.external.redis_pubsub import RedisPubSub
+
+logger = logging.getLogger(__name__)
+
+M = TypeVar("M", bound=BaseModel)
+
+# Guarda el valor solo si la generación sigue siendo la leída antes de cargar. Atómico: o se
+# escribe antes del INCR de invalidate() (y su DEL lo borra) o ve la generación nueva y no escribe
+_SET_IF_GEN_LUA = """
+if (redis.call('GET', KEYS[1]) or '0') == ARGV[1] then
+    return redis.call('SET', KEYS[2], ARGV[2], 'EX', ARGV[3])
+end
+return 0
+"""
+
+
+class TournamentCache:
+    """
+    Cache de lecturas de torneos en dos niveles:
+      L1: LRU con TTL en memoria de cada worker (objetos ya construidos)
+      L2: Redis, compartido por todos los workers (JSON)
+
+    Las escrituras del admin llaman a invalidate(): se borran los detalles en Redis, se sube
+    la generación de las páginas y se publica un mensaje en CHANNEL para que cada worker
+    vacíe su L1.
+
+    Cada página es una clave propia con su TTL, con la generación en el nombre: una página
+    leída de la BD antes de invalidate() se guarda bajo la generación vieja y nadie la vuelve
+    a leer (caduca sola). Los detalles no llevan la generación en la clave: se guardan en
+    Redis solo si la generación no cambió durante la carga, y en el L1 solo si no llegó un
+    _evict_local mientras tanto.
+    """
+
+    CHANNEL = "tournaments:invalidate"
+    GEN_KEY = "tournaments:gen"
+    PAGE_KEY = "tournaments:page:{gen}:{params}"
+    DETAIL_KEY = "tournaments:detail:{id}"
+    ALL = "*"
+
+    _pages = TTLLRUCache(settings.tournament_local_cache_size, settings.tournament_local_cache_ttl)
+    _details = TTLLRUCache(settings.tournament_local_cache_size, settings.tournament_local_cache_ttl)
+    # Generación local: una carga que empezó antes de _evict_local no rellena el L1
+    _local_gen = 0
+
+    # -------------------------
+    # Lecturas
+    # -------------------------
+    @classmethod
+    async def get_page(cls, params_key: str, loader: Callable[[], Awaitable[M]], model: Type[M]) -> M:
+        page = cls._pages.get(params_key)
+        if page is not None:
+            return page
+
+        local_gen = cls._local_gen
+        redis = cls._redis()
+        redis_key = None
+        if redis:
+            try:
+                # La generación se lee antes de cargar: si hay una invalidación en medio,
+                # lo que guardemos queda bajo la generación vieja
+                gen = await redis.get(cls.GEN_KEY) or "0"
+                redis_key = cls.PAGE_KEY.format(gen=gen, params=params_key)
+                cached = await redis.get(redis_key)
+                if cached:
+                    page = model.model_validate_json(cached)
+                    if cls._local_gen == local_gen:
+                        cls._pages.set(params_key, page)
+                    return page
+            except Exception:
+                # Redis caído → seguimos sin cache
+                redis = None
+
+        page = await loader()
+        if cls._local_gen == local_gen:
+            cls._pages.set(params_key, page)
+        if redis:
+            try:
+                await redis.set(redis_key, page.model_dump_json(), ex=settings.tournament_cache_ttl)
+            except Exception:
+                pass
+        return page
+
+    @classmethod
+    async def get_detail(
+        cls, tournament_id: UUID, loader: Callable[[], Awaitable[Optional[M]]], model: Type[M]
+    ) -> Optional[M]:
+        key = str(tournament_id)
+        item = cls._details.get(key)
+        if item is not None:
+            return item
+
+        local_gen = cls._local_gen
+        redis = cls._redis()
+        redis_key = cls.DETAIL_KEY.format(id=key)
+        gen = None
+        if redis:
+            try:
+                # invalidate() sube GEN_KEY también para un solo detalle: la leemos antes de
+                # cargar y solo guardamos en Redis si no ha cambiado (ver _SET_IF_GEN_LUA)
+                gen = await redis.get(cls.GEN_KEY) or "0"
+                cached = await redis.get(redis_key)
+                if cached:
+                    item = model.model_validate_json(cached)
+                    if cls._local_gen == local_gen:
+                        cls._details.set(key, item)
+                    return item
+            except Exception:
+                redis = None
+
+        item = await loader()
+        # Los "no encontrado" no se cachean
+        if item is None:
+            return None
+        if cls._local_gen == local_gen:
+            cls._details.set(key, item)
+        if redis:
+            try:
+                await redis.eval(
+                    _SET_IF_GEN_LUA, 2, cls.GEN_KEY, redis_key,
+                    gen, item.model_dump_json(), settings.tournament_cache_ttl,
+                )
+            except Exception:
+                pass
+        return item
+
+    # -------------------------
+    # Invalidación
+    # -------------------------
+    @classmethod
+    async def invalidate(cls, tournament_id: Optional[UUID] = None) -> None:
+        """
+        Invalida el detalle del torneo (o todos si tournament_id es None) y todas las páginas
+        del listado, en este worker, en Redis y, vía pub/sub, en el resto de workers.
+        """
+        target = str(tournament_id) if tournament_id else cls.ALL
+        cls._evict_local(target)
+
+        redis = cls._redis()
+        if not redis:
+            return
+        try:
+            if tournament_id:
+                detail_keys = [cls.DETAIL_KEY.format(id=target)]
+            else:
+                detail_keys = [k async for k in redis.scan_iter(match=cls.DETAIL_KEY.format(id="*"))]
+            # Borramos antes de publicar para que los demás workers no recarguen datos viejos de Redis
+            async with redis.pipeline(transaction=False) as pipe:
+                pipe.incr(cls.GEN_KEY)
+                if detail_keys:
+                    pipe.delete(*detail_keys)
+                pipe.publish(cls.CHANNEL, target)
+                await pipe.execute()
+        except Exception:
+            logger.warning("Could not propagate tournament cache invalidation", exc_info=True)
+
+    @classmethod
+    def _evict_local(cls, target: str) -> None:
+        cls._local_gen += 1
+        cls._pages.clear()
+        if target == cls.ALL:
+            cls._details.clear()
+        else:
+            cls._details.delete(target)
+
+    @staticmethod
+    def _redis():
+        try:
+            return RedisClient.get_client()
+        except Exception:
+            return None
+
+
+# Cada worker vacía su L1 al recibir una invalidación (y tras reconectar, por si se perdió alguna)
+RedisPubSub.register(
+    TournamentCache.CHANNEL,
+    TournamentCache._evict_local,
+    on_connect=lambda: TournamentCache._evict_local(TournamentCache.ALL),
+)
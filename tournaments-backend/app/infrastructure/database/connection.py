@@ -3,17 +3,21 @@ import json
 from typing import Optional
 from contextlib import asynccontextmanager
 from config.settings import settings
+from infrastructure.database.pool_metrics import InstrumentedPool
+from infrastructure.database.query_registry import QueryRegistry
 
 class DatabaseConnection:
     """Manages database connection pool"""
 
-    _pool: Optional[asyncpg.Pool] = None
+    _pool: Optional[InstrumentedPool] = None
 
     @classmethod
-    async def get_pool(cls) -> asyncpg.Pool:
-        """Get or create connection pool"""
+    async def get_pool(cls) -> InstrumentedPool:
+        """Get or create connection pool (instrumented, see pool_metrics)"""
         if cls._pool is None:
-            cls._pool = await asyncpg.create_pool(
+            # El pool crece bajo demanda hasta max_size y cierra las conexiones ociosas tras
+            # max_inactive_connection_lifetime, volviendo a min_size cuando baja la carga
+            pool = await asyncpg.create_pool(
                 user=settings.db_user,
                 password=settings.db_password,
                 database=settings.db_name,
@@ -21,15 +25,22 @@ class DatabaseConnection:
                 port=settings.db_port,
                 min_size=settings.db_min_size,
                 max_size=settings.db_max_size,
+                statement_cache_size=settings.db_statement_cache_size,
+                max_cacheable_statement_size=settings.db_max_cacheable_statement_size,
+                max_inactive_connection_lifetime=settings.db_max_inactive_connection_lifetime,
+                # Techo para el SQL sin clase; las sentencias del registro usan su presupuesto
+                command_timeout=settings.db_timeout_batch,
                 init=cls._init_connection,   # 🔑 AQUI ESTA LA SOLUCIÓN
             )
+            cls._pool = InstrumentedPool(pool)
         return cls._pool
 
     @staticmethod
     async def _init_connection(conn: asyncpg.Connection):
         """
         Initialize each DB connection.
-        Register JSON / JSONB codecs so we can use list/dict directly.
+        Register JSON / JSONB codecs so we can use list/dict directly,
+        then warm the statement cache with the hot statements of QueryRegistry.
         """
         await conn.set_type_codec(
             "jsonb",
@@ -45,6 +56,9 @@ class DatabaseConnection:
             schema="pg_catalog",
         )
 
+        # Después de los codecs: las sentencias cacheadas ya usan json/jsonb como dict/list
+        await QueryRegistry.prepare_connection(conn)
+
     @classmethod
     async def close_pool(cls):
         """Close connection pool"""
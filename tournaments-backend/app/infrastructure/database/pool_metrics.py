@@ -0,0 +1,190 @@
+# infrastructure/database/pool_metrics.py
+import asyncio
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Any, Dict, Optional
+
+from config.settings import settings
+
+# Límites superiores de los buckets, en segundos (el último bucket es +inf)
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+MAX_ROUTES = 256
+
+
+class DatabaseBusy(Exception):
+    """La base de datos no puede atender a tiempo: se responde 503 en vez de encolar más."""
+
+
+class PoolAcquireTimeout(DatabaseBusy):
+    pass
+
+
+class QueryTimeout(DatabaseBusy):
+    def __init__(self, name: str, query_class: str):
+        super().__init__(f"Query {name} exceeded the {query_class} budget")
+        self.name = name
+        self.query_class = query_class
+
+
+class Histogram:
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Cota superior del cuantil q (el límite del bucket donde cae)."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, n in zip(BUCKETS, self.counts):
+            seen += n
+            if seen >= rank:
+                return bound
+        return self.max
+
+    def snapshot(self) -> Dict[str, Any]:
+        cumulative = 0
+        buckets = []
+        for bound, n in zip(BUCKETS + (float("inf"),), self.counts):
+            cumulative += n
+            buckets.append({"le": "+Inf" if bound == float("inf") else bound, "count": cumulative})
+        return {
+            "count": self.count,
+            "sum": round(self.total, 6),
+            "max": round(self.max, 6),
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "buckets": buckets,
+        }
+
+
+class PoolMetrics:
+    """
+    Telemetría del pool (por worker): espera para conseguir conexión, cuánto la retiene cada
+    ruta y cuánto tardan las queries de cada clase. Espera alta con queries rápidas = pool
+    escaso; queries lentas con espera baja = problema de SQL.
+    """
+
+    acquire_wait = Histogram()
+    acquire_timeouts = 0
+    waiting = 0
+    hold: Dict[str, Histogram] = {}
+    queries: Dict[str, Histogram] = {}
+    query_timeouts: Dict[str, int] = {}
+
+    # scope ASGI de la petición en curso (lo fija el middleware de main.py)
+    _scope: ContextVar[Optional[dict]] = ContextVar("db_request_scope", default=None)
+
+    @classmethod
+    def bind_request(cls, scope: dict):
+        return cls._scope.set(scope)
+
+    @classmethod
+    def unbind_request(cls, token) -> None:
+        cls._scope.reset(token)
+
+    @classmethod
+    def current_route(cls) -> str:
+        scope = cls._scope.get()
+        if scope is None:
+            return "background"
+        # La plantilla de la ruta (no el path real) para no crear una serie por id
+        path = getattr(scope.get("route"), "path", None)
+        return f"{scope.get('method', '')} {path}" if path else "unrouted"
+
+    @classmethod
+    def observe_hold(cls, route: str, seconds: float) -> None:
+        histogram = cls.hold.get(route)
+        if histogram is None:
+            if len(cls.hold) >= MAX_ROUTES:
+                route = "other"
+            histogram = cls.hold.setdefault(route, Histogram())
+        histogram.observe(seconds)
+
+    @classmethod
+    def observe_query(cls, query_class: str, seconds: float) -> None:
+        cls.queries.setdefault(query_class, Histogram()).observe(seconds)
+
+    @classmethod
+    def query_timeout(cls, query_class: str) -> None:
+        cls.query_timeouts[query_class] = cls.query_timeouts.get(query_class, 0) + 1
+
+    @classmethod
+    def snapshot(cls, pool=None) -> Dict[str, Any]:
+        out: Dict[str, Any] = {"pool": None}
+        if pool is not None:
+            size = pool.get_size()
+            idle = pool.get_idle_size()
+            out["pool"] = {
+                "min_size": pool.get_min_size(),
+                "max_size": pool.get_max_size(),
+                "size": size,
+                "idle": idle,
+                "in_use": size - idle,
+                "waiting": cls.waiting,
+            }
+        out["acquire_wait"] = cls.acquire_wait.snapshot()
+        out["acquire_timeouts"] = cls.acquire_timeouts
+        out["hold_by_route"] = {route: h.snapshot() for route, h in sorted(cls.hold.items())}
+        out["queries_by_class"] = {name: h.snapshot() for name, h in sorted(cls.queries.items())}
+        out["query_timeouts"] = dict(cls.query_timeouts)
+        return out
+
+
+class _AcquireContext:
+    __slots__ = ("_pool", "_timeout", "_conn", "_route", "_acquired_at")
+
+    def __init__(self, pool, timeout: Optional[float]):
+        self._pool = pool
+        self._timeout = timeout
+
+    async def __aenter__(self):
+        start = time.perf_counter()
+        PoolMetrics.waiting += 1
+        try:
+            self._conn = await self._pool.acquire(timeout=self._timeout)
+        except asyncio.TimeoutError:
+            PoolMetrics.acquire_timeouts += 1
+            raise PoolAcquireTimeout("Timed out waiting for a database connection") from None
+        finally:
+            PoolMetrics.waiting -= 1
+        self._acquired_at = time.perf_counter()
+        self._route = PoolMetrics.current_route()
+        PoolMetrics.acquire_wait.observe(self._acquired_at - start)
+        return self._conn
+
+    async def __aexit__(self, *exc):
+        try:
+            await self._pool.release(self._conn)
+        finally:
+            PoolMetrics.observe_hold(self._route, time.perf_counter() - self._acquired_at)
+
+
+class InstrumentedPool:
+    """
+    Envoltorio de asyncpg.Pool: mismo uso (async with pool.acquire() as conn), pero acquire
+    tiene timeout por defecto y mide espera y tiempo de retención.
+    """
+
+    def __init__(self, pool):
+        self._pool = pool
+
+    def acquire(self, timeout: Optional[float] = None) -> _AcquireContext:
+        return _AcquireContext(self._pool, timeout if timeout is not None else settings.db_acquire_timeout)
+
+    def __getattr__(self, name):
+        return getattr(self._pool, name)
@@ -0,0 +1,165 @@
+# infrastructure/database/query_registry.py
+import asyncio
+import logging
+import time
+from typing import Callable, Dict, Hashable, Set, Tuple
+
+from config.settings import settings
+from infrastructure.database.pool_metrics import PoolMetrics, QueryTimeout
+
+logger = logging.getLogger(__name__)
+
+
+class QueryRegistry:
+    """
+    Registro central de sentencias SQL con nombre.
+
+    - register(): sentencia fija. Las marcadas como hot se calientan en cada conexión nueva
+      (DatabaseConnection._init_connection), así la primera petición no paga parse/plan.
+    - shaped(): SQL dinámico (filtros opcionales, updates parciales) limitado a un conjunto
+      acotado de formas; cada forma se registra una vez con texto idéntico y se reutiliza.
+    - fetch/fetchrow/fetchval/execute: ejecutan el SQL registrado con conn.fetch(...) y
+      aplican el presupuesto de tiempo de su clase (read / write / batch).
+
+    No se guardan PreparedStatement: asyncpg los invalida al devolver la conexión al pool.
+    La preparación la hace la LRU de asyncpg por conexión (statement_cache_size), que
+    además re-prepara sola si cambia el esquema. Aquí solo se anota qué nombres ha visto
+    ya cada backend (pid) para contar hits/misses; la primera ejecución en una conexión
+    cuenta como miss.
+    """
+
+    MAX_SHAPES = 64
+    # Presupuesto de tiempo por clase: settings.db_timeout_<clase>
+    QUERY_CLASSES = ("read", "write", "batch")
+
+    _sql: Dict[str, str] = {}
+    _hot: Dict[str, bool] = {}
+    _class: Dict[str, str] = {}
+    _shapes: Dict[Tuple[str, Hashable], str] = {}
+    _seen: Dict[int, Set[str]] = {}
+    _stats: Dict[str, Dict[str, int]] = {}
+
+    # -------------------------
+    # Registro
+    # -------------------------
+    @classmethod
+    def register(cls, name: str, sql: str, hot: bool = False, query_class: str = "read") -> str:
+        if query_class not in cls.QUERY_CLASSES:
+            raise ValueError(f"Unknown query class: {query_class}")
+        existing = cls._sql.get(name)
+        if existing is not None and existing != sql:
+            raise ValueError(f"Query {name} already registered with different SQL")
+        cls._sql[name] = sql
+        cls._class[name] = query_class
+        cls._hot[name] = cls._hot.get(name, False) or hot
+        cls._stats.setdefault(name, {"hits": 0, "misses": 0})
+        return name
+
+    @classmethod
+    def shaped(
+        cls, name: str, shape: Hashable, build: Callable[[], str], hot: bool = False, query_class: str = "read"
+    ) -> str:
+        """Nombre registrado para esta forma; build() solo se llama la primera vez."""
+        key = (name, shape)
+        registered = cls._shapes.get(key)
+        if registered is None:
+            if sum(1 for n, _ in cls._shapes if n == name) >= cls.MAX_SHAPES:
+                raise RuntimeError(f"Too many statement shapes for {name}")
+            registered = cls.register(f"{name}[{shape}]", build(), hot=hot, query_class=query_class)
+            cls._shapes[key] = registered
+        return registered
+
+    @classmethod
+    def sql(cls, name: str) -> str:
+        return cls._sql[name]
+
+    # -------------------------
+    # Conexiones
+    # -------------------------
+    @classmethod
+    async def prepare_connection(cls, conn) -> None:
+        """Calienta la LRU de asyncpg con las sentencias hot (conexión cruda, en init)."""
+        pid = conn.get_server_pid()
+        seen = cls._seen[pid] = set()
+        conn.add_termination_listener(lambda c: cls._seen.pop(pid, None))
+        # Mismo camino que usa conn.fetch(): deja la sentencia en la caché de la conexión
+        warm = getattr(conn, "_get_statement", None)
+        if warm is None:
+            return
+        for name, sql in cls._sql.items():
+            if not cls._hot[name]:
+                continue
+            try:
+                await warm(sql, None)
+            except Exception:
+                # Una sentencia rota (p. ej. migración pendiente) no debe tumbar la conexión
+                logger.warning("Could not prepare %s", name, exc_info=True)
+            else:
+                seen.add(name)
+
+    @classmethod
+    def _count(cls, conn, name: str) -> None:
+        seen = cls._seen.setdefault(conn.get_server_pid(), set())
+        stats = cls._stats[name]
+        if name in seen:
+            stats["hits"] += 1
+        else:
+            stats["misses"] += 1
+            seen.add(name)
+
+    # -------------------------
+    # Ejecución
+    # -------------------------
+    @classmethod
+    async def _run(cls, conn, name: str, method: str, args):
+        cls._count(conn, name)
+        query_class = cls._class[name]
+        start = time.perf_counter()
+        try:
+            return await getattr(conn, method)(cls._sql[name], *args, timeout=cls._budget(query_class))
+        except asyncio.TimeoutError:
+            # asyncpg ya canceló la query en el servidor
+            PoolMetrics.query_timeout(query_class)
+            raise QueryTimeout(name, query_class) from None
+        finally:
+            PoolMetrics.observe_query(query_class, time.perf_counter() - start)
+
+    @staticmethod
+    def _budget(query_class: str) -> float:
+        return getattr(settings, f"db_timeout_{query_class}")
+
+    @classmethod
+    async def fetch(cls, conn, name: str, *args):
+        return await cls._run(conn, name, "fetch", args)
+
+    @classmethod
+    async def fetchrow(cls, conn, name: str, *args):
+        return await cls._run(conn, name, "fetchrow", args)
+
+    @classmethod
+    async def fetchval(cls, conn, name: str, *args):
+        return await cls._run(conn, name, "fetchval", args)
+
+    @classmethod
+    async def execute(cls, conn, name: str, *args) -> str:
+        return await cls._run(conn, name, "execute", args)
+
+    # -------------------------
+    # Métricas
+    # -------------------------
+    @classmethod
+    def stats(cls) -> dict:
+        hits = sum(s["hits"] for s in cls._stats.values())
+        misses = sum(s["misses"] for s in cls._stats.values())
+        return {
+            "registered": len(cls._sql),
+            "hot": sum(1 for h in cls._hot.values() if h),
+            "shapes": len(cls._shapes),
+            # Si registered supera la LRU de asyncpg, los hits son optimistas
+            "statement_cache_size": settings.db_statement_cache_size,
+            "connections": len(cls._seen),
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": round(hits / (hits + misses), 4) if hits + misses else None,
+            "queries": {name: dict(s, query_class=cls._class[name]) for name, s in cls._stats.items()},
+        }
@@ -0,0 +1,181 @@
+# infrastructure/external/live_events.py
+import asyncio
+import json
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, List, Optional, Set, Tuple
+
+from config.settings import settings
+from infrastructure.external.redis_client import RedisClient
+from infrastructure.external.redis_pubsub import RedisPubSub
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class LiveEvent:
+    seq: int
+    type: str
+    coalesce: Optional[str]
+    raw: str                       # JSON ya serializado: se envía tal cual a cada conexión
+
+
+class LiveSubscriber:
+    """
+    Cola de una conexión. Acotada: los eventos con la misma clave de coalescing se sustituyen
+    por el último (p. ej. "standings"), y si aun así el cliente no da abasto se descarta lo
+    pendiente y se le pide que resincronice en vez de acumular memoria sin límite.
+    """
+
+    def __init__(self, max_pending: int):
+        self._pending: "OrderedDict[Hashable, LiveEvent]" = OrderedDict()
+        self._ready = asyncio.Event()
+        self._max_pending = max_pending
+        self._resync = False
+
+    def push(self, event: LiveEvent) -> None:
+        key = event.coalesce or event.seq
+        self._pending.pop(key, None)
+        self._pending[key] = event
+        if len(self._pending) > self._max_pending:
+            self.request_resync()
+        self._ready.set()
+
+    def request_resync(self) -> None:
+        self._pending.clear()
+        self._resync = True
+        self._ready.set()
+
+    async def get(self, timeout: float) -> Optional[Tuple[bool, List[LiveEvent]]]:
+        """(resync, eventos en orden de seq) o None si no llegó nada en `timeout`."""
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        self._ready.clear()
+        events = sorted(self._pending.values(), key=lambda e: e.seq)
+        self._pending.clear()
+        resync, self._resync = self._resync, False
+        return resync, events
+
+
+class LiveEvents:
+    """
+    Canal de eventos por torneo.
+
+    publish() asigna el número de secuencia, guarda el evento en un buffer acotado (para
+    reanudar tras reconectar) y lo publica en un único canal Redis, todo en un script Lua.
+    Cada worker recibe el canal vía RedisPubSub y reparte a sus conexiones locales.
+    """
+
+    CHANNEL = "live:tournaments"
+    # Hash tag {id}: secuencia y buffer del torneo en el mismo slot
+    SEQ_KEY = "live:{{{id}}}:seq"
+    LOG_KEY = "live:{{{id}}}:log"
+
+    _PUBLISH_LUA = """
+    local seq = redis.call('INCR', KEYS[1])
+    local event = '{"seq":' .. seq .. ',' .. ARGV[1]
+    redis.call('RPUSH', KEYS[2], event)
+    redis.call('LTRIM', KEYS[2], -tonumber(ARGV[2]), -1)
+    redis.call('EXPIRE', KEYS[1], ARGV[3])
+    redis.call('EXPIRE', KEYS[2], ARGV[3])
+    redis.call('PUBLISH', ARGV[4], event)
+    return seq
+    """
+
+    _subscribers: Dict[str, Set[LiveSubscriber]] = {}
+
+    # -------------------------
+    # Publicación
+    # -------------------------
+    @classmethod
+    async def publish(cls, tournament_id, event_type: str, data: Any, coalesce: Optional[str] = None) -> int:
+        key = str(tournament_id)
+        body = json.dumps(
+            {"tournament_id": key, "type": event_type, "coalesce": coalesce, "data": data},
+            separators=(",", ":"),
+            default=str,
+        )
+        return await RedisClient.get_client().eval(
+            cls._PUBLISH_LUA,
+            2,
+            cls.SEQ_KEY.format(id=key),
+            cls.LOG_KEY.format(id=key),
+            body[1:],                               # sin la "{" inicial: el script antepone seq
+            settings.live_buffer_size,
+            settings.live_buffer_ttl,
+            cls.CHANNEL,
+        )
+
+    @classmethod
+    async def replay(cls, tournament_id, since: int) -> Tuple[bool, List[LiveEvent]]:
+        """
+        Eventos con seq > since desde el buffer. complete=False si el buffer ya no llega
+        hasta `since` (o la secuencia se reinició): el cliente tiene que resincronizar.
+        """
+        key = str(tournament_id)
+        redis = RedisClient.get_client()
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.get(cls.SEQ_KEY.format(id=key))
+            pipe.lrange(cls.LOG_KEY.format(id=key), 0, -1)
+            current, raw_events = await pipe.execute()
+        current = int(current or 0)
+        events = [cls._parse(raw) for raw in raw_events]
+        if since > current or (since < current and (not events or events[0].seq > since + 1)):
+            return False, []
+        return True, [e for e in events if e.seq > since]
+
+    @classmethod
+    def resync_event(cls, tournament_id, seq: int) -> LiveEvent:
+        raw = json.dumps({"seq": seq, "tournament_id": str(tournament_id), "type": "resync", "data": None})
+        return LiveEvent(seq=seq, type="resync", coalesce=None, raw=raw)
+
+    # -------------------------
+    # Conexiones locales
+    # -------------------------
+    @classmethod
+    def subscribe(cls, tournament_id) -> LiveSubscriber:
+        subscriber = LiveSubscriber(settings.live_max_pending)
+        cls._subscribers.setdefault(str(tournament_id), set()).add(subscriber)
+        return subscriber
+
+    @classmethod
+    def unsubscribe(cls, tournament_id, subscriber: LiveSubscriber) -> None:
+        key = str(tournament_id)
+        subscribers = cls._subscribers.get(key)
+        if subscribers is not None:
+            subscribers.discard(subscriber)
+            if not subscribers:
+                del cls._subscribers[key]
+
+    @classmethod
+    def connections(cls) -> int:
+        return sum(len(s) for s in cls._subscribers.values())
+
+    @staticmethod
+    def _parse(raw: str) -> LiveEvent:
+        event = json.loads(raw)
+        return LiveEvent(seq=event["seq"], type=event["type"], coalesce=event.get("coalesce"), raw=raw)
+
+    @classmethod
+    def _dispatch(cls, raw: str) -> None:
+        # Un solo json.loads por evento y worker; las conexiones reciben el mismo string
+        event = json.loads(raw)
+        subscribers = cls._subscribers.get(event["tournament_id"])
+        if not subscribers:
+            return
+        live = LiveEvent(seq=event["seq"], type=event["type"], coalesce=event.get("coalesce"), raw=raw)
+        for subscriber in subscribers:
+            subscriber.push(live)
+
+    @classmethod
+    def _on_reconnect(cls) -> None:
+        # Lo publicado mientras estábamos desconectados se perdió: todos a resincronizar
+        for subscribers in cls._subscribers.values():
+            for subscriber in subscribers:
+                subscriber.request_resync()
+
+
+RedisPubSub.register(LiveEvents.CHANNEL, LiveEvents._dispatch, on_connect=LiveEvents._on_reconnect)
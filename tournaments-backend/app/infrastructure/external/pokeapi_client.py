@@ -1,26 +1,99 @@
 import json
 import asyncio
+import logging
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
 import httpx
 
+from config.settings import settings
+from domain.repositories.dashboard_player.pokemon_repository import PokemonAPIRepository
+from infrastructure.cache.ttl_lru import TTLLRUCache
 from infrastructure.external.redis_client import RedisClient
+from infrastructure.external.pokeapi_projections import (
+    project_move,
+    project_name_index,
+    project_pokemon,
+    project_species,
+)
+
+try:
+    # Serialización compacta y rápida para los valores cacheados
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover
+    def _dumps(value) -> str:
+        return json.dumps(value, separators=(",", ":"))
+
+    _loads = json.loads
+
+logger = logging.getLogger(__name__)
+
+# Libera el lease solo si sigue siendo nuestro (puede haber caducado y tenerlo otro worker)
+_RELEASE_LEASE_LUA = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
 
 
 class PokeAPINotFound(Exception):
     pass
 
 
-class PokeAPIClient:
-    BASE_URL = "https://pokeapi.co/api/v2"
-    TIMEOUT = 10.0
+# 404 cacheado: centinela en el L1 y marca en Redis (no es JSON válido, no choca con datos)
+_NOT_FOUND = object()
+_NOT_FOUND_MARK = "!404"
+
+
+class PokeAPIClient(PokemonAPIRepository):
     MAX_RETRIES = 2
 
     _semaphore = asyncio.Semaphore(5)
 
-    def __init__(self):
-        self._client = httpx.AsyncClient(
-            base_url=self.BASE_URL,
-            timeout=self.TIMEOUT
-        )
+    _local = TTLLRUCache(settings.POKEAPI_LOCAL_CACHE_SIZE, ttl=settings.POKEAPI_LOCAL_CACHE_TTL)
+    _inflight: Dict[str, "asyncio.Future"] = {}
+
+    # Un único httpx.AsyncClient por worker: reutiliza conexiones (keep-alive / HTTP/2)
+    # en vez de pagar un handshake TLS por cada instancia. Se abre/cierra en el lifespan.
+    _http: Optional[httpx.AsyncClient] = None
+
+    @classmethod
+    def open(cls) -> httpx.AsyncClient:
+        if cls._http is None:
+            http2 = settings.POKEAPI_HTTP2
+            if http2:
+                try:
+                    import h2  # noqa: F401  (httpx[http2])
+                except ImportError:
+                    logger.warning("h2 not installed, PokeAPI client falls back to HTTP/1.1")
+                    http2 = False
+            cls._http = httpx.AsyncClient(
+                base_url=settings.POKEAPI_BASE_URL,
+                timeout=settings.POKEAPI_TIMEOUT,
+                http2=http2,
+                limits=httpx.Limits(
+                    max_connections=settings.POKEAPI_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.POKEAPI_MAX_KEEPALIVE,
+                    keepalive_expiry=settings.POKEAPI_KEEPALIVE_EXPIRY,
+                ),
+            )
+        return cls._http
+
+    @classmethod
+    async def close(cls) -> None:
+        if cls._http is not None:
+            await cls._http.aclose()
+            cls._http = None
+
+    @property
+    def _client(self) -> httpx.AsyncClient:
+        # Fuera del lifespan (scripts, shell) se abre bajo demanda
+        return PokeAPIClient._http or PokeAPIClient.open()
 
     async def _get(self, path: str):
         retries = 0
@@ -41,45 +114,160 @@ class PokeAPIClient:
             return response.json()
 
     async def _cached_get(self, cache_key: str, ttl: int, fetcher):
+        """
+        L1 en memoria → single-flight por clave → Redis → upstream (con lease en Redis).
+        Los 404 también se cachean (poco tiempo) y se relanzan como PokeAPINotFound.
+        Los objetos devueltos se comparten entre peticiones: no mutarlos.
+        """
+        data = self._local.get(cache_key)
+        if data is _NOT_FOUND:
+            raise PokeAPINotFound()
+        if data is not None:
+            return data
+
+        # Single-flight: las peticiones concurrentes de la misma clave esperan al mismo fill
+        fill = self._inflight.get(cache_key)
+        if fill is None:
+            fill = asyncio.ensure_future(self._fill(cache_key, ttl, fetcher))
+            self._inflight[cache_key] = fill
+            fill.add_done_callback(lambda _: self._inflight.pop(cache_key, None))
+        # shield: si se cancela una petición, el fill sigue para las demás
+        return await asyncio.shield(fill)
+
+    async def _fill(self, cache_key: str, ttl: int, fetcher):
         redis = None
+        cached = None
         try:
             redis = RedisClient.get_client()
             cached = await redis.get(cache_key)
-            if cached:
-                return json.loads(cached)
         except Exception:
             # Redis caído → seguimos sin cache
-            pass
+            redis = None
+        if cached:
+            return self._from_cache(cache_key, cached, ttl)
 
-        async with self._semaphore:
-            data = await fetcher()
-
-        # Solo cacheamos si el fetch fue correcto
+        lease_key = f"{cache_key}:lease"
+        lease = None
         if redis:
+            # Lease: solo un worker va a upstream; el resto espera a que aparezca el valor en Redis
             try:
-                await redis.set(cache_key, json.dumps(data), ex=ttl)
+                lease = uuid.uuid4().hex
+                if not await redis.set(lease_key, lease, nx=True, px=settings.POKEAPI_FILL_LEASE_MS):
+                    lease = None
+                    cached = await self._wait_for_fill(redis, cache_key, lease_key)
             except Exception:
-                pass
+                lease = None
+            if cached:
+                return self._from_cache(cache_key, cached, ttl)
 
+        try:
+            try:
+                async with self._semaphore:
+                    data = await fetcher()
+            except PokeAPINotFound:
+                # Negativo corto: un nombre mal escrito no vuelve a upstream en cada petición
+                if redis:
+                    try:
+                        await redis.set(cache_key, _NOT_FOUND_MARK, ex=settings.POKEAPI_NOT_FOUND_TTL)
+                    except Exception:
+                        pass
+                self._local.set(cache_key, _NOT_FOUND, ttl=settings.POKEAPI_NOT_FOUND_TTL)
+                raise
+
+            # Solo cacheamos si el fetch fue correcto
+            if redis:
+                try:
+                    await redis.set(cache_key, _dumps(data), ex=ttl)
+                except Exception:
+                    pass
+        finally:
+            if lease:
+                try:
+                    await redis.eval(_RELEASE_LEASE_LUA, 1, lease_key, lease)
+                except Exception:
+                    pass
+
+        return self._remember(cache_key, data, ttl)
+
+    async def _wait_for_fill(self, redis, cache_key: str, lease_key: str) -> Optional[str]:
+        # Espera con backoff hasta que el dueño del lease publique el valor. Si el lease
+        # desaparece sin valor (el dueño falló) o caduca, dejamos de esperar y vamos a upstream
+        deadline = time.monotonic() + settings.POKEAPI_FILL_LEASE_MS / 1000
+        delay = 0.02
+        while time.monotonic() < deadline:
+            await asyncio.sleep(delay)
+            async with redis.pipeline(transaction=False) as pipe:
+                pipe.get(cache_key)
+                pipe.exists(lease_key)
+                cached, leased = await pipe.execute()
+            if cached or not leased:
+                return cached
+            delay = min(delay * 2, 0.5)
+        return None
+
+    def _from_cache(self, cache_key: str, cached: str, ttl: int):
+        if cached == _NOT_FOUND_MARK:
+            self._local.set(cache_key, _NOT_FOUND, ttl=settings.POKEAPI_NOT_FOUND_TTL)
+            raise PokeAPINotFound()
+        return self._remember(cache_key, _loads(cached), ttl)
+
+    def _remember(self, cache_key: str, data, ttl: int):
+        self._local.set(cache_key, data, ttl=min(ttl, settings.POKEAPI_LOCAL_CACHE_TTL))
         return data
 
+    async def _get_projected(self, path: str, projection):
+        # Proyectamos antes de cachear: ni Redis ni el L1 ven el payload completo
+        return projection(await self._get(path))
+
+    # Prefijo versionado: cambia si cambia la forma de las proyecciones
+    KEY_PREFIX = "poke:v4"
+
     async def get_pokemon(self, id_or_name: str):
+        id_or_name = str(id_or_name).lower()
         return await self._cached_get(
-            f"poke:pokemon:{id_or_name}",
+            f"{self.KEY_PREFIX}:pokemon:{id_or_name}",
             ttl=60 * 60 * 24,
-            fetcher=lambda: self._get(f"/pokemon/{id_or_name}")
+            fetcher=lambda: self._get_projected(f"/pokemon/{id_or_name}", project_pokemon)
         )
 
     async def get_pokemon_species(self, id_or_name: str):
+        id_or_name = str(id_or_name).lower()
         return await self._cached_get(
-            f"poke:species:{id_or_name}",
+            f"{self.KEY_PREFIX}:species:{id_or_name}",
             ttl=60 * 60 * 24 * 7,
-            fetcher=lambda: self._get(f"/pokemon-species/{id_or_name}")
+            fetcher=lambda: self._get_projected(f"/pokemon-species/{id_or_name}", project_species)
         )
 
     async def get_move(self, id_or_name: str):
+        id_or_name = str(id_or_name).lower()
         return await self._cached_get(
-            f"poke:move:{id_or_name}",
+            f"{self.KEY_PREFIX}:move:{id_or_name}",
             ttl=60 * 60 * 24 * 7,
-            fetcher=lambda: self._get(f"/move/{id_or_name}")
+            fetcher=lambda: self._get_projected(f"/move/{id_or_name}", project_move)
         )
+
+    async def search_pokemon(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
+        # PokeAPI no tiene búsqueda: filtramos el índice completo de nombres (cacheado)
+        names = await self._cached_get(
+            f"{self.KEY_PREFIX}:pokemon-index",
+            ttl=60 * 60 * 24 * 7,
+            fetcher=lambda: self._get_projected("/pokemon?limit=100000", project_name_index)
+        )
+        query = query.lower()
+        return [{"name": name} for name in names if name.startswith(query)][:limit]
+
+
+# Instancia compartida: el estado (pool HTTP) vive en la clase, así que es barata de inyectar
+_pokeapi_client = PokeAPIClient()
+
+
+def get_pokeapi_client() -> PokemonAPIRepository:
+    """
+    Dependency: fuente de datos Pokémon de la aplicación.
+    Si hay un data pack local cargado se usa ese (sin red); si no, PokeAPI con el pool HTTP compartido.
+    """
+    from infrastructure.external.pokeapi_datapack import PokeDataPack
+
+    if PokeDataPack.is_loaded():
+        return PokeDataPack.instance()
+    return _pokeapi_client
@@ -0,0 +1,259 @@
+# infrastructure/external/pokeapi_datapack.py
+import logging
+import os
+import sqlite3
+from typing import Any, Dict, List, Optional, Set
+
+from config.settings import settings
+from domain.repositories.dashboard_player.pokemon_repository import PokemonAPIRepository
+from infrastructure.external.pokeapi_client import PokeAPINotFound
+
+logger = logging.getLogger(__name__)
+
+STAT_NAMES = ("hp", "attack", "defense", "special-attack", "special-defense", "speed")
+
+# Esquema del data pack. Lo genera pokeapi_datapack_import.py; FORMAT_VERSION sube si cambia.
+FORMAT_VERSION = "1"
+
+SCHEMA_SQL = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT) WITHOUT ROWID;
+
+CREATE TABLE species (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    generation TEXT,
+    is_legendary INTEGER NOT NULL DEFAULT 0,
+    is_mythical INTEGER NOT NULL DEFAULT 0,
+    is_baby INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE pokemon (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    species_id INTEGER NOT NULL,
+    is_default INTEGER NOT NULL DEFAULT 1,
+    height INTEGER, weight INTEGER, base_experience INTEGER,
+    type1 TEXT NOT NULL, type2 TEXT,
+    hp INTEGER, attack INTEGER, defense INTEGER,
+    special_attack INTEGER, special_defense INTEGER, speed INTEGER,
+    ev_hp INTEGER, ev_attack INTEGER, ev_defense INTEGER,
+    ev_special_attack INTEGER, ev_special_defense INTEGER, ev_speed INTEGER,
+    sprite_front TEXT, sprite_front_shiny TEXT, sprite_back TEXT, sprite_back_shiny TEXT
+);
+CREATE INDEX idx_pokemon_species ON pokemon (species_id);
+
+CREATE TABLE forms (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    pokemon_id INTEGER NOT NULL,
+    form_name TEXT,
+    is_mega INTEGER NOT NULL DEFAULT 0,
+    is_battle_only INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE moves (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    type TEXT, damage_class TEXT,
+    power INTEGER, accuracy INTEGER, pp INTEGER, priority INTEGER
+);
+
+CREATE TABLE abilities (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE, is_main_series INTEGER);
+
+CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE, category TEXT);
+
+CREATE TABLE pokemon_abilities (
+    pokemon_id INTEGER NOT NULL,
+    ability_id INTEGER NOT NULL,
+    slot INTEGER NOT NULL,
+    is_hidden INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (pokemon_id, slot)
+) WITHOUT ROWID;
+
+-- Learnset sin detalle de método/versión: solo si el Pokémon puede aprender el movimiento
+CREATE TABLE learnsets (
+    pokemon_id INTEGER NOT NULL,
+    move_id INTEGER NOT NULL,
+    PRIMARY KEY (pokemon_id, move_id)
+) WITHOUT ROWID;
+"""
+
+
+class PokeDataPack(PokemonAPIRepository):
+    """
+    Dataset PokeAPI local (SQLite de solo lectura, memory-mapped).
+    Se abre en el lifespan si POKEAPI_DATAPACK_PATH apunta a un fichero; los workers comparten
+    las páginas vía el page cache del SO. Devuelve los mismos dicts (forma PokeAPI, solo los campos
+    que usamos) que PokeAPIClient y lanza PokeAPINotFound igual que él.
+
+    Las consultas son lookups por PK sobre páginas mapeadas (microsegundos), así que se hacen
+    directamente en el event loop.
+    """
+
+    _conn: Optional[sqlite3.Connection] = None
+    _instance: Optional["PokeDataPack"] = None
+
+    @classmethod
+    def open(cls, path: Optional[str] = None) -> bool:
+        path = path or settings.POKEAPI_DATAPACK_PATH
+        if not path or not os.path.exists(path):
+            return False
+        conn = sqlite3.connect(f"file:{path}?mode=ro&immutable=1", uri=True, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute(f"PRAGMA mmap_size = {os.path.getsize(path)}")
+        conn.execute("PRAGMA query_only = 1")
+        version = conn.execute("SELECT value FROM meta WHERE key = 'format_version'").fetchone()
+        if not version or version["value"] != FORMAT_VERSION:
+            conn.close()
+            logger.warning("Ignoring PokeAPI data pack %s: unsupported format", path)
+            return False
+        cls._conn = conn
+        cls._instance = cls()
+        logger.info("PokeAPI data pack loaded from %s", path)
+        return True
+
+    @classmethod
+    def close(cls) -> None:
+        if cls._conn is not None:
+            cls._conn.close()
+            cls._conn = None
+            cls._instance = None
+
+    @classmethod
+    def is_loaded(cls) -> bool:
+        return cls._conn is not None
+
+    @classmethod
+    def instance(cls) -> "PokeDataPack":
+        return cls._instance
+
+    # -------------------------
+    # Helpers
+    # -------------------------
+    def _one(self, table: str, identifier: str) -> sqlite3.Row:
+        identifier = str(identifier).strip().lower()
+        column = "id" if identifier.isdigit() else "name"
+        row = self._conn.execute(
+            f"SELECT * FROM {table} WHERE {column} = ?",
+            (int(identifier) if column == "id" else identifier,),
+        ).fetchone()
+        if row is None:
+            raise PokeAPINotFound()
+        return row
+
+    # -------------------------
+    # PokemonAPIRepository
+    # -------------------------
+    async def get_pokemon(self, identifier: str) -> Dict[str, Any]:
+        row = self._one("pokemon", identifier)
+        species = self._conn.execute(
+            "SELECT name FROM species WHERE id = ?", (row["species_id"],)
+        ).fetchone()
+        abilities = self._conn.execute(
+            """
+            SELECT a.name, pa.slot, pa.is_hidden
+            FROM pokemon_abilities pa JOIN abilities a ON a.id = pa.ability_id
+            WHERE pa.pokemon_id = ? ORDER BY pa.slot
+            """,
+            (row["id"],),
+        ).fetchall()
+        moves = self._conn.execute(
+            """
+            SELECT m.id, m.name FROM learnsets l JOIN moves m ON m.id = l.move_id
+            WHERE l.pokemon_id = ? ORDER BY m.id
+            """,
+            (row["id"],),
+        ).fetchall()
+
+        types = [{"slot": 1, "type": {"name": row["type1"]}}]
+        if row["type2"]:
+            types.append({"slot": 2, "type": {"name": row["type2"]}})
+
+        return {
+            "id": row["id"],
+            "name": row["name"],
+            "height": row["height"],
+            "weight": row["weight"],
+            "base_experience": row["base_experience"] or 0,
+            "is_default": bool(row["is_default"]),
+            "species": {"id": row["species_id"], "name": species["name"] if species else row["name"]},
+            "types": types,
+            "stats": [
+                {
+                    "base_stat": row[name.replace("-", "_")],
+                    "effort": row["ev_" + name.replace("-", "_")],
+                    "stat": {"name": name},
+                }
+                for name in STAT_NAMES
+            ],
+            "abilities": [
+                {"ability": {"name": a["name"]}, "slot": a["slot"], "is_hidden": bool(a["is_hidden"])}
+                for a in abilities
+            ],
+            "moves": [{"move": {"id": m["id"], "name": m["name"]}} for m in moves],
+            "sprites": {
+                "front_default": row["sprite_front"],
+                "front_shiny": row["sprite_front_shiny"],
+                "back_default": row["sprite_back"],
+                "back_shiny": row["sprite_back_shiny"],
+            },
+        }
+
+    async def get_pokemon_species(self, identifier: str) -> Dict[str, Any]:
+        row = self._one("species", identifier)
+        varieties = self._conn.execute(
+            "SELECT name, is_default FROM pokemon WHERE species_id = ? ORDER BY id",
+            (row["id"],),
+        ).fetchall()
+        return {
+            "id": row["id"],
+            "name": row["name"],
+            "generation": {"name": row["generation"]},
+            "is_legendary": bool(row["is_legendary"]),
+            "is_mythical": bool(row["is_mythical"]),
+            "is_baby": bool(row["is_baby"]),
+            "varieties": [
+                {"is_default": bool(v["is_default"]), "pokemon": {"name": v["name"]}}
+                for v in varieties
+            ],
+        }
+
+    async def get_move(self, identifier: str) -> Dict[str, Any]:
+        row = self._one("moves", identifier)
+        return {
+            "id": row["id"],
+            "name": row["name"],
+            "type": {"name": row["type"]},
+            "damage_class": {"name": row["damage_class"]},
+            "power": row["power"],
+            "accuracy": row["accuracy"],
+            "pp": row["pp"],
+            "priority": row["priority"],
+        }
+
+    async def search_pokemon(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
+        # Prefijo sobre el índice UNIQUE(name): range scan, sin recorrer la tabla
+        prefix = query.strip().lower()
+        rows = self._conn.execute(
+            "SELECT id, name FROM pokemon WHERE name >= ? AND name < ? ORDER BY name LIMIT ?",
+            (prefix, prefix + "\uffff", limit),
+        ).fetchall()
+        return [{"id": r["id"], "name": r["name"]} for r in rows]
+
+    # -------------------------
+    # Extras (solo data pack)
+    # -------------------------
+    async def get_ability(self, identifier: str) -> Dict[str, Any]:
+        row = self._one("abilities", identifier)
+        return {"id": row["id"], "name": row["name"], "is_main_series": bool(row["is_main_series"])}
+
+    async def get_item(self, identifier: str) -> Dict[str, Any]:
+        row = self._one("items", identifier)
+        return {"id": row["id"], "name": row["name"], "category": {"name": row["category"]}}
+
+    async def get_learnset(self, pokemon_id: int) -> Set[str]:
+        rows = self._conn.execute(
+            "SELECT m.name FROM learnsets l JOIN moves m ON m.id = l.move_id WHERE l.pokemon_id = ?",
+            (pokemon_id,),
+        ).fetchall()
+        return {r["name"] for r in rows}
@@ -0,0 +1,144 @@
+# infrastructure/external/pokeapi_datapack_import.py
+"""
+Genera el data pack local a partir de un volcado de PokeAPI (repo PokeAPI/api-data,
+directorio data/api/v2 con <recurso>/<id>/index.json).
+
+Uso (desde app/):
+    python -m infrastructure.external.pokeapi_datapack_import /ruta/api-data/data/api/v2 pokedata.sqlite
+
+Después basta con POKEAPI_DATAPACK_PATH=pokedata.sqlite para que la app lo cargue al arrancar.
+"""
+import argparse
+import json
+import os
+import sqlite3
+import sys
+from typing import Any, Dict, Iterator, Optional
+
+from infrastructure.external.pokeapi_datapack import FORMAT_VERSION, SCHEMA_SQL, STAT_NAMES
+
+
+def _iter_resource(root: str, resource: str) -> Iterator[Dict[str, Any]]:
+    base = os.path.join(root, resource)
+    if not os.path.isdir(base):
+        return
+    for entry in os.scandir(base):
+        path = os.path.join(entry.path, "index.json")
+        if entry.is_dir() and os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                yield json.load(f)
+
+
+def _id_from_url(url: Optional[str]) -> Optional[int]:
+    # ".../pokemon-species/25/" → 25
+    if not url:
+        return None
+    return int(url.rstrip("/").rsplit("/", 1)[-1])
+
+
+def _name(ref: Optional[Dict[str, Any]]) -> Optional[str]:
+    return ref.get("name") if ref else None
+
+
+def build(root: str, out_path: str) -> Dict[str, int]:
+    if os.path.exists(out_path):
+        os.remove(out_path)
+    conn = sqlite3.connect(out_path)
+    conn.executescript(SCHEMA_SQL)
+    counts: Dict[str, int] = {}
+
+    with conn:
+        rows = [
+            (
+                s["id"], s["name"], _name(s.get("generation")),
+                int(s.get("is_legendary", False)), int(s.get("is_mythical", False)), int(s.get("is_baby", False)),
+            )
+            for s in _iter_resource(root, "pokemon-species")
+        ]
+        conn.executemany("INSERT INTO species VALUES (?, ?, ?, ?, ?, ?)", rows)
+        counts["species"] = len(rows)
+
+        rows = [
+            (
+                m["id"], m["name"], _name(m.get("type")), _name(m.get("damage_class")),
+                m.get("power"), m.get("accuracy"), m.get("pp"), m.get("priority"),
+            )
+            for m in _iter_resource(root, "move")
+        ]
+        conn.executemany("INSERT INTO moves VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        counts["moves"] = len(rows)
+
+        rows = [(a["id"], a["name"], int(a.get("is_main_series", True))) for a in _iter_resource(root, "ability")]
+        conn.executemany("INSERT INTO abilities VALUES (?, ?, ?)", rows)
+        counts["abilities"] = len(rows)
+
+        rows = [(i["id"], i["name"], _name(i.get("category"))) for i in _iter_resource(root, "item")]
+        conn.executemany("INSERT INTO items VALUES (?, ?, ?)", rows)
+        counts["items"] = len(rows)
+
+        rows = [
+            (
+                f["id"], f["name"], _id_from_url((f.get("pokemon") or {}).get("url")), f.get("form_name"),
+                int(f.get("is_mega", False)), int(f.get("is_battle_only", False)),
+            )
+            for f in _iter_resource(root, "pokemon-form")
+        ]
+        conn.executemany("INSERT INTO forms VALUES (?, ?, ?, ?, ?, ?)", rows)
+        counts["forms"] = len(rows)
+
+        pokemon_rows, ability_rows, learnset_rows = [], [], []
+        for p in _iter_resource(root, "pokemon"):
+            types = {t["slot"]: _name(t["type"]) for t in p.get("types", [])}
+            stats = {s["stat"]["name"]: s for s in p.get("stats", [])}
+            sprites = p.get("sprites") or {}
+            pokemon_rows.append(
+                (
+                    p["id"], p["name"], _id_from_url(p["species"]["url"]), int(p.get("is_default", True)),
+                    p.get("height"), p.get("weight"), p.get("base_experience"),
+                    types.get(1), types.get(2),
+                    *(stats.get(n, {}).get("base_stat") for n in STAT_NAMES),
+                    *(stats.get(n, {}).get("effort") for n in STAT_NAMES),
+                    sprites.get("front_default"), sprites.get("front_shiny"),
+                    sprites.get("back_default"), sprites.get("back_shiny"),
+                )
+            )
+            for a in p.get("abilities", []):
+                ability_rows.append((p["id"], _id_from_url(a["ability"]["url"]), a["slot"], int(a.get("is_hidden", False))))
+            for m in p.get("moves", []):
+                learnset_rows.append((p["id"], _id_from_url(m["move"]["url"])))
+
+        conn.executemany(f"INSERT INTO pokemon VALUES ({', '.join('?' * 25)})", pokemon_rows)
+        conn.executemany("INSERT OR IGNORE INTO pokemon_abilities VALUES (?, ?, ?, ?)", ability_rows)
+        conn.executemany("INSERT OR IGNORE INTO learnsets VALUES (?, ?)", learnset_rows)
+        counts["pokemon"] = len(pokemon_rows)
+        counts["learnsets"] = len(learnset_rows)
+
+        conn.executemany(
+            "INSERT INTO meta VALUES (?, ?)",
+            [("format_version", FORMAT_VERSION), ("source", os.path.abspath(root))],
+        )
+
+    # Fichero de solo lectura: compactamos y dejamos estadísticas para el planner
+    conn.execute("ANALYZE")
+    conn.execute("VACUUM")
+    conn.close()
+    return counts
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Build the local PokeAPI data pack")
+    parser.add_argument("source", help="PokeAPI api-data dump (data/api/v2)")
+    parser.add_argument("output", help="SQLite file to write")
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.source):
+        print(f"Source directory not found: {args.source}", file=sys.stderr)
+        return 1
+    counts = build(args.source, args.output)
+    for table, count in counts.items():
+        print(f"{table}: {count}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+# infrastructure/external/pokeapi_projections.py
+"""
+Proyecciones de los payloads de PokeAPI: solo los campos que usa la app, con la misma
+forma (anidada tipo PokeAPI) para que los consumidores no cambien. Se aplican antes de
+cachear, así Redis y el L1 guardan unos pocos KB en vez de los 200–400 KB de /pokemon/{id}.
+
+Es la misma forma que devuelve PokeDataPack.
+"""
+from typing import Any, Dict, List, Optional
+
+SPRITE_FIELDS = ("front_default", "front_shiny", "back_default", "back_shiny")
+
+
+def _name(ref: Optional[Dict[str, Any]]) -> Optional[str]:
+    return ref.get("name") if ref else None
+
+
+def _id(ref: Optional[Dict[str, Any]]) -> Optional[int]:
+    # {"name": ..., "url": ".../pokemon-species/25/"} → 25
+    if not ref or not ref.get("url"):
+        return None
+    return int(ref["url"].rstrip("/").rsplit("/", 1)[-1])
+
+
+def project_pokemon(raw: Dict[str, Any]) -> Dict[str, Any]:
+    sprites = raw.get("sprites") or {}
+    return {
+        "id": raw["id"],
+        "name": raw["name"],
+        "height": raw.get("height"),
+        "weight": raw.get("weight"),
+        "base_experience": raw.get("base_experience") or 0,
+        "is_default": raw.get("is_default", True),
+        # Con el id de la especie no hace falta pedir /pokemon-species solo para species_id
+        "species": {"id": _id(raw.get("species")), "name": _name(raw.get("species"))},
+        "types": [
+            {"slot": t["slot"], "type": {"name": _name(t["type"])}}
+            for t in raw.get("types", [])
+        ],
+        "stats": [
+            {"base_stat": s["base_stat"], "effort": s["effort"], "stat": {"name": _name(s["stat"])}}
+            for s in raw.get("stats", [])
+        ],
+        "abilities": [
+            {"ability": {"name": _name(a["ability"])}, "slot": a["slot"], "is_hidden": a.get("is_hidden", False)}
+            for a in raw.get("abilities", [])
+        ],
+        # Sin version_group_details (el grueso del payload): solo qué movimientos puede aprender
+        "moves": [{"move": {"id": _id(m["move"]), "name": _name(m["move"])}} for m in raw.get("moves", [])],
+        "sprites": {field: sprites.get(field) for field in SPRITE_FIELDS},
+    }
+
+
+def project_species(raw: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "id": raw["id"],
+        "name": raw["name"],
+        "generation": {"name": _name(raw.get("generation"))},
+        "is_legendary": raw.get("is_legendary", False),
+        "is_mythical": raw.get("is_mythical", False),
+        "is_baby": raw.get("is_baby", False),
+        "varieties": [
+            {"is_default": v.get("is_default", False), "pokemon": {"name": _name(v.get("pokemon"))}}
+            for v in raw.get("varieties", [])
+        ],
+    }
+
+
+def project_move(raw: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "id": raw["id"],
+        "name": raw["name"],
+        "type": {"name": _name(raw.get("type"))},
+        "damage_class": {"name": _name(raw.get("damage_class"))},
+        "power": raw.get("power"),
+        "accuracy": raw.get("accuracy"),
+        "pp": raw.get("pp"),
+        "priority": raw.get("priority"),
+    }
+
+
+def project_name_index(raw: Dict[str, Any]) -> List[str]:
+    # /pokemon?limit=N → solo los nombres
+    return [r["name"] for r in raw.get("results", [])]
@@ -0,0 +1,86 @@
+# infrastructure/external/redis_pubsub.py
+import asyncio
+import inspect
+import logging
+from typing import Awaitable, Callable, Dict, List, Optional, Union
+
+from infrastructure.external.redis_client import RedisClient
+
+logger = logging.getLogger(__name__)
+
+Handler = Callable[[str], Union[None, Awaitable[None]]]
+OnConnect = Callable[[], Union[None, Awaitable[None]]]
+
+
+class RedisPubSub:
+    """
+    Una única suscripción pub/sub por worker que reparte los mensajes por canal.
+    Los módulos registran su canal al importarse; start()/stop() se llaman en el lifespan.
+
+    on_connect se ejecuta tras cada (re)conexión: como los mensajes publicados mientras
+    estábamos desconectados se pierden, es el sitio para vaciar o recargar estado local.
+    """
+
+    _handlers: Dict[str, Handler] = {}
+    _on_connect: List[OnConnect] = []
+    _task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def register(cls, channel: str, handler: Handler, on_connect: Optional[OnConnect] = None) -> None:
+        cls._handlers[channel] = handler
+        if on_connect is not None:
+            cls._on_connect.append(on_connect)
+
+    @classmethod
+    async def publish(cls, channel: str, message: str) -> None:
+        await RedisClient.get_client().publish(channel, message)
+
+    @classmethod
+    def start(cls) -> None:
+        if cls._task is None or cls._task.done():
+            cls._task = asyncio.create_task(cls._listen())
+
+    @classmethod
+    async def stop(cls) -> None:
+        if cls._task:
+            cls._task.cancel()
+            try:
+                await cls._task
+            except asyncio.CancelledError:
+                pass
+            cls._task = None
+
+    @classmethod
+    async def _listen(cls) -> None:
+        while True:
+            pubsub = None
+            try:
+                pubsub = RedisClient.get_client().pubsub()
+                await pubsub.subscribe(*cls._handlers.keys())
+                for callback in cls._on_connect:
+                    await cls._maybe_await(callback())
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    handler = cls._handlers.get(message["channel"])
+                    if handler is not None:
+                        try:
+                            await cls._maybe_await(handler(message["data"]))
+                        except Exception:
+                            logger.exception("Pub/sub handler failed for %s", message["channel"])
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("Redis pub/sub connection lost, retrying", exc_info=True)
+                await asyncio.sleep(1)
+            finally:
+                if pubsub is not None:
+                    try:
+                        await pubsub.close()
+                    except Exception:
+                        pass
+
+    @staticmethod
+    async def _maybe_await(result) -> None:
+        if inspect.isawaitable(result):
+            await result
@@ -0,0 +1,106 @@
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+from infrastructure.database.connection import DatabaseConnection
+from infrastructure.database.query_registry import QueryRegistry
+from infrastructure.repositories.admin.rounds_repo import SEEDED_PARTICIPANTS_SQL
+
+
+async def fetch_seeded_participants(tournament_id: UUID, formula: str) -> List[UUID]:
+    pool = await DatabaseConnection.get_pool()
+    async with pool.acquire() as conn:
+        rows = await conn.fetch(SEEDED_PARTICIPANTS_SQL, tournament_id, formula)
+    return [r["id"] for r in rows]
+
+
+
+
+async def insert_bracket(tournament_id: UUID, kind: str, size: int, entrants: List[UUID], arrays: Dict[str, List[int]]) -> Optional[dict]:
+    """Devuelve None si el torneo ya tiene cuadro."""
+    pool = await DatabaseConnection.get_pool()
+    async with pool.acquire() as conn:
+        row = await conn.fetchrow(
+            """
+            INSERT INTO tournament_brackets
+                (tournament_id, kind, size, entrants, slot_a, slot_b, winner, score_a, score_b, reported_at)
+            VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, array_fill(NULL::timestamptz, ARRAY[cardinality($7::integer[])]))
+            ON CONFLICT (tournament_id) DO NOTHING
+            RETURNING *
+            """,
+            tournament_id, kind, size, entrants,
+            arrays["slot_a"], arrays["slot_b"], arrays["winner"], arrays["score_a"], arrays["score_b"],
+        )
+    return dict(row) if row else None
+
+
+
+
+async def fetch_bracket(tournament_id: UUID) -> Optional[dict]:
+    pool = await DatabaseConnection.get_pool()
+    async with pool.acquire() as conn:
+        row = await conn.fetchrow("SELECT * FROM tournament_brackets WHERE tournament_id = $1", tournament_id)
+    return dict(row) if row else None
+
+
+
+
+def _update_statement(count: int) -> Tuple[str, int]:
+    """
+    UPDATE que asigna solo los índices cambiados (slot_a[i] = ..., varios subíndices de la
+    misma columna en una sentencia) y fecha la partida reportada ($3). El nº de índices se
+    redondea a potencia de 2 (repitiendo el último) para que haya pocas formas de SQL.
+    """
+    padded = 1 << max(count - 1, 0).bit_length()
+
+    def build() -> str:
+        sets = ["reported_at[$3] = now()"]
+        for k in range(padded):
+            base = 4 + 6 * k
+            idx = f"${base}"
+            sets.extend((
+                f"slot_a[{idx}] = ${base + 1}",
+                f"slot_b[{idx}] = ${base + 2}",
+                f"winner[{idx}] = ${base + 3}",
+                f"score_a[{idx}] = ${base + 4}",
+                f"score_b[{idx}] = ${base + 5}",
+            ))
+        return f"""
+            UPDATE tournament_brackets
+            SET {", ".join(sets)}, version = version + 1, updated_at = now()
+            WHERE tournament_id = $1 AND version = $2
+            RETURNING version
+        """
+
+    return QueryRegistry.shaped("brackets.report", padded, build, query_class="write"), padded
+
+
+
+
+async def update_bracket(
+    tournament_id: UUID,
+    expected_version: int,
+    reported: int,
+    changes: List[Tuple[int, int, int, int, int, int]],
+) -> Optional[int]:
+    """
+    Guarda solo las partidas cambiadas, (m, a, b, winner, score_a, score_b), si nadie tocó el
+    cuadro desde que se leyó (control optimista por version). `reported` es la partida jugada:
+    solo ella recibe reported_at (las que avanzan por BYE no son resultados).
+    Devuelve la nueva versión o None si hubo conflicto.
+    """
+    statement, padded = _update_statement(len(changes))
+    changes = list(changes) + [changes[-1]] * (padded - len(changes))
+    args = []
+    for m, a, b, winner, score_a, score_b in changes:
+        args.extend((m + 1, a, b, winner, score_a, score_b))       # arrays de Postgres: base 1
+    pool = await DatabaseConnection.get_pool()
+    async with pool.acquire() as conn:
+        return await QueryRegistry.fetchval(conn, statement, tournament_id, expected_version, reported + 1, *args)
+
+
+
+
+async def delete_bracket(tournament_id: UUID) -> bool:
+    pool = await DatabaseConnection.get_pool()
+    async with pool.acquire() as conn:
+        res = await conn.execute("DELETE FROM tournament_brackets WHERE tournament_id = $1", tournament_id)
+    return res.endswith("1")
@@ -1,4 +1,5 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 from uuid import UUID
 from infrastructure.database.connection import DatabaseConnection
 
@@ -15,15 +16,92 @@ async def fetch_registrations(status: Optional[str], skip: int, limit: int) -> L
 
 
 
+# Columnas de la cola: sin game_specific_data, con nombre del equipo y miembros inscritos
+REVIEW_QUEUE_SELECT = """
+SELECT tp.id, tp.tournament_id, tp.team_id, tp.status, tp.applied_at,
+       tp.reviewed_at, tp.reviewed_by, tp.rejection_reason,
+       t.name AS team_name, m.members_count
+FROM tournaments_participants tp
+JOIN teams t ON t.id = tp.team_id
+CROSS JOIN LATERAL (
+    SELECT COUNT(*)::int AS members_count
+    FROM tournaments_participants_members pm
+    WHERE pm.participant_id = tp.id
+) m
+"""
+
+
+async def fetch_review_queue(
+    tournament_id: Optional[UUID],
+    status: str,
+    after: Optional[Tuple[datetime, UUID]],
+    limit: int,
+) -> List[dict]:
+    # Keyset sobre (applied_at, id) ascendente: las más antiguas primero, sin OFFSET
+    params: list = [status]
+    conditions = ["tp.status = $1"]
+    if tournament_id is not None:
+        params.append(tournament_id)
+        conditions.append(f"tp.tournament_id = ${len(params)}")
+    if after is not None:
+        params.extend(after)
+        conditions.append(f"(tp.applied_at, tp.id) > (${len(params) - 1}, ${len(params)})")
+    params.append(limit)
+    sql = (
+        REVIEW_QUEUE_SELECT
+        + f"WHERE {' AND '.join(conditions)} ORDER BY tp.applied_at, tp.id LIMIT ${len(params)}"
+    )
+    pool = await DatabaseConnection.get_pool()
+    async with pool.acquire() as conn:
+        rows = await conn.fetch(sql, *params)
+    return [dict(r) for r in rows]
+
+
+
+
+# Revisión en cascada: inscripción(es) y todos sus miembros en una sola sentencia.
+# El estado va dos veces ($1 y $5) porque participantes y miembros tienen columnas distintas
+# y así cada parámetro toma el tipo de la suya.
+REVIEW_CASCADE_SQL = """
+WITH p AS (
+    UPDATE tournaments_participants
+    SET status = $1, reviewed_at = now(), reviewed_by = $2, rejection_reason = $3
+    WHERE id = ANY($4::uuid[])
+    RETURNING *
+),
+m AS (
+    UPDATE tournaments_participants_members pm
+    SET registration_status = $5, reviewed_at = now(), reviewed_by = $2
+    FROM p
+    WHERE pm.participant_id = p.id
+    RETURNING pm.participant_id
+)
+SELECT p.*, COALESCE(mc.members_updated, 0)::int AS members_updated
+FROM p
+LEFT JOIN (SELECT participant_id, COUNT(*) AS members_updated FROM m GROUP BY participant_id) mc
+  ON mc.participant_id = p.id
+"""
+
+
+async def update_registration_reviews_bulk(participant_ids: List[UUID], status: str, reviewer_id: str, rejection_reason: Optional[str]) -> List[dict]:
+    pool = await DatabaseConnection.get_pool()
+    async with pool.acquire() as conn:
+        rows = await conn.fetch(REVIEW_CASCADE_SQL, status, reviewer_id, rejection_reason, participant_ids, status)
+    return [dict(r) for r in rows]
+
+
+
+
 async def update_registration_review(participant_id: UUID, payload, reviewer_id: str) -> Optional[dict]:
     pool = await DatabaseConnection.get_pool()
     async with pool.acquire() as conn:
         row = await conn.fetchrow(
-            "UPDATE tournaments_participants SET status = $1, reviewed_at = now(), reviewed_by = $2, rejection_reason = $3 WHERE id = $4 RETURNING *",
+            REVIEW_CASCADE_SQL,
             payload.status,
             reviewer_id,
             payload.rejection_reason,
-            str(participant_id),
+            [participant_id],
+            payload.status,
         )
     return dict(row) if row else None
 
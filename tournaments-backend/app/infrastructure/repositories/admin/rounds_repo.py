@@ -0,0 +1,164 @@
+from typing import List, Optional, Tuple
+from uuid import UUID
+from infrastructure.database.connection import DatabaseConnection
+from infrastructure.repositories.standings_repo import Writer
+
+
+MATCH_COLUMNS = "id, table_number, player1_id, player2_id, result, p1_wins, p2_wins, draws, reported_at"
+
+
+# Participantes aprobados ordenados por seed: rating del equipo (los que no tienen van detrás)
+# y después orden de inscripción
+SEEDED_PARTICIPANTS_SQL = """
+SELECT tp.id
+FROM tournaments_participants tp
+LEFT JOIN ratings r
+  ON r.formula = $2 AND r.subject_type = 'team' AND r.subject_id = tp.team_id
+WHERE tp.tournament_id = $1 AND tp.status = 'approved'
+ORDER BY r.rating DESC NULLS LAST, tp.applied_at, tp.id
+"""
+
+
+async def fetch_swiss_state(tournament_id: UUID, formula: str) -> Tuple[List[UUID], List[dict], Optional[dict]]:
+    """Participantes aprobados (orden de seed), historial de partidas y última ronda."""
+    pool = await DatabaseConnection.get_pool()
+    async with pool.acquire() as conn:
+        participants = await conn.fetch(SEEDED_PARTICIPANTS_SQL, tournament_id, formula)
+        matches = await conn.fetch(
+            """
+            SELECT r.round_number, m.player1_id, m.player2_id, m.result
+            FROM tournament_matches m
+            JOIN tournament_rounds r ON r.id = m.round_id
+            WHERE m.tournament_id = $1
+            """,
+            tournament_id,
+        )
+        last_round = await conn.fetchrow(
+            "SELECT round_number, status FROM tournament_rounds WHERE tournament_id = $1 ORDER BY round_number DESC LIMIT 1",
+            tournament_id,
+        )
+    return [r["id"] for r in participants], [dict(m) for m in matches], dict(last_round) if last_round else None
+
+
+
+
+async def insert_round(
+    tournament_id: UUID,
+    round_number: int,
+    pairs: List[Tuple[UUID, UUID]],
+    bye: Optional[UUID],
+    standings: Optional[Writer] = None,
+) -> dict:
+    """
+    Crea la ronda y todas sus partidas en una transacción (un INSERT con unnest).
+    El bye se guarda ya resuelto. UNIQUE (tournament_id, round_number) evita emparejar dos veces.
+    standings (el punto del bye) se aplica en la misma transacción; su versión va en
+    standings_version.
+    """
+    player1 = [a for a, _ in pairs]
+    player2 = [b for _, b in pairs]
+    if bye is not None:
+        player1.append(bye)
+        player2.append(None)
+
+    pool = await DatabaseConnection.get_pool()
+    async with pool.acquire() as conn:
+        async with conn.transaction():
+            rnd = await conn.fetchrow(
+                "INSERT INTO tournament_rounds (tournament_id, round_number) VALUES ($1, $2) RETURNING *",
+                tournament_id, round_number,
+            )
+            matches = await conn.fetch(
+                f"""
+                INSERT INTO tournament_matches (tournament_id, round_id, table_number, player1_id, player2_id, result, reported_at)
+                SELECT $1, $2, t.table_number, t.p1, t.p2,
+                       CASE WHEN t.p2 IS NULL THEN 'bye' END,
+                       CASE WHEN t.p2 IS NULL THEN now() END
+                FROM unnest($3::uuid[], $4::uuid[]) WITH ORDINALITY AS t(p1, p2, table_number)
+                RETURNING {MATCH_COLUMNS}
+                """,
+                tournament_id, rnd["id"], player1, player2,
+            )
+            version = await standings(conn, dict(rnd)) if standings else None
+    out = dict(rnd)
+    out["standings_version"] = version
+    out["matches"] = sorted((dict(m) for m in matches), key=lambda m: m["table_number"])
+    return out
+
+
+
+
+async def fetch_round(tournament_id: UUID, round_number: int) -> Optional[dict]:
+    pool = await DatabaseConnection.get_pool()
+    async with pool.acquire() as conn:
+        rnd = await conn.fetchrow(
+            "SELECT * FROM tournament_rounds WHERE tournament_id = $1 AND round_number = $2",
+            tournament_id, round_number,
+        )
+        if not rnd:
+            return None
+        matches = await conn.fetch(
+            f"SELECT {MATCH_COLUMNS} FROM tournament_matches WHERE round_id = $1 ORDER BY table_number",
+            rnd["id"],
+        )
+    out = dict(rnd)
+    out["matches"] = [dict(m) for m in matches]
+    return out
+
+
+
+
+# Reporta el resultado (solo si estaba pendiente) y cierra la ronda si era la última partida
+REPORT_RESULT_SQL = """
+WITH upd AS (
+    UPDATE tournament_matches
+    SET result = $2, p1_wins = $3, p2_wins = $4, draws = $5, reported_at = now()
+    WHERE id = $1 AND result IS NULL
+    RETURNING *
+),
+closed AS (
+    UPDATE tournament_rounds r
+    SET status = 'completed', completed_at = now()
+    FROM upd
+    WHERE r.id = upd.round_id
+      AND NOT EXISTS (
+          SELECT 1 FROM tournament_matches m
+          WHERE m.round_id = upd.round_id AND m.result IS NULL AND m.id <> upd.id
+      )
+    RETURNING r.id
+)
+SELECT upd.id, upd.table_number, upd.player1_id, upd.player2_id, upd.result,
+       upd.p1_wins, upd.p2_wins, upd.draws, upd.reported_at, upd.tournament_id,
+       EXISTS (SELECT 1 FROM closed) AS round_completed
+FROM upd
+"""
+
+
+# Bloquea la ronda de la partida: los reportes de una misma ronda se serializan, así el
+# último en confirmar ve al resto ya reportados y es el que la cierra
+LOCK_MATCH_ROUND_SQL = """
+SELECT r.id
+FROM tournament_rounds r
+JOIN tournament_matches m ON m.round_id = r.id
+WHERE m.id = $1
+FOR UPDATE OF r
+"""
+
+
+async def report_match_result(
+    match_id: UUID, result: str, p1_wins: int, p2_wins: int, draws: int, standings: Writer
+) -> Optional[dict]:
+    """Guarda el resultado y aplica standings en la misma transacción (versión en standings_version)."""
+    pool = await DatabaseConnection.get_pool()
+    async with pool.acquire() as conn:
+        async with conn.transaction():
+            if await conn.fetchval(LOCK_MATCH_ROUND_SQL, match_id) is None:
+                return None
+            # Sentencia nueva tras el lock: en READ COMMITTED su snapshot ya incluye los
+            # reportes que se confirmaron mientras esperábamos
+            row = await conn.fetchrow(REPORT_RESULT_SQL, match_id, result, p1_wins, p2_wins, draws)
+            if not row:
+                return None
+            out = dict(row)
+            out["standings_version"] = await standings(conn, out)
+    return out
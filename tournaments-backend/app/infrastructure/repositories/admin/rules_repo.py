@@ -14,4 +14,33 @@ async def fetch_rules(tournament_id: UUID) -> List[dict]:
     pool = await DatabaseConnection.get_pool()
     async with pool.acquire() as conn:
         rows = await conn.fetch("SELECT * FROM tournament_rules WHERE tournament_id = $1 ORDER BY created_at", str(tournament_id))
-        return [dict(r) for r in rows]
\ No newline at end of file
+        return [dict(r) for r in rows]
+
+
+async def fetch_latest_rule(tournament_id: UUID, key: str) -> Optional[dict]:
+    pool = await DatabaseConnection.get_pool()
+    async with pool.acquire() as conn:
+        row = await conn.fetchrow(
+            "SELECT * FROM tournament_rules WHERE tournament_id = $1 AND key = $2 ORDER BY created_at DESC LIMIT 1",
+            str(tournament_id), key,
+        )
+        return dict(row) if row else None
+
+
+
+async def fetch_tournament_rosters(tournament_id: UUID) -> List[dict]:
+    """Participantes vivos (pending/approved) con los miembros de su roster Pokémon (una fila por miembro)."""
+    pool = await DatabaseConnection.get_pool()
+    async with pool.acquire() as conn:
+        rows = await conn.fetch(
+            """
+            SELECT tp.id AS participant_id, tp.team_id, tp.pokemon_team_id,
+                   m.position, m.pokemon_id, m.species_id, m.level, m.ability, m.held_item, m.moves
+            FROM tournaments_participants tp
+            LEFT JOIN pokemon_team_members m ON m.pokemon_team_id = tp.pokemon_team_id
+            WHERE tp.tournament_id = $1 AND tp.status IN ('pending', 'approved')
+            ORDER BY tp.id, m.position
+            """,
+            tournament_id,
+        )
+        return [dict(r) for r in rows]
@@ -2,6 +2,7 @@ from typing import List, Optional
 from unittest import skip
 from uuid import UUID
 from infrastructure.database.connection import DatabaseConnection
+from infrastructure.database.query_registry import QueryRegistry
 
 
 async def fetch_teams(skip: int, limit: int) -> List[dict]:
@@ -22,21 +23,34 @@ async def fetch_team_by_id(team_id: UUID) -> Optional[dict]:
 
 
 
+# Update parcial con una sola forma de SQL: solo cambian las columnas listadas en $2
+UPDATABLE_FIELDS = ("name", "coach_user_id", "is_active")
+
+TEAM_UPDATE = QueryRegistry.register(
+    "admin.teams.update",
+    "UPDATE teams SET "
+    + ", ".join(
+        f"{field} = CASE WHEN '{field}' = ANY($2::text[]) THEN ${i + 3} ELSE {field} END"
+        for i, field in enumerate(UPDATABLE_FIELDS)
+    )
+    + " WHERE id = $1 RETURNING *",
+    query_class="write",
+)
+
+
 async def update_team(team_id: UUID, payload) -> Optional[dict]:
+    data = {k: v for k, v in payload.dict(exclude_unset=True).items() if k in UPDATABLE_FIELDS}
+    if not data:
+        return None
     pool = await DatabaseConnection.get_pool()
     async with pool.acquire() as conn:
-        set_parts = []
-        args = []
-        idx = 1
-        for k, v in payload.dict(exclude_unset=True).items():
-            set_parts.append(f"{k} = ${idx}")
-            args.append(v)
-            idx += 1
-        if not set_parts:
-            return None
-        args.append(str(team_id))
-        q = f"UPDATE teams SET {', '.join(set_parts)} WHERE id = ${idx} RETURNING *"
-        row = await conn.fetchrow(q, *args)
+        row = await QueryRegistry.fetchrow(
+            conn,
+            TEAM_UPDATE,
+            str(team_id),
+            list(data),
+            *(data.get(field) for field in UPDATABLE_FIELDS),
+        )
         return dict(row) if row else None
 
 
@@ -1,8 +1,19 @@
 # infrastructure/repositories/admin/tournaments_repo.py
-import json
 from typing import List, Optional
 from uuid import UUID
 from infrastructure.database.connection import DatabaseConnection
+from infrastructure.database.query_registry import QueryRegistry
+from infrastructure.cache.tournament_cache import TournamentCache
+
+TOURNAMENT_COLUMNS = (
+    "id, name, description, images, status, start_at, end_at, price_client, price_player, is_active, created_at"
+)
+
+ADMIN_TOURNAMENT_BY_ID = QueryRegistry.register(
+    "admin.tournaments.by_id",
+    f"SELECT {TOURNAMENT_COLUMNS} FROM tournaments WHERE id = $1",
+    hot=True,
+)
 
 # Inserta un torneo y devuelve la fila resultante como dict
 async def insert_tournament(payload) -> dict | None:
@@ -35,8 +46,9 @@ async def insert_tournament(payload) -> dict | None:
             data.get("is_active", True),
         )
 
-
-        return dict(row) if row else None
+    if row:
+        await TournamentCache.invalidate(row["id"])
+    return dict(row) if row else None
 
 # Listar torneos (simple)
 async def fetch_tournaments(skip: int = 0, limit: int = 50) -> List[dict]:
@@ -59,52 +71,59 @@ async def fetch_tournaments(skip: int = 0, limit: int = 50) -> List[dict]:
 async def fetch_tournament_by_id(tournament_id: UUID) -> Optional[dict]:
     pool = await DatabaseConnection.get_pool()
     async with pool.acquire() as conn:
-        row = await conn.fetchrow(
-            """
-            SELECT id, name, description, images, status, start_at, end_at, price_client, price_player, is_active, created_at
-            FROM tournaments
-            WHERE id = $1
-            """,
-            tournament_id,
-        )
+        row = await QueryRegistry.fetchrow(conn, ADMIN_TOURNAMENT_BY_ID, tournament_id)
         return dict(row) if row else None
 
 
-# Update dinámico que solo actualiza los campos presentes en payload
+# Update parcial con una única sentencia: $2 lleva los campos presentes y cada columna solo
+# cambia si su nombre está en esa lista. Mismo texto SQL para cualquier combinación de campos.
+UPDATABLE_FIELDS = (
+    "name", "description", "images", "status", "start_at", "end_at",
+    "price_client", "price_player", "is_active",
+)
+
+ADMIN_TOURNAMENT_UPDATE = QueryRegistry.register(
+    "admin.tournaments.update",
+    f"""
+    UPDATE tournaments
+    SET {", ".join(
+        f"{field} = CASE WHEN '{field}' = ANY($2::text[]) THEN ${i + 3} ELSE {field} END"
+        for i, field in enumerate(UPDATABLE_FIELDS)
+    )}
+    WHERE id = $1
+    RETURNING {TOURNAMENT_COLUMNS}
+    """,
+    query_class="write",
+)
+
+
+# Update que solo actualiza los campos presentes en payload
 async def update_tournament(tournament_id: UUID, payload) -> Optional[dict]:
     if hasattr(payload, "dict"):
         data = payload.dict(exclude_unset=True)
     else:
         data = dict(payload or {})
 
+    data = {k: v for k, v in data.items() if k in UPDATABLE_FIELDS}
     if not data:
         return await fetch_tournament_by_id(tournament_id)
 
-    pool = await DatabaseConnection.get_pool()
-
-    params = []
-    set_clauses = []
-    idx = 1
-    for key, val in data.items():
-        if key == "images":
-            params.append(json.dumps(val or []))
-            set_clauses.append(f"{key} = ${idx}::jsonb")
-        else:
-            params.append(val)
-            set_clauses.append(f"{key} = ${idx}")
-        idx += 1
-
-    params.append(tournament_id)
-    sql = f"""
-        UPDATE tournaments
-        SET {', '.join(set_clauses)}
-        WHERE id = ${idx}
-        RETURNING id, name, description, images, status, start_at, end_at, price_client, price_player, is_active, created_at
-    """
+    if "images" in data:
+        data["images"] = data["images"] or []   # ← lista Python, el codec jsonb la serializa
 
+    pool = await DatabaseConnection.get_pool()
     async with pool.acquire() as conn:
-        row = await conn.fetchrow(sql, *params)
-        return dict(row) if row else None
+        row = await QueryRegistry.fetchrow(
+            conn,
+            ADMIN_TOURNAMENT_UPDATE,
+            tournament_id,
+            list(data),
+            *(data.get(field) for field in UPDATABLE_FIELDS),
+        )
+
+    if row:
+        await TournamentCache.invalidate(tournament_id)
+    return dict(row) if row else None
 
 
 # Soft delete - marca is_active = false
@@ -121,7 +140,10 @@ async def soft_delete_tournament(tournament_id: UUID) -> bool:
             """,
             tournament_id,
         )
-        return bool(row)
+
+    if row:
+        await TournamentCache.invalidate(tournament_id)
+    return bool(row)
     
 async def delete_tournament(tournament_id: UUID) -> bool:
     pool = await DatabaseConnection.get_pool()
@@ -141,4 +163,6 @@ async def delete_tournament(tournament_id: UUID) -> bool:
             "DELETE FROM tournaments WHERE id = $1",
             tournament_id,
         )
-        return True
\ No newline at end of file
+
+    await TournamentCache.invalidate(tournament_id)
+    return True
\ No newline at end of file
@@ -25,7 +25,7 @@ class CoachRepositoryImpl:
         async with pool.acquire() as conn:
             rows = await conn.fetch("""
                 SELECT t.id, t.name, t.status, t.is_active, t.created_at,
-                       (SELECT COUNT(*) FROM team_members tm WHERE tm.team_id = t.id) AS players_count
+                       t.members_count AS players_count
                 FROM teams t
                 WHERE t.coach_user_id = $1
                 ORDER BY t.name
@@ -142,49 +142,59 @@ class CoachRepositoryImpl:
             team["players_count"] = 0
             return team
 
-    async def search_users(self, limit: int = 20, offset: int = 0) -> List[dict]:
+    async def search_users(self, limit: int = 20, offset: int = 0, q: Optional[str] = None) -> List[dict]:
         """
-        Obtiene listado COMPLETO de jugadores con perfil (INNER JOIN).
+        Obtiene listado de jugadores con perfil (INNER JOIN), filtrando opcionalmente
+        por nickname/email (ILIKE, apoyado en índices trigram).
+        Las game_accounts vienen agregadas con json_agg: una sola consulta por página.
         """
         sql = """
-        SELECT u.id::text as user_id, u.email, p.nickname
-        FROM users u
-        INNER JOIN player_profiles p ON p.user_id = u.id
-        ORDER BY COALESCE(p.nickname, u.email) ASC
-        LIMIT $1 OFFSET $2
+        WITH page AS (
+            SELECT u.id AS user_id, u.email, p.nickname
+            FROM users u
+            INNER JOIN player_profiles p ON p.user_id = u.id
+            WHERE $1::text IS NULL OR p.nickname ILIKE $1 OR u.email ILIKE $1
+            ORDER BY COALESCE(p.nickname, u.email) ASC
+            LIMIT $2 OFFSET $3
+        )
+        SELECT page.user_id, page.email, page.nickname,
+               COALESCE(
+                   (
+                       SELECT json_agg(json_build_object(
+                           'id', g.id,
+                           'game_key', g.game_key,
+                           'platform', g.platform,
+                           'platform_account_id', g.platform_account_id,
+                           'display_name', g.display_name,
+                           'status', g.status,
+                           'is_active', g.is_active
+                       ))
+                       FROM user_game_accounts g
+                       WHERE g.user_id = page.user_id
+                   ),
+                   '[]'::json
+               ) AS game_accounts
+        FROM page
+        ORDER BY COALESCE(page.nickname, page.email) ASC
         """
-        
+
+        pattern = None
+        if q:
+            # Escapamos los comodines de LIKE para buscar el texto literal
+            escaped = q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            pattern = f"%{escaped}%"
+
         async with DatabaseConnection.get_connection() as conn:
-            rows = await conn.fetch(sql, limit, offset)
-            results = []
-            for r in rows:
-                user = {
-                    "user_id": UUID(r["user_id"]),
+            rows = await conn.fetch(sql, pattern, limit, offset)
+            return [
+                {
+                    "user_id": r["user_id"],
                     "email": r["email"],
                     "nickname": r["nickname"],
-                    "game_accounts": []
+                    "game_accounts": r["game_accounts"],
                 }
-                # obtener game accounts del usuario
-                gac_sql = """
-                SELECT id, game_key, platform, platform_account_id, display_name, status, is_active
-                FROM user_game_accounts
-                WHERE user_id = $1
-                """
-                gac_rows = await conn.fetch(gac_sql, user["user_id"])
-                gas = []
-                for g in gac_rows:
-                    gas.append({
-                        "id": g["id"],
-                        "game_key": g["game_key"],
-                        "platform": g["platform"],
-                        "platform_account_id": g["platform_account_id"],
-                        "display_name": g["display_name"],
-                        "status": g["status"],
-                        "is_active": g["is_active"],
-                    })
-                user["game_accounts"] = gas
-                results.append(user)
-            return results
+                for r in rows
+            ]
 
     async def is_team_coach(self, team_id: UUID, coach_user_id: UUID) -> bool:
         sql = "SELECT coach_user_id FROM teams WHERE id = $1"
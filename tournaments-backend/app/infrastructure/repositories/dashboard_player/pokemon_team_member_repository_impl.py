@@ -71,6 +71,60 @@ class PokemonTeamMemberRepositoryImpl:
             )
             return row["id"]
 
+    async def replace_members(self, pokemon_team_id: UUID, members: List[dict]) -> List[int]:
+        """
+        Sustituye el roster completo en una transacción: bloquea el equipo, borra los miembros
+        y los inserta todos con un único INSERT ... SELECT sobre jsonb_to_recordset.
+        """
+        rows = [
+            {
+                "position": m["position"],
+                "pokemon_id": m["pokemon_id"],
+                "species_id": m.get("species_id"),
+                "nickname": m.get("nickname"),
+                "level": m.get("level", 50),
+                "nature": m.get("nature"),
+                "ability": m.get("ability"),
+                "held_item": m.get("held_item"),
+                "shiny": m.get("shiny", False),
+                "ivs": m.get("ivs", {}),
+                "evs": m.get("evs", {}),
+                "moves": m.get("moves", []),
+            }
+            for m in members
+        ]
+        sql = """
+        INSERT INTO pokemon_team_members (
+            pokemon_team_id, position, pokemon_id, species_id, nickname, level,
+            nature, ability, held_item, shiny, ivs, evs, moves
+        )
+        SELECT
+            $1, x.position, x.pokemon_id, x.species_id, x.nickname, x.level,
+            x.nature, x.ability, x.held_item, x.shiny, x.ivs, x.evs, x.moves
+        FROM jsonb_to_recordset($2::jsonb) AS x(
+            position int, pokemon_id int, species_id int, nickname text, level int,
+            nature text, ability text, held_item text, shiny boolean,
+            ivs jsonb, evs jsonb, moves jsonb
+        )
+        ORDER BY x.position
+        RETURNING id;
+        """
+        async with DatabaseConnection.get_connection() as conn:
+            async with conn.transaction():
+                # Serializa reemplazos concurrentes del mismo equipo
+                await conn.execute(
+                    "SELECT 1 FROM pokemon_teams WHERE id = $1 FOR UPDATE;",
+                    pokemon_team_id,
+                )
+                await conn.execute(
+                    "DELETE FROM pokemon_team_members WHERE pokemon_team_id = $1;",
+                    pokemon_team_id,
+                )
+                if not rows:
+                    return []
+                inserted = await conn.fetch(sql, pokemon_team_id, rows)
+                return [r["id"] for r in inserted]
+
     async def update_member(self, member_id: int, data: dict) -> None:
         sql = """
         UPDATE pokemon_team_members
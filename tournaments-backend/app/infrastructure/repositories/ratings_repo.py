@@ -0,0 +1,121 @@
+# infrastructure/repositories/ratings_repo.py
+from typing import Dict, List, Tuple
+from uuid import UUID
+from infrastructure.database.connection import DatabaseConnection
+
+# Resultados a nivel participante de las dos fuentes, fechados por reported_at:
+#   - partidas de rondas suizas (tournament_matches)
+#   - partidas de cuadros de eliminación (tournament_brackets): se decodifican los arrays por
+#     índice; entrants[k + 1] = seed k, así que las casillas BYE/TBD (< 0) no casan y solo
+#     entran las partidas jugadas (reported_at no nulo; las resueltas por BYE no lo tienen)
+# score desde el lado de a: 1 gana, 0.5 empate, 0 pierde.
+PARTICIPANT_RESULTS_CTE = """
+WITH results AS (
+    SELECT m.id::text AS match_key, m.reported_at, m.player1_id AS pa, m.player2_id AS pb,
+           CASE m.result WHEN 'p1' THEN 1.0 WHEN 'p2' THEN 0.0 ELSE 0.5 END::float8 AS score
+    FROM tournament_matches m
+    WHERE m.result IN ('p1', 'p2', 'draw')
+    UNION ALL
+    SELECT b.tournament_id::text || ':' || i, b.reported_at[i],
+           b.entrants[b.slot_a[i] + 1], b.entrants[b.slot_b[i] + 1],
+           CASE WHEN b.winner[i] = b.slot_a[i] THEN 1.0 ELSE 0.0 END::float8
+    FROM tournament_brackets b
+    CROSS JOIN LATERAL generate_subscripts(b.winner, 1) AS i
+    WHERE b.reported_at[i] IS NOT NULL AND b.slot_a[i] >= 0 AND b.slot_b[i] >= 0
+)
+"""
+
+# Periodo = floor(epoch / duración). weight_a / weight_b = peso de la partida para a y para b.
+# Las dos fuentes van mezcladas y ordenadas por fecha de reporte.
+TEAM_RESULTS_SQL = PARTICIPANT_RESULTS_CTE + """
+SELECT floor(extract(epoch FROM r.reported_at) / $1)::int AS period,
+       p1.team_id AS a, p2.team_id AS b,
+       r.score,
+       1.0::float8 AS weight_a,
+       1.0::float8 AS weight_b
+FROM results r
+JOIN tournaments_participants p1 ON p1.id = r.pa
+JOIN tournaments_participants p2 ON p2.id = r.pb
+ORDER BY r.reported_at
+"""
+
+# Cada miembro de un lado juega contra cada miembro del otro, con peso 1/tamaño del equipo
+# rival: para cada jugador la partida cuenta una vez (contra el promedio del otro equipo)
+# y no n veces. count(*) sobre (partida, jugador) = nº de rivales de ese jugador.
+USER_RESULTS_SQL = PARTICIPANT_RESULTS_CTE + """
+SELECT floor(extract(epoch FROM r.reported_at) / $1)::int AS period,
+       u1.user_id AS a, u2.user_id AS b,
+       r.score,
+       (1.0 / count(*) OVER (PARTITION BY r.match_key, u1.user_id))::float8 AS weight_a,
+       (1.0 / count(*) OVER (PARTITION BY r.match_key, u2.user_id))::float8 AS weight_b
+FROM results r
+JOIN tournaments_participants_members u1
+  ON u1.participant_id = r.pa AND u1.registration_status <> 'rejected'
+JOIN tournaments_participants_members u2
+  ON u2.participant_id = r.pb AND u2.registration_status <> 'rejected'
+ORDER BY r.reported_at
+"""
+
+RESULTS_SQL = {"team": TEAM_RESULTS_SQL, "user": USER_RESULTS_SQL}
+
+RATING_COLUMNS = ["formula", "subject_type", "subject_id", "rating", "rd", "volatility", "matches"]
+HISTORY_COLUMNS = ["formula", "subject_type", "subject_id", "period_start", "rating", "rd", "volatility"]
+
+
+async def fetch_results(subject_type: str, period_seconds: int) -> List[Tuple[int, UUID, UUID, float, float, float]]:
+    pool = await DatabaseConnection.get_pool()
+    async with pool.acquire() as conn:
+        return await conn.fetch(RESULTS_SQL[subject_type], period_seconds)
+
+
+
+
+async def replace_ratings(formula: str, subject_type: str, ratings: List[tuple], history: List[tuple]) -> None:
+    """
+    Sustituye ratings e historial de (formula, subject_type) en una transacción con COPY.
+    Filas en el orden de RATING_COLUMNS / HISTORY_COLUMNS.
+    """
+    pool = await DatabaseConnection.get_pool()
+    async with pool.acquire() as conn:
+        async with conn.transaction():
+            await conn.execute(
+                "DELETE FROM ratings WHERE formula = $1 AND subject_type = $2", formula, subject_type
+            )
+            await conn.execute(
+                "DELETE FROM rating_history WHERE formula = $1 AND subject_type = $2", formula, subject_type
+            )
+            await conn.copy_records_to_table("ratings", columns=RATING_COLUMNS, records=ratings)
+            await conn.copy_records_to_table("rating_history", columns=HISTORY_COLUMNS, records=history)
+
+
+
+
+async def fetch_ratings(formula: str, subject_type: str, subject_ids: List[UUID]) -> Dict[UUID, dict]:
+    pool = await DatabaseConnection.get_pool()
+    async with pool.acquire() as conn:
+        rows = await conn.fetch(
+            """
+            SELECT subject_id, rating, rd, volatility, matches, updated_at
+            FROM ratings
+            WHERE formula = $1 AND subject_type = $2 AND subject_id = ANY($3::uuid[])
+            """,
+            formula, subject_type, subject_ids,
+        )
+    return {r["subject_id"]: dict(r) for r in rows}
+
+
+
+
+async def fetch_history(formula: str, subject_type: str, subject_id: UUID) -> List[dict]:
+    pool = await DatabaseConnection.get_pool()
+    async with pool.acquire() as conn:
+        rows = await conn.fetch(
+            """
+            SELECT period_start, rating, rd, volatility
+            FROM rating_history
+            WHERE formula = $1 AND subject_type = $2 AND subject_id = $3
+            ORDER BY period_start
+            """,
+            formula, subject_type, subject_id,
+        )
+    return [dict(r) for r in rows]
@@ -0,0 +1,157 @@
+# infrastructure/repositories/standings_repo.py
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+from infrastructure.database.connection import DatabaseConnection
+from infrastructure.database.query_registry import QueryRegistry
+
+AGGREGATE_COLUMNS = (
+    "points", "matches_played", "match_wins", "match_losses", "match_draws", "byes",
+    "game_wins", "game_losses", "game_draws", "opp_points", "opp_mwp_sum", "opp_count",
+)
+
+# La fila de versión se bloquea primero: serializa las actualizaciones de un mismo torneo
+# (así los UPDATE de rivales no se cruzan en deadlocks) y da el ETag del snapshot.
+BUMP_VERSION_SQL = """
+INSERT INTO tournament_standings_versions (tournament_id, version) VALUES ($1, 1)
+ON CONFLICT (tournament_id) DO UPDATE
+SET version = tournament_standings_versions.version + 1, updated_at = now()
+RETURNING version
+"""
+
+UPDATE_ROW_SQL = f"""
+UPDATE tournament_standings
+SET {", ".join(f"{c} = ${i + 3}" for i, c in enumerate(AGGREGATE_COLUMNS))}, opponents = ${len(AGGREGATE_COLUMNS) + 3}
+WHERE tournament_id = $1 AND participant_id = $2
+"""
+
+APPLY_OPPONENT_DELTAS_SQL = """
+UPDATE tournament_standings s
+SET opp_points = s.opp_points + d.d_points,
+    opp_mwp_sum = s.opp_mwp_sum + d.d_mwp
+FROM unnest($2::uuid[], $3::int[], $4::float8[]) AS d(participant_id, d_points, d_mwp)
+WHERE s.tournament_id = $1 AND s.participant_id = d.participant_id
+"""
+
+# Se consulta en cada GET de clasificación (ETag) cuando la versión local ha caducado
+STANDINGS_VERSION = QueryRegistry.register(
+    "standings.version",
+    "SELECT version FROM tournament_standings_versions WHERE tournament_id = $1",
+    hot=True,
+)
+
+# compute(filas por participante) → (filas actualizadas, {rival: [delta puntos, delta mw%]})
+Compute = Callable[[Dict[UUID, dict]], Tuple[List[dict], Dict[UUID, List[float]]]]
+# writer(conn, fila que lo origina) → versión nueva; lo ejecutan las escrituras de rondas/partidas
+# dentro de su propia transacción
+Writer = Callable[[Any, dict], Awaitable[int]]
+
+
+async def apply_update(conn, tournament_id: UUID, participant_ids: List[UUID], compute: Compute) -> int:
+    """
+    Actualiza las filas de participant_ids y propaga los deltas a sus rivales. Devuelve la versión nueva.
+    Corre en la transacción del llamador: la del resultado o la ronda que la origina, así los
+    agregados nunca quedan por detrás de tournament_matches.
+    """
+    version = await conn.fetchval(BUMP_VERSION_SQL, tournament_id)
+    await conn.execute(
+        """
+        INSERT INTO tournament_standings (tournament_id, participant_id)
+        SELECT $1, unnest($2::uuid[])
+        ON CONFLICT DO NOTHING
+        """,
+        tournament_id, participant_ids,
+    )
+    rows = await conn.fetch(
+        "SELECT * FROM tournament_standings WHERE tournament_id = $1 AND participant_id = ANY($2::uuid[])",
+        tournament_id, participant_ids,
+    )
+    updated, deltas = compute({r["participant_id"]: dict(r) for r in rows})
+
+    await conn.executemany(
+        UPDATE_ROW_SQL,
+        [
+            (tournament_id, r["participant_id"], *(r[c] for c in AGGREGATE_COLUMNS), r["opponents"])
+            for r in updated
+        ],
+    )
+    if deltas:
+        ids = list(deltas)
+        await conn.execute(
+            APPLY_OPPONENT_DELTAS_SQL,
+            tournament_id, ids, [int(deltas[i][0]) for i in ids], [float(deltas[i][1]) for i in ids],
+        )
+    return version
+
+
+
+
+async def replace_all(tournament_id: UUID, rows: List[dict]) -> int:
+    """Sustituye todos los agregados del torneo (reconstrucción completa) con COPY."""
+    pool = await DatabaseConnection.get_pool()
+    async with pool.acquire() as conn:
+        async with conn.transaction():
+            version = await conn.fetchval(BUMP_VERSION_SQL, tournament_id)
+            await conn.execute("DELETE FROM tournament_standings WHERE tournament_id = $1", tournament_id)
+            await conn.copy_records_to_table(
+                "tournament_standings",
+                columns=["tournament_id", "participant_id", *AGGREGATE_COLUMNS, "opponents"],
+                records=[
+                    (tournament_id, r["participant_id"], *(r[c] for c in AGGREGATE_COLUMNS), r["opponents"])
+                    for r in rows
+                ],
+            )
+    return version
+
+
+
+
+async def fetch_version(tournament_id: UUID) -> int:
+    pool = await DatabaseConnection.get_pool()
+    async with pool.acquire() as conn:
+        version = await QueryRegistry.fetchval(conn, STANDINGS_VERSION, tournament_id)
+    return version or 0
+
+
+
+
+async def fetch_standings(tournament_id: UUID) -> Tuple[int, List[dict]]:
+    """Versión + filas con el nombre del equipo, leídas en la misma transacción (snapshot consistente)."""
+    pool = await DatabaseConnection.get_pool()
+    async with pool.acquire() as conn:
+        async with conn.transaction(isolation="repeatable_read", readonly=True):
+            version = await conn.fetchval(
+                "SELECT version FROM tournament_standings_versions WHERE tournament_id = $1", tournament_id
+            )
+            rows = await conn.fetch(
+                f"""
+                SELECT s.participant_id, {", ".join(f"s.{c}" for c in AGGREGATE_COLUMNS)}, t.name AS team_name
+                FROM tournament_standings s
+                JOIN tournaments_participants tp ON tp.id = s.participant_id
+                LEFT JOIN teams t ON t.id = tp.team_id
+                WHERE s.tournament_id = $1
+                """,
+                tournament_id,
+            )
+    return version or 0, [dict(r) for r in rows]
+
+
+
+
+async def fetch_results_history(tournament_id: UUID) -> Tuple[List[UUID], List[dict]]:
+    pool = await DatabaseConnection.get_pool()
+    async with pool.acquire() as conn:
+        participants = await conn.fetch(
+            "SELECT id FROM tournaments_participants WHERE tournament_id = $1 AND status = 'approved'",
+            tournament_id,
+        )
+        matches = await conn.fetch(
+            """
+            SELECT r.round_number, m.table_number, m.player1_id, m.player2_id, m.result,
+                   m.p1_wins, m.p2_wins, m.draws
+            FROM tournament_matches m
+            JOIN tournament_rounds r ON r.id = m.round_id
+            WHERE m.tournament_id = $1 AND m.result IS NOT NULL
+            """,
+            tournament_id,
+        )
+    return [r["id"] for r in participants], [dict(m) for m in matches]
@@ -0,0 +1,176 @@
+# infrastructure/repositories/tournament_registration_repo.py
+from typing import List, Optional
+from uuid import UUID
+from infrastructure.database.connection import DatabaseConnection
+from infrastructure.database.query_registry import QueryRegistry
+
+
+# Valida torneo, equipo y permisos, inserta el participante y todos sus miembros
+# en una sola sentencia (un único round trip, transacción implícita).
+# Los duplicados los resuelve la restricción única (tournament_id, team_id).
+REGISTER_TEAM_SQL = """
+WITH t AS (
+    SELECT id FROM tournaments WHERE id = $1 AND is_active = true
+),
+tm AS (
+    SELECT id, owner_user_id, coach_user_id FROM teams WHERE id = $2 AND is_active = true
+),
+allowed AS (
+    SELECT tm.id
+    FROM tm
+    WHERE (
+           tm.owner_user_id = $3
+        OR tm.coach_user_id = $3
+        OR EXISTS (SELECT 1 FROM team_members m WHERE m.team_id = tm.id AND m.user_id = $3)
+    )
+),
+-- El roster Pokémon (opcional) tiene que existir y ser del propio usuario
+roster AS (
+    SELECT 1
+    WHERE $4::uuid IS NULL
+       OR EXISTS (SELECT 1 FROM pokemon_teams pt WHERE pt.id = $4 AND pt.owner_user_id = $3)
+),
+ins AS (
+    INSERT INTO tournaments_participants (tournament_id, team_id, status, pokemon_team_id)
+    SELECT t.id, allowed.id, 'pending', $4::uuid
+    FROM t, allowed, roster
+    ON CONFLICT (tournament_id, team_id) DO NOTHING
+    RETURNING id, status AS registration_status, applied_at
+),
+members AS (
+    INSERT INTO tournaments_participants_members (participant_id, user_id, role, registration_status)
+    SELECT ins.id, m.user_id, COALESCE(m.role, 'member'), 'pending'
+    FROM ins
+    JOIN team_members m ON m.team_id = $2
+    ON CONFLICT (participant_id, user_id) DO NOTHING
+    RETURNING 1
+)
+SELECT
+    EXISTS (SELECT 1 FROM t)       AS tournament_ok,
+    EXISTS (SELECT 1 FROM tm)      AS team_ok,
+    EXISTS (SELECT 1 FROM allowed) AS allowed,
+    EXISTS (SELECT 1 FROM roster)  AS roster_ok,
+    ins.id                         AS participant_id,
+    ins.registration_status,
+    ins.applied_at,
+    (SELECT COUNT(*) FROM members) AS members_registered
+FROM (SELECT 1) AS one
+LEFT JOIN ins ON true
+"""
+
+REGISTER_TEAM = QueryRegistry.register("registrations.register_team", REGISTER_TEAM_SQL, hot=True, query_class="write")
+
+
+async def register_team(
+    tournament_id: UUID,
+    team_id: UUID,
+    user_id: UUID,
+    pokemon_team_id: Optional[UUID] = None,
+) -> dict:
+    """
+    Devuelve un dict con los flags de validación (tournament_ok, team_ok, allowed, roster_ok)
+    y, si se insertó, participant_id / registration_status / applied_at / members_registered.
+    participant_id = None con todos los flags a True significa que ya estaba registrado.
+    pokemon_team_id es el roster con el que compite (lo revisa el motor de legalidad).
+    """
+    async with DatabaseConnection.get_connection() as conn:
+        row = await QueryRegistry.fetchrow(conn, REGISTER_TEAM, tournament_id, team_id, user_id, pokemon_team_id)
+        return dict(row)
+
+
+# -------------------------
+# Registro en bloque
+# -------------------------
+BULK_TEAMS_SQL = """
+SELECT t.id,
+       t.is_active,
+       (
+           $2::uuid IS NULL
+           OR t.owner_user_id = $2
+           OR t.coach_user_id = $2
+           OR EXISTS (SELECT 1 FROM team_members m WHERE m.team_id = t.id AND m.user_id = $2)
+       ) AS allowed
+FROM teams t
+WHERE t.id = ANY($1::uuid[])
+"""
+
+BULK_INSERT_SQL = """
+WITH ins AS (
+    INSERT INTO tournaments_participants (tournament_id, team_id, status)
+    SELECT $1, team_id, 'pending'
+    FROM unnest($2::uuid[]) AS team_id
+    ON CONFLICT (tournament_id, team_id) DO NOTHING
+    RETURNING id, team_id, status AS registration_status, applied_at
+),
+members AS (
+    INSERT INTO tournaments_participants_members (participant_id, user_id, role, registration_status)
+    SELECT ins.id, m.user_id, COALESCE(m.role, 'member'), 'pending'
+    FROM ins
+    JOIN team_members m ON m.team_id = ins.team_id
+    ON CONFLICT (participant_id, user_id) DO NOTHING
+    RETURNING participant_id
+)
+SELECT ins.id, ins.team_id, ins.registration_status, ins.applied_at,
+       (SELECT COUNT(*) FROM members WHERE members.participant_id = ins.id) AS members_registered
+FROM ins
+"""
+
+RESULT_REGISTERED = "registered"
+RESULT_DUPLICATE = "duplicate"
+RESULT_INACTIVE = "inactive"
+RESULT_FORBIDDEN = "forbidden"
+
+
+async def register_teams_bulk(tournament_id: UUID, team_ids: List[UUID], user_id: Optional[UUID]) -> Optional[List[dict]]:
+    """
+    Registra varios equipos en un torneo con tres round trips en total
+    (torneo, equipos con = ANY($1), insert de participantes + miembros).
+    user_id = None omite la comprobación de permisos (uso desde admin).
+
+    Devuelve None si el torneo no está disponible; si no, un dict por equipo
+    (en el orden recibido, sin repetidos) con result = registered | duplicate | inactive | forbidden.
+    """
+    team_ids = list(dict.fromkeys(team_ids))
+
+    async with DatabaseConnection.get_connection() as conn:
+        async with conn.transaction():
+            is_active = await conn.fetchval(
+                "SELECT is_active FROM tournaments WHERE id = $1", tournament_id
+            )
+            if not is_active:
+                return None
+
+            teams = {r["id"]: r for r in await conn.fetch(BULK_TEAMS_SQL, team_ids, user_id)}
+
+            results = {}
+            eligible = []
+            for team_id in team_ids:
+                team = teams.get(team_id)
+                if not team or not team["is_active"]:
+                    results[team_id] = {"team_id": team_id, "result": RESULT_INACTIVE}
+                elif not team["allowed"]:
+                    results[team_id] = {"team_id": team_id, "result": RESULT_FORBIDDEN}
+                else:
+                    eligible.append(team_id)
+
+            inserted = {}
+            if eligible:
+                rows = await conn.fetch(BULK_INSERT_SQL, tournament_id, eligible)
+                inserted = {r["team_id"]: r for r in rows}
+
+            for team_id in eligible:
+                row = inserted.get(team_id)
+                if row is None:
+                    # Lo ha descartado el ON CONFLICT: ya estaba registrado
+                    results[team_id] = {"team_id": team_id, "result": RESULT_DUPLICATE}
+                else:
+                    results[team_id] = {
+                        "team_id": team_id,
+                        "result": RESULT_REGISTERED,
+                        "participant_id": row["id"],
+                        "status": row["registration_status"],
+                        "applied_at": row["applied_at"],
+                        "members_registered": row["members_registered"],
+                    }
+
+    return [results[team_id] for team_id in team_ids]
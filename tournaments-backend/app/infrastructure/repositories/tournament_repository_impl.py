@@ -1,26 +1,91 @@
 import asyncpg
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 from datetime import datetime
 
 from domain.entities.tournament import Tournament
 from domain.repositories.tournament_repository import TournamentRepository
 from infrastructure.database.connection import DatabaseConnection
+from infrastructure.database.query_registry import QueryRegistry
+
+TOURNAMENT_BY_ID = QueryRegistry.register(
+    "tournaments.by_id", "SELECT * FROM tournaments WHERE id = $1", hot=True
+)
+
+PAGE_FILTERS = {
+    "status": "status = ${}",
+    "is_active": "is_active = ${}",
+    "start_from": "start_at >= ${}",
+    "start_to": "start_at < ${}",
+}
+
+
+def _page_statement(keyset: bool, filters: Tuple[str, ...], hot: bool = False) -> str:
+    """
+    Una forma de SQL por combinación de filtros presentes (como mucho 2 * 2^4): el texto es
+    siempre el mismo para la misma combinación, así que cada forma se prepara una vez por conexión.
+    """
+    shape = "+".join((("after",) if keyset else ()) + filters) or "all"
+
+    def build() -> str:
+        conditions = ["(created_at, id) < ($1, $2)"] if keyset else []
+        idx = 2 if keyset else 0
+        for name in filters:
+            idx += 1
+            conditions.append(PAGE_FILTERS[name].format(idx))
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        return f"""
+            SELECT id, name, status, start_at, end_at, created_at,
+                   price_client, price_player, is_active
+            FROM tournaments
+            {where}
+            ORDER BY created_at DESC, id DESC
+            LIMIT ${idx + 1}
+        """
+
+    return QueryRegistry.shaped("tournaments.page", shape, build, hot=hot)
+
+
+# Primera página y siguientes del listado sin filtros: las más pedidas
+_page_statement(False, (), hot=True)
+_page_statement(True, (), hot=True)
+
 
 class TournamentRepositoryImpl(TournamentRepository):
     """PostgreSQL implementation of TournamentRepository"""
 
-    async def get_all(self) -> List[Tournament]:
+    async def list_page(
+        self,
+        limit: int,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        status: Optional[str] = None,
+        is_active: Optional[bool] = None,
+        start_from: Optional[datetime] = None,
+        start_to: Optional[datetime] = None,
+    ) -> List[Tournament]:
+        # Keyset sobre (created_at, id): el coste no depende de lo profundo que pagine el cliente
+        filters = [
+            (name, value)
+            for name, value in (
+                ("status", status),
+                ("is_active", is_active),
+                ("start_from", start_from),
+                ("start_to", start_to),
+            )
+            if value is not None
+        ]
+        params = list(after) if after is not None else []
+        params.extend(value for _, value in filters)
+        params.append(limit)
+        statement = _page_statement(after is not None, tuple(name for name, _ in filters))
+
         async with DatabaseConnection.get_connection() as conn:
-            rows = await conn.fetch("SELECT * FROM tournaments ORDER BY created_at DESC;")
+            rows = await QueryRegistry.fetch(conn, statement, *params)
             return [self._row_to_entity(row) for row in rows]
 
     async def get_by_id(self, tournament_id: UUID) -> Optional[Tournament]:
         async with DatabaseConnection.get_connection() as conn:
-            row = await conn.fetchrow(
-                "SELECT * FROM tournaments WHERE id = $1;",
-                tournament_id
-            )
+            row = await QueryRegistry.fetchrow(conn, TOURNAMENT_BY_ID, tournament_id)
             return self._row_to_entity(row) if row else None
 
     def _row_to_entity(self, row: asyncpg.Record) -> Tournament:
@@ -34,7 +99,8 @@ class TournamentRepositoryImpl(TournamentRepository):
             location=row.get('location'),
             created_at=row.get('created_at'),
             price_client=row.get('price_client'),
-            price_player=row.get('price_player')
+            price_player=row.get('price_player'),
+            status=row.get('status')
         )
 
         # Adjuntamos el flag almacenado en la BD para que el serializador lo incluya.
@@ -1,26 +1,42 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
-from api.routers import tournaments
+from api.routers import tournaments, ratings, live
 
 from api.routers.dashboard_player import players, teams, pokemon
 
 from api.routers.dashboard_coach import coach
 
-from api.routers.admin import tournaments_adm, teams_adm, registrations_adm, players_adm
+from api.routers.admin import tournaments_adm, teams_adm, registrations_adm, players_adm, rounds_adm, brackets_adm, ratings_adm, metrics_adm
 
 from api.routers import auth
 
 from infrastructure.database.connection import DatabaseConnection
+from infrastructure.database.pool_metrics import DatabaseBusy, PoolMetrics
+from infrastructure.external.redis_pubsub import RedisPubSub
+from infrastructure.external.pokeapi_client import PokeAPIClient
+from infrastructure.external.pokeapi_datapack import PokeDataPack
+from application.services.refresh_token_sweeper import RefreshTokenSweeper
+from core.security import PasswordHasherBusy, password_hasher
 from config.settings import settings
 
 
 async def lifespan(app: FastAPI):
-    # Startup: inicializa la pool
+    # Startup: inicializa la pool y escucha invalidaciones (cache de torneos, revocaciones) de otros workers
     await DatabaseConnection.get_pool()
+    PokeAPIClient.open()
+    PokeDataPack.open()
+    RedisPubSub.start()
+    RefreshTokenSweeper.start()
     yield
     # Shutdown: cierra la pool
+    await RefreshTokenSweeper.stop()
+    await RedisPubSub.stop()
     await DatabaseConnection.close_pool()
+    await PokeAPIClient.close()
+    PokeDataPack.close()
+    password_hasher.shutdown()
 
 app = FastAPI(
     title=settings.APP_NAME,
@@ -31,6 +47,36 @@ app = FastAPI(
 
 
 
+@app.exception_handler(PasswordHasherBusy)
+async def password_hasher_busy_handler(request: Request, exc: PasswordHasherBusy):
+    # Backpressure del pool de bcrypt: mejor un 503 rápido que bloquear el worker
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Authentication service busy, please retry"},
+        headers={"Retry-After": "1"},
+    )
+
+
+@app.exception_handler(DatabaseBusy)
+async def database_busy_handler(request: Request, exc: DatabaseBusy):
+    # Pool agotado o query fuera de presupuesto: 503 rápido en vez de apilar peticiones
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Database busy, please retry"},
+        headers={"Retry-After": "1"},
+    )
+
+
+@app.middleware("http")
+async def track_db_route(request, call_next):
+    # Para atribuir el tiempo que cada ruta retiene conexiones del pool
+    token = PoolMetrics.bind_request(request.scope)
+    try:
+        return await call_next(request)
+    finally:
+        PoolMetrics.unbind_request(token)
+
+
 @app.middleware("http")
 async def add_security_headers(request, call_next):
     response = await call_next(request)
@@ -54,6 +100,8 @@ app.add_middleware(
 
 # Include routers
 app.include_router(tournaments.router)
+app.include_router(ratings.router)
+app.include_router(live.router)
 
 app.include_router(players.router)
 app.include_router(teams.router)
@@ -65,6 +113,10 @@ app.include_router(tournaments_adm.router)
 app.include_router(teams_adm.router)
 app.include_router(registrations_adm.router)
 app.include_router(players_adm.router)
+app.include_router(rounds_adm.router)
+app.include_router(brackets_adm.router)
+app.include_router(ratings_adm.router)
+app.include_router(metrics_adm.router)
 
 app.include_router(auth.router)
 
@@ -0,0 +1,6 @@
+# tests/conftest.py
+import sys
+from pathlib import Path
+
+# El código de la app se importa como en producción (from application..., from config...)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
@@ -0,0 +1,93 @@
+# tests/test_bracket.py
+import random
+from collections import Counter
+
+import pytest
+
+from application.services.bracket import BYE, DOUBLE, SINGLE, TBD, Bracket, BracketError, seed_order
+
+
+def _play_out(bracket: Bracket, rng: random.Random):
+    """Reporta resultados aleatorios hasta que no quede nada jugable. Devuelve (derrotas, partidas)."""
+    losses = Counter()
+    played = 0
+    while True:
+        ready = [
+            m for m in range(1, bracket.match_count + 1)
+            if bracket.a[m] >= 0 and bracket.b[m] >= 0 and bracket.winner[m] == TBD
+        ]
+        if not ready:
+            return losses, played
+        m = rng.choice(ready)
+        a, b = bracket.a[m], bracket.b[m]
+        if rng.random() < 0.5:
+            bracket.report(m, 2, 1)
+            losses[b] += 1
+        else:
+            bracket.report(m, 0, 2)
+            losses[a] += 1
+        played += 1
+
+
+SIZES = list(range(2, 70)) + [100, 127, 128, 129, 255, 256, 257]
+
+
+@pytest.mark.parametrize("entrants", SIZES)
+def test_single_elimination(entrants):
+    bracket = Bracket.create(SINGLE, entrants)
+    losses, played = _play_out(bracket, random.Random(entrants))
+    champion = bracket.champion()
+    assert champion is not None and 0 <= champion < entrants
+    assert played == entrants - 1
+    assert losses[champion] == 0
+    assert all(losses[e] == 1 for e in range(entrants) if e != champion)
+
+
+@pytest.mark.parametrize("entrants", SIZES)
+def test_double_elimination(entrants):
+    bracket = Bracket.create(DOUBLE, entrants)
+    losses, played = _play_out(bracket, random.Random(entrants))
+    champion = bracket.champion()
+    assert champion is not None and 0 <= champion < entrants
+    assert losses[champion] <= 1
+    assert all(losses[e] == 2 for e in range(entrants) if e != champion)
+    # 2n-2 partidas, +1 si hubo reset de la gran final
+    assert played == 2 * entrants - 2 + losses[champion]
+
+
+def test_seed_order_pairs_top_seeds_last():
+    order = seed_order(8)
+    pairs = [tuple(sorted(order[i:i + 2])) for i in range(0, 8, 2)]
+    assert sorted(pairs) == [(0, 7), (1, 6), (2, 5), (3, 4)]
+    # 1 y 2 solo pueden cruzarse en la final
+    assert order.index(0) < 4 <= order.index(1)
+
+
+def test_top_seeds_get_the_byes():
+    bracket = Bracket.create(SINGLE, 5)
+    first_round = range(bracket.size // 2, bracket.size)
+    with_bye = {bracket.a[m] for m in first_round if bracket.b[m] == BYE}
+    assert with_bye == {0, 1, 2}
+
+
+def test_report_validation():
+    bracket = Bracket.create(SINGLE, 4)
+    with pytest.raises(BracketError):
+        bracket.report(1, 2, 1)            # la final aún no tiene rivales
+    with pytest.raises(BracketError):
+        bracket.report(2, 1, 1)            # no hay empates
+    bracket.report(2, 2, 0)
+    with pytest.raises(BracketError):
+        bracket.report(2, 2, 0)            # ya reportada
+
+
+def test_round_trip_through_arrays():
+    bracket = Bracket.create(DOUBLE, 11)
+    _play_out(bracket, random.Random(3))
+    arrays = bracket.to_arrays()
+    copy = Bracket.from_arrays(
+        DOUBLE, bracket.size, arrays["slot_a"], arrays["slot_b"], arrays["winner"],
+        arrays["score_a"], arrays["score_b"],
+    )
+    assert copy.to_arrays() == arrays
+    assert copy.champion() == bracket.champion()
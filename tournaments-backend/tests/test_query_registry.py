@@ -0,0 +1,121 @@
+# tests/test_query_registry.py
+import asyncio
+import os
+
+import pytest
+
+pytest.importorskip("pydantic_settings")
+
+# Settings exige credenciales; en tests no se conecta a nada
+for _var in ("DB_USER", "DB_PASSWORD", "DB_NAME", "JWT_SECRET_KEY", "JWT_REFRESH_SECRET_KEY"):
+    os.environ.setdefault(_var, "test")
+
+from infrastructure.database.pool_metrics import QueryTimeout  # noqa: E402
+from infrastructure.database.query_registry import QueryRegistry  # noqa: E402
+
+
+class StaleStatement(Exception):
+    pass
+
+
+class FakeStatement:
+    """Como asyncpg: una sentencia preparada deja de servir al devolver la conexión al pool."""
+
+    def __init__(self, conn):
+        self._conn = conn
+        self._release_ctr = conn._pool_release_ctr
+
+    async def fetchval(self, *args, timeout=None):
+        if self._release_ctr != self._conn._pool_release_ctr:
+            raise StaleStatement("cannot call PreparedStatement.fetchval(): the underlying connection has been released")
+        return args[0]
+
+
+class FakeConnection:
+    def __init__(self, pid=4242, delay=0.0):
+        self._pool_release_ctr = 0
+        self._pid = pid
+        self._delay = delay
+        self._listeners = []
+        self.calls = []
+
+    def get_server_pid(self):
+        return self._pid
+
+    def add_termination_listener(self, callback):
+        self._listeners.append(callback)
+
+    def release(self):
+        self._pool_release_ctr += 1
+
+    def terminate(self):
+        for callback in self._listeners:
+            callback(self)
+
+    async def prepare(self, sql):
+        return FakeStatement(self)
+
+    async def fetchval(self, sql, *args, timeout=None):
+        self.calls.append((sql, args, timeout))
+        if self._delay:
+            await asyncio.wait_for(asyncio.sleep(self._delay), timeout)
+        return args[0]
+
+    async def execute(self, sql, *args, timeout=None):
+        self.calls.append((sql, args, timeout))
+        return "UPDATE 1"
+
+
+@pytest.fixture(autouse=True)
+def clean_registry(monkeypatch):
+    for attr in ("_sql", "_hot", "_class", "_shapes", "_seen", "_stats"):
+        monkeypatch.setattr(QueryRegistry, attr, {})
+
+
+def test_statement_survives_release():
+    name = QueryRegistry.register("test.echo", "SELECT $1::int", hot=True)
+    conn = FakeConnection()
+
+    async def scenario():
+        await QueryRegistry.prepare_connection(conn)
+        first = await QueryRegistry.fetchval(conn, name, 1)
+        conn.release()
+        second = await QueryRegistry.fetchval(conn, name, 2)
+        return first, second
+
+    assert asyncio.run(scenario()) == (1, 2)
+    # Se ejecuta el SQL sobre la conexión, con el presupuesto de su clase
+    assert [call[0] for call in conn.calls] == ["SELECT $1::int", "SELECT $1::int"]
+    assert all(call[2] == QueryRegistry._budget("read") for call in conn.calls)
+
+
+def test_hits_and_misses_per_connection():
+    name = QueryRegistry.register("test.update", "UPDATE t SET x = $1", query_class="write")
+    conn = FakeConnection(pid=1)
+    other = FakeConnection(pid=2)
+
+    async def scenario():
+        await QueryRegistry.prepare_connection(conn)
+        await QueryRegistry.prepare_connection(other)
+        assert await QueryRegistry.execute(conn, name, 1) == "UPDATE 1"
+        conn.release()
+        await QueryRegistry.execute(conn, name, 2)
+        await QueryRegistry.execute(other, name, 3)
+
+    asyncio.run(scenario())
+    stats = QueryRegistry.stats()
+    assert stats["queries"][name] == {"hits": 1, "misses": 2, "query_class": "write"}
+    assert stats["connections"] == 2
+
+    conn.terminate()
+    assert QueryRegistry.stats()["connections"] == 1
+
+
+def test_timeout_maps_to_query_timeout(monkeypatch):
+    name = QueryRegistry.register("test.slow", "SELECT pg_sleep($1)")
+    monkeypatch.setattr(QueryRegistry, "_budget", staticmethod(lambda query_class: 0.01))
+    conn = FakeConnection(delay=1.0)
+
+    with pytest.raises(QueryTimeout) as exc:
+        asyncio.run(QueryRegistry.fetchval(conn, name, 1))
+    assert exc.value.query_class == "read"
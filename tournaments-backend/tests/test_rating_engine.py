@@ -0,0 +1,81 @@
+# tests/test_rating_engine.py
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from application.services import rating_engine  # noqa: E402
+from application.services.rating_engine import GLICKO2_SCALE, RatingState  # noqa: E402
+
+
+def _state(rating, rd, volatility=0.06):
+    n = len(rating)
+    return RatingState(
+        rating=np.array(rating, dtype=float),
+        rd=np.array(rd, dtype=float),
+        volatility=np.full(n, volatility),
+        matches=np.zeros(n, dtype=np.int64),
+    )
+
+
+def test_glickman_worked_example():
+    # Glickman, "Example of the Glicko-2 system": 1500/200 contra 1400/30 (gana),
+    # 1550/100 (pierde) y 1700/300 (pierde) en un mismo periodo, τ = 0.5
+    formula = rating_engine.formula("glicko2")
+    state = _state([1500, 1400, 1550, 1700], [200, 30, 100, 300])
+    state, history = rating_engine.run(
+        formula, 4, period=[0, 0, 0], a=[0, 0, 0], b=[1, 2, 3], score=[1.0, 0.0, 0.0], state=state
+    )
+    # Escala Glicko-2 del artículo: μ' = -0.2069, φ' = 0.8722, σ' = 0.05999
+    assert (state.rating[0] - 1500) / GLICKO2_SCALE == pytest.approx(-0.2069, abs=1e-3)
+    assert state.rd[0] / GLICKO2_SCALE == pytest.approx(0.8722, abs=1e-3)
+    assert state.rating[0] == pytest.approx(1464.06, abs=1e-2)
+    assert state.rd[0] == pytest.approx(151.52, abs=1e-2)
+    assert state.volatility[0] == pytest.approx(0.05999, abs=1e-3)
+    assert history.subject.tolist() == [0, 1, 2, 3]
+
+
+def test_empty_periods_grow_rd():
+    formula = rating_engine.formula("glicko2")
+    played, _ = rating_engine.run(formula, 2, period=[0, 1], a=[0, 0], b=[1, 1], score=[1.0, 0.0])
+    gap, _ = rating_engine.run(formula, 2, period=[0, 1, 4], a=[0, 0, 0], b=[1, 1, 1], score=[1.0, 0.0, 1.0])
+    consecutive, _ = rating_engine.run(formula, 2, period=[0, 1, 2], a=[0, 0, 0], b=[1, 1, 1], score=[1.0, 0.0, 1.0])
+    # Dos periodos vacíos (2 y 3) antes del 4: la RD de partida es mayor que jugando seguido
+    assert gap.rd[0] > consecutive.rd[0]
+
+    idle, _ = rating_engine.run(formula, 2, period=[0, 1], a=[0, 0], b=[1, 1], score=[1.0, 0.0], until=5)
+    phi, sigma = played.rd / GLICKO2_SCALE, played.volatility
+    expected = np.minimum(np.sqrt(phi ** 2 + 4 * sigma ** 2) * GLICKO2_SCALE, formula.initial_rd)
+    np.testing.assert_allclose(idle.rd, expected)
+    np.testing.assert_allclose(idle.rating, played.rating)
+
+
+def test_member_weights_equal_one_game_against_the_average():
+    # Un jugador contra 3 rivales idénticos con peso 1/3 = una partida contra uno de ellos
+    formula = rating_engine.formula("glicko2")
+    weighted, _ = rating_engine.run(
+        formula, 4, period=[0, 0, 0], a=[0, 0, 0], b=[1, 2, 3], score=[1.0, 1.0, 1.0],
+        weight_a=[1 / 3] * 3, weight_b=[1.0] * 3,
+    )
+    single, _ = rating_engine.run(formula, 2, period=[0], a=[0], b=[1], score=[1.0])
+    assert weighted.rating[0] == pytest.approx(single.rating[0])
+    assert weighted.rd[0] == pytest.approx(single.rd[0])
+    assert weighted.matches[0] == 1
+
+
+def test_elo_is_zero_sum():
+    formula = rating_engine.formula("elo")
+    rng = np.random.default_rng(7)
+    n, m = 50, 2000
+    a = rng.integers(0, n, m)
+    b = (a + rng.integers(1, n, m)) % n
+    state, _ = rating_engine.run(
+        formula, n, period=np.sort(rng.integers(0, 20, m)), a=a, b=b,
+        score=rng.choice([0.0, 0.5, 1.0], m), keep_history=False,
+    )
+    assert state.rating.mean() == pytest.approx(formula.initial_rating)
+    assert state.matches.sum() == 2 * m
+
+
+def test_unknown_formula():
+    with pytest.raises(ValueError):
+        rating_engine.formula("trueskill")
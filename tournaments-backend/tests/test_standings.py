@@ -0,0 +1,87 @@
+# tests/test_standings.py
+import random
+
+import pytest
+
+from application.services.standings import (
+    MIN_PCT,
+    apply_bye,
+    apply_result,
+    empty_row,
+    match_win_pct,
+    rank,
+    replay,
+)
+
+
+def _random_history(n: int, rounds: int, rng: random.Random):
+    """Rondas con parejas al azar (con revanchas) y un bye por ronda si n es impar."""
+    matches = []
+    for round_number in range(1, rounds + 1):
+        ids = list(range(n))
+        rng.shuffle(ids)
+        if n % 2:
+            matches.append({"round_number": round_number, "table_number": 0,
+                            "player1_id": ids.pop(), "player2_id": None, "result": "bye"})
+        for table, k in enumerate(range(0, len(ids), 2), start=1):
+            result = rng.choice(("p1", "p2", "draw"))
+            wins = {"p1": (2, rng.randint(0, 1)), "p2": (rng.randint(0, 1), 2), "draw": (1, 1)}[result]
+            matches.append({"round_number": round_number, "table_number": table,
+                            "player1_id": ids[k], "player2_id": ids[k + 1], "result": result,
+                            "p1_wins": wins[0], "p2_wins": wins[1], "draws": rng.randint(0, 1)})
+    return matches
+
+
+def _assert_opponent_sums(rows):
+    for row in rows.values():
+        opponents = row["opponents"]
+        assert row["opp_count"] == len(opponents)
+        assert row["opp_points"] == sum(rows[o]["points"] for o in opponents)
+        assert row["opp_mwp_sum"] == pytest.approx(sum(match_win_pct(rows[o]) for o in opponents))
+
+
+@pytest.mark.parametrize("n, rounds", [(2, 5), (3, 4), (4, 6), (7, 5), (16, 6), (33, 8)])
+def test_incremental_sums_match_recompute(n, rounds):
+    rng = random.Random(n * 100 + rounds)
+    matches = _random_history(n, rounds, rng)
+    rows = replay(range(n), matches)
+    _assert_opponent_sums(rows)
+    # Los puntos también cuadran con el historial
+    for pid, row in rows.items():
+        assert row["matches_played"] == rounds
+        assert row["match_wins"] + row["match_losses"] + row["match_draws"] == rounds   # el bye cuenta como victoria
+
+
+def test_rematch_updates_both_links():
+    a, b = empty_row("A"), empty_row("B")
+    a, b, deltas = apply_result(a, b, "p1", 2, 0, 0)
+    assert deltas == {}
+    a, b, deltas = apply_result(a, b, "p2", 1, 2, 0)
+    rows = {"A": a, "B": b}
+    assert a["opponents"] == ["B", "B"] and b["opponents"] == ["A", "A"]
+    _assert_opponent_sums(rows)
+
+
+def test_bye_propagates_to_previous_opponents():
+    a, b = empty_row("A"), empty_row("B")
+    a, b, _ = apply_result(a, b, "p2", 0, 2, 0)
+    a, deltas = apply_bye(a)
+    assert a["byes"] == 1 and a["game_wins"] == 2
+    b["opp_points"] += deltas["B"][0]
+    b["opp_mwp_sum"] += deltas["B"][1]
+    _assert_opponent_sums({"A": a, "B": b})
+
+
+def test_percentages_have_a_floor():
+    row = empty_row("A")
+    assert match_win_pct(row) == MIN_PCT
+    row, _, _ = apply_result(row, empty_row("B"), "p2", 0, 2, 0)
+    assert match_win_pct(row) == MIN_PCT
+
+
+def test_rank_orders_by_points_then_tiebreakers():
+    rows = replay(range(8), _random_history(8, 3, random.Random(5)))
+    table = rank(rows.values())
+    assert [r["rank"] for r in table] == list(range(1, 9))
+    keys = [(-r["points"], -r["omw"], -r["gw"], -r["buchholz"]) for r in table]
+    assert keys == sorted(keys)
@@ -0,0 +1,88 @@
+# tests/test_swiss_pairing.py
+import random
+
+import pytest
+
+from application.services.swiss_pairing import BYE_POINTS, SwissPlayer, build_players, pair_round
+
+
+def _simulate(n: int, rounds: int, rng: random.Random):
+    """Juega `rounds` rondas con resultados aleatorios y comprueba cada emparejamiento."""
+    participants = list(range(n))
+    matches = []
+    for round_number in range(1, rounds + 1):
+        players = build_players(participants, matches)
+        pairing = pair_round(players.values())
+
+        seen = [pid for pair in pairing.pairs for pid in pair]
+        if pairing.bye is not None:
+            seen.append(pairing.bye)
+        # Emparejamiento perfecto: cada jugador exactamente una vez
+        assert sorted(seen) == participants
+        assert (pairing.bye is None) == (n % 2 == 0)
+        if pairing.bye is not None:
+            assert not players[pairing.bye].had_bye
+
+        assert pairing.rematches == 0
+        for a, b in pairing.pairs:
+            assert b not in players[a].opponents
+
+        for table, (a, b) in enumerate(pairing.pairs, start=1):
+            matches.append({
+                "round_number": round_number, "table_number": table,
+                "player1_id": a, "player2_id": b,
+                "result": rng.choice(("p1", "p2", "p1", "p2", "draw")),
+            })
+        if pairing.bye is not None:
+            matches.append({
+                "round_number": round_number, "table_number": None,
+                "player1_id": pairing.bye, "player2_id": None, "result": "bye",
+            })
+    return build_players(participants, matches)
+
+
+@pytest.mark.parametrize("n", [2, 3, 4, 7, 8, 9, 16, 33, 64, 257])
+def test_rounds_are_perfect_matchings_without_rematches(n):
+    rounds = min(n - 1, 7) if n % 2 == 0 else min(n - 2, 7)
+    _simulate(n, max(rounds, 1), random.Random(n))
+
+
+def test_full_round_robin_with_four_players():
+    # 4 jugadores, 3 rondas: la única forma de no repetir es jugar contra todos
+    players = _simulate(4, 3, random.Random(1))
+    for player in players.values():
+        assert player.opponents == set(players) - {player.id}
+
+
+def test_rematch_avoided_inside_score_group():
+    # A y B ya jugaron y siguen empatados arriba: el fold natural (A-B) es revancha
+    players = [
+        SwissPlayer(id="A", points=3, seed=0, opponents={"B"}),
+        SwissPlayer(id="B", points=3, seed=1, opponents={"A"}),
+        SwissPlayer(id="C", points=0, seed=2, opponents={"D"}),
+        SwissPlayer(id="D", points=0, seed=3, opponents={"C"}),
+    ]
+    pairing = pair_round(players)
+    assert pairing.rematches == 0
+    assert {frozenset(p) for p in pairing.pairs} & {frozenset("AB"), frozenset("CD")} == set()
+
+
+def test_rematch_only_when_unavoidable():
+    players = [
+        SwissPlayer(id="A", opponents={"B"}),
+        SwissPlayer(id="B", opponents={"A"}),
+    ]
+    pairing = pair_round(players)
+    assert pairing.pairs == [("A", "B")]
+    assert pairing.rematches == 1
+
+
+def test_bye_goes_to_lowest_ranked_without_previous_bye():
+    participants = ["A", "B", "C"]
+    matches = [
+        {"round_number": 1, "player1_id": "A", "player2_id": "B", "result": "p1"},
+        {"round_number": 1, "player1_id": "C", "player2_id": None, "result": "bye"},
+    ]
+    players = build_players(participants, matches)
+    assert players["C"].points == BYE_POINTS and players["C"].had_bye
+    assert pair_round(players.values()).bye == "B"
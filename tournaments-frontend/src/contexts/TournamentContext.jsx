@@ -17,16 +17,20 @@ export const TournamentProvider = ({ children }) => {
     const [loading, setLoading] = useState(true);
     const [error, setError] = useState(null);
     const [featuredTournament, setFeaturedTournament] = useState(null);
+    const [nextCursor, setNextCursor] = useState(null);
+    const [loadingMore, setLoadingMore] = useState(false);
 
     const fetchTournaments = async () => {
         try {
             setLoading(true);
             setError(null);
 
-            const data = await tournamentAPI.getAll();
+            // Primera página; el resto se pide con loadMore()
+            const { items: data, nextCursor: cursor } = await tournamentAPI.getPage();
             console.log('Datos recibidos de API:', data);
 
             setTournaments(data);
+            setNextCursor(cursor);
 
             if (data.length > 0) {
                 const activeTournament = data.find(t =>
@@ -44,6 +48,21 @@ export const TournamentProvider = ({ children }) => {
         }
     };
 
+    const loadMore = async () => {
+        if (!nextCursor || loadingMore) return;
+        try {
+            setLoadingMore(true);
+            const { items, nextCursor: cursor } = await tournamentAPI.getPage({ cursor: nextCursor });
+            setTournaments(prev => [...prev, ...items]);
+            setNextCursor(cursor);
+        } catch (err) {
+            console.error('Error en loadMore:', err);
+            setError('Error al cargar más torneos. Por favor, intenta más tarde.');
+        } finally {
+            setLoadingMore(false);
+        }
+    };
+
     const getTournamentById = async (id) => {
         try {
             return await tournamentAPI.getById(id);
@@ -75,6 +94,9 @@ export const TournamentProvider = ({ children }) => {
         loading,
         error,
         refreshTournaments: fetchTournaments,
+        loadMore,
+        hasMore: Boolean(nextCursor),
+        loadingMore,
         getTournamentById,
         updateTournamentStatus,
         publishedTournaments: tournaments.filter(t => t.status === 'published'),
@@ -11,7 +11,10 @@ const Home = () => {
         error,
         publishedTournaments,
         ongoingTournaments,
-        activeTournaments
+        activeTournaments,
+        hasMore,
+        loadMore,
+        loadingMore
     } = useTournaments();
 
     if (loading) {
@@ -96,6 +99,17 @@ const Home = () => {
                         <TournamentCard key={tournament.id} tournament={tournament} />
                     ))}
                 </div>
+                {hasMore && (
+                    <div className="text-center mt-8">
+                        <button
+                            onClick={loadMore}
+                            disabled={loadingMore}
+                            className="px-4 py-2 bg-yellow-500 text-black rounded-lg hover:bg-yellow-600 disabled:opacity-50"
+                        >
+                            {loadingMore ? 'Cargando...' : 'Cargar más'}
+                        </button>
+                    </div>
+                )}
             </section>
         </div>
     );
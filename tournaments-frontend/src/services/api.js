@@ -96,23 +96,28 @@ api.interceptors.response.use(
 // -----------------------------
 // tournamentAPI
 // -----------------------------
+const normalizeTournament = (tournament) => ({
+    ...tournament,
+    images:
+        tournament.images && typeof tournament.images === "string"
+            ? (() => {
+                try {
+                    return JSON.parse(tournament.images);
+                } catch {
+                    return [];
+                }
+            })()
+            : tournament.images || [],
+});
+
 export const tournamentAPI = {
-    getAll: async () => {
-        const res = await api.get("/tournaments");
-        const data = res.data || [];
-        return data.map((tournament) => ({
-            ...tournament,
-            images:
-                tournament.images && typeof tournament.images === "string"
-                    ? (() => {
-                        try {
-                            return JSON.parse(tournament.images);
-                        } catch {
-                            return [];
-                        }
-                    })()
-                    : tournament.images || [],
-        }));
+    // Una página del listado: { items, nextCursor } (nextCursor = null si no hay más)
+    getPage: async (params = {}) => {
+        const res = await api.get("/tournaments", { params });
+        return {
+            items: (res.data?.items || []).map(normalizeTournament),
+            nextCursor: res.data?.next_cursor || null,
+        };
     },
 
     getById: async (id) => {